@@ -9,6 +9,9 @@ import numpy as np
 from src.calculator import QuadrantCalculator
 from src.classifier import QuadrantClassifier
 from src.visualizer import QuadrantVisualizer
+from src.panel import FinancialPanel
+from src.graph import ScoringGraph
+from src.cache import CachedVisualizer, ScoreCache
 
 # Page configuration
 st.set_page_config(
@@ -76,8 +79,15 @@ if 'calculator' not in st.session_state:
     st.session_state.calculator = QuadrantCalculator()
 if 'classifier' not in st.session_state:
     st.session_state.classifier = QuadrantClassifier()
+if 'scoring_graph' not in st.session_state:
+    st.session_state.scoring_graph = ScoringGraph(
+        st.session_state.calculator, st.session_state.classifier
+    )
 if 'visualizer' not in st.session_state:
-    st.session_state.visualizer = QuadrantVisualizer()
+    # Figures are served from cache on reruns with unchanged results
+    st.session_state.visualizer = CachedVisualizer(
+        QuadrantVisualizer(), ScoreCache(maxsize=64)
+    )
 if 'results' not in st.session_state:
     st.session_state.results = None
 
@@ -371,96 +381,31 @@ elif page == "📊 Analysis":
     if st.button("🔄 Calculate Scores", type="primary"):
         with st.spinner("Calculating scores..."):
             try:
-                # Calculate VC scores
-                calc = st.session_state.calculator
-                
-                roa_score = calc.calculate_roa_score(
-                    st.session_state.historical_data,
-                    st.session_state.projected_data
-                )
-                
-                ebit_margin_score = calc.calculate_ebit_margin_score(
-                    st.session_state.historical_data,
-                    st.session_state.projected_data
-                )
-                
-                sales_growth_score = calc.calculate_sales_growth_score(
-                    st.session_state.historical_data,
-                    st.session_state.projected_data,
-                    st.session_state.macro_data['nominal_gdp']
-                )
-                
-                profit_growth_score = calc.calculate_profit_growth_score(
-                    st.session_state.historical_data,
-                    st.session_state.projected_data,
-                    st.session_state.macro_data['real_gdp']
-                )
-                
-                vc_data = {
-                    'roa': roa_score,
-                    'ebit_margin': ebit_margin_score,
-                    'sales_growth': sales_growth_score,
-                    'profit_growth': profit_growth_score
-                }
-                
-                # Calculate FP scores
-                ocf_ebit_score = calc.calculate_ocf_ebit_score(
-                    st.session_state.historical_data,
-                    st.session_state.projected_data
-                )
-                
-                equity_asset_score = calc.calculate_equity_asset_score(
-                    st.session_state.historical_data,
-                    st.session_state.projected_data
-                )
-                
-                cash_asset_score = calc.calculate_cash_asset_score(
-                    st.session_state.historical_data,
-                    st.session_state.projected_data
-                )
-                
-                fp_data = {
-                    'ocf_ebit': ocf_ebit_score,
-                    'equity_asset': equity_asset_score,
-                    'cash_asset': cash_asset_score
+                company_info = st.session_state.company_info
+                record = {
+                    'company_info': company_info,
+                    'vcs_data': st.session_state.vcs_data,
+                    'historical_data': st.session_state.historical_data,
+                    'projected_data': st.session_state.projected_data,
+                    'valuation_data': st.session_state.valuation_data,
+                    'growth_data': st.session_state.growth_data,
+                    'macro_data': st.session_state.macro_data
                 }
+                panel = FinancialPanel.from_records([company_info['ticker']], [record])
                 
-                # Calculate Company Score
-                cs_result = calc.calculate_company_score(
-                    st.session_state.vcs_data,
-                    vc_data,
-                    fp_data
-                )
-                
-                # Calculate Stock Score
-                ss_result = calc.calculate_stock_score(
-                    st.session_state.valuation_data,
-                    st.session_state.growth_data
-                )
-                
-                # Classify
-                classifier = st.session_state.classifier
-                quadrant_info = classifier.classify(
-                    cs_result['company_score'],
-                    ss_result['stock_score']
-                )
-                
-                recommendation = classifier.get_investment_recommendation(
-                    quadrant_info,
-                    ss_result['blended_tp'],
-                    st.session_state.company_info['current_price']
-                )
+                # Only nodes downstream of changed inputs are recomputed
+                graph = st.session_state.scoring_graph
+                graph.update_from_panel(panel)
+                recomputed = graph.compute()
                 
                 # Store results
-                st.session_state.results = {
-                    'cs_result': cs_result,
-                    'ss_result': ss_result,
-                    'quadrant_info': quadrant_info,
-                    'recommendation': recommendation
-                }
+                st.session_state.results = graph.scalar_results(0)
                 
                 st.success("✅ Calculation completed! Go to **📈 Results** to view.")
-                
+                st.caption(
+                    "Recomputed: " + (", ".join(recomputed) if recomputed else "nothing (inputs unchanged)")
+                )
+            
             except Exception as e:
                 st.error(f"Error during calculation: {str(e)}")
                 st.error("Please make sure all data is filled in **📝 Input Data** page.")
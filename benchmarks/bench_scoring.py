@@ -0,0 +1,417 @@
+"""
+Scoring Benchmark
+Mengukur waktu, throughput dan peak memory jalur scoring utama per ukuran universe
+
+Usage:
+    python benchmarks/bench_scoring.py -o baseline.json
+    python benchmarks/bench_scoring.py --baseline baseline.json --threshold 0.25
+    python benchmarks/bench_scoring.py --sizes 1 100 --cases company_score classify
+    python benchmarks/bench_scoring.py --full
+
+Every case runs on a synthetic universe (fixed seed, the generator shared
+with the tests) at each size. After one untimed warmup call, wall time is
+the median of up to --repeat runs, throughput is tickers per second at that
+median and peak memory is measured in one extra run under tracemalloc.
+
+The per-ticker scalar cases and the xlsx export take minutes at 100k
+tickers; above --slow-max tickers they only run with --full.
+
+With --baseline, exits with status 1 when a case is slower (or needs more
+memory) than the baseline by more than --threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.calculator import QuadrantCalculator
+from src.classifier import QuadrantClassifier
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+from tests.synthetic import synthetic_panel
+
+SIZES = (1, 100, 10000, 100000)
+
+# Per-ticker Python loops (and the cell-by-cell xlsx writer): minutes at 100k
+SLOW_CASES = ('company_score', 'stock_score', 'vc_scorers', 'fp_scorers', 'classify',
+              'compare_stocks', 'compare_stocks_top10', 'export_xlsx')
+
+# ==================== CASES ====================
+# Each case takes a Fixture and returns the callable to time; any work done
+# before returning (building scalar inputs, temp paths) is not measured.
+
+class Fixture:
+    """Synthetic inputs shared by every case at one universe size"""
+    
+    def __init__(self, n, seed=0):
+        self.n = n
+        self.panel = synthetic_panel(n, seed)
+        self.calculator = QuadrantCalculator()
+        self.classifier = QuadrantClassifier()
+        self.pipeline = QuadrantPipeline(self.calculator, self.classifier)
+        self.results = self.pipeline.score(self.panel)
+        self.tmpdir = tempfile.mkdtemp(prefix='bench-')
+        self._records = None
+    
+    @property
+    def records(self):
+        """Per-ticker dict records for the scalar API (built lazily)"""
+        if self._records is None:
+            self._records = [self.panel.record(i) for i in range(self.n)]
+        return self._records
+    
+    def rows(self, columns):
+        """Per-ticker dicts of the given result columns"""
+        values = [self.results[column].tolist() for column in columns]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+    
+    def stocks_data(self):
+        """compare_stocks() input, as app.py builds it"""
+        return [
+            {'ticker': ticker, 'cs': cs, 'ss': ss,
+             'target_price': target_price, 'current_price': current_price}
+            for ticker, cs, ss, target_price, current_price in zip(
+                self.results['ticker'].tolist(),
+                self.results['company_score'].tolist(),
+                self.results['stock_score'].tolist(),
+                self.results['target_price'].tolist(),
+                self.results['current_price'].tolist()
+            )
+        ]
+    
+    def path(self, name):
+        return os.path.join(self.tmpdir, name)
+    
+    def close(self):
+        for name in os.listdir(self.tmpdir):
+            os.remove(os.path.join(self.tmpdir, name))
+        os.rmdir(self.tmpdir)
+
+
+def case_company_score(fx):
+    calc = fx.calculator
+    vcs = fx.rows(FinancialPanel.SECTIONS['vcs_data'])
+    vc = fx.rows(('roa', 'ebit_margin', 'sales_growth', 'profit_growth'))
+    fp = fx.rows(('ocf_ebit', 'equity_asset', 'cash_asset'))
+    
+    def run():
+        for vcs_data, vc_data, fp_data in zip(vcs, vc, fp):
+            calc.calculate_company_score(vcs_data, vc_data, fp_data)
+    return run
+
+
+def case_company_score_batch(fx):
+    calc, panel = fx.calculator, fx.panel
+    
+    def run():
+        calc.calculate_company_score_batch(
+            panel.section('vcs_data'),
+            calc.calculate_vc_scores_batch(panel),
+            calc.calculate_fp_scores_batch(panel)
+        )
+    return run
+
+
+def case_stock_score(fx):
+    calc = fx.calculator
+    inputs = [(record['valuation_data'], record['growth_data']) for record in fx.records]
+    
+    def run():
+        for valuation_data, growth_data in inputs:
+            calc.calculate_stock_score(valuation_data, growth_data)
+    return run
+
+
+def case_stock_score_batch(fx):
+    calc, panel = fx.calculator, fx.panel
+    
+    def run():
+        calc.calculate_stock_score_batch(
+            panel.section('valuation_data'), panel.section('growth_data')
+        )
+    return run
+
+
+def case_vc_scorers(fx):
+    calc = fx.calculator
+    inputs = [(record['historical_data'], record['projected_data'], record['macro_data'])
+              for record in fx.records]
+    
+    def run():
+        for hist, proj, macro in inputs:
+            calc.calculate_roa_score(hist, proj)
+            calc.calculate_ebit_margin_score(hist, proj)
+            calc.calculate_sales_growth_score(hist, proj, macro['nominal_gdp'])
+            calc.calculate_profit_growth_score(hist, proj, macro['real_gdp'])
+    return run
+
+
+def case_vc_scores_batch(fx):
+    calc, panel = fx.calculator, fx.panel
+    return lambda: calc.calculate_vc_scores_batch(panel)
+
+
+def case_fp_scorers(fx):
+    calc = fx.calculator
+    inputs = [(record['historical_data'], record['projected_data']) for record in fx.records]
+    
+    def run():
+        for hist, proj in inputs:
+            calc.calculate_ocf_ebit_score(hist, proj)
+            calc.calculate_equity_asset_score(hist, proj)
+            calc.calculate_cash_asset_score(hist, proj)
+    return run
+
+
+def case_fp_scores_batch(fx):
+    calc, panel = fx.calculator, fx.panel
+    return lambda: calc.calculate_fp_scores_batch(panel)
+
+
+def case_classify(fx):
+    classifier = fx.classifier
+    scores = list(zip(fx.results['company_score'].tolist(),
+                      fx.results['stock_score'].tolist()))
+    
+    def run():
+        for cs, ss in scores:
+            classifier.classify(cs, ss)
+    return run
+
+
+def case_classify_batch(fx):
+    classifier = fx.classifier
+    cs, ss = fx.results['company_score'], fx.results['stock_score']
+    return lambda: classifier.classify_batch(cs, ss)
+
+
+def case_compare_stocks(fx):
+    classifier = fx.classifier
+    stocks_data = fx.stocks_data()
+    return lambda: classifier.compare_stocks(stocks_data)
+
+
+def case_compare_stocks_top10(fx):
+    classifier = fx.classifier
+    stocks_data = fx.stocks_data()
+    return lambda: classifier.compare_stocks(stocks_data, top=10)
+
+
+def case_quadrant_matrix(fx):
+    from src.visualizer import QuadrantVisualizer
+    visualizer = QuadrantVisualizer()
+    matrix_data = fx.pipeline.matrix_data(fx.results)
+    return lambda: visualizer.create_quadrant_matrix(matrix_data)
+
+
+def case_pipeline(fx):
+    pipeline, panel = fx.pipeline, fx.panel
+    return lambda: pipeline.score(panel)
+
+
+def case_export_csv(fx):
+    from src.cli import write_results
+    pipeline, results, path = fx.pipeline, fx.results, fx.path('results.csv')
+    return lambda: write_results(pipeline.to_records(results), path)
+
+
+def case_export_parquet(fx):
+    from src.arrow_io import export_results
+    pipeline, results, path = fx.pipeline, fx.results, fx.path('results.parquet')
+    return lambda: export_results(results, path, pipeline)
+
+
+def case_export_xlsx(fx):
+    from src.excel_exporter import ExcelExporter
+    exporter = ExcelExporter(fx.classifier)
+    results, path = fx.results, fx.path('results.xlsx')
+    return lambda: exporter.export(results, path)
+
+
+CASES = {
+    'company_score': case_company_score,
+    'company_score_batch': case_company_score_batch,
+    'stock_score': case_stock_score,
+    'stock_score_batch': case_stock_score_batch,
+    'vc_scorers': case_vc_scorers,
+    'vc_scores_batch': case_vc_scores_batch,
+    'fp_scorers': case_fp_scorers,
+    'fp_scores_batch': case_fp_scores_batch,
+    'classify': case_classify,
+    'classify_batch': case_classify_batch,
+    'compare_stocks': case_compare_stocks,
+    'compare_stocks_top10': case_compare_stocks_top10,
+    'quadrant_matrix': case_quadrant_matrix,
+    'pipeline': case_pipeline,
+    'export_csv': case_export_csv,
+    'export_parquet': case_export_parquet,
+    'export_xlsx': case_export_xlsx
+}
+
+
+# ==================== MEASUREMENT ====================
+
+def measure(run, n, repeat=5, max_time=5.0, memory=True):
+    """
+    Time a callable and measure its peak traced memory
+    
+    Args:
+        run: zero-argument callable
+        n: tickers processed per call (for throughput)
+        repeat: maximum number of timed runs
+        max_time: stop repeating once this many seconds were spent
+            (warmup included; at least one timed run always happens)
+        memory: also run once under tracemalloc
+    
+    Returns:
+        dict with median/min seconds, runs, tickers_per_s and peak_bytes
+    """
+    samples = []
+    budget_start = time.perf_counter()
+    # Untimed warmup: lazy imports, first-call setup and page faults
+    run()
+    while len(samples) < repeat:
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+        if time.perf_counter() - budget_start > max_time:
+            break
+    
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    median = statistics.median(samples)
+    return {
+        'median_s': median,
+        'min_s': min(samples),
+        'runs': len(samples),
+        'tickers_per_s': n / median if median > 0 else None,
+        'peak_bytes': peak
+    }
+
+
+def compare(results, baseline, threshold, min_seconds=0.001):
+    """
+    Regressions of results against a baseline
+    
+    Args:
+        results: 'results' dict of this run
+        baseline: 'results' dict of the baseline run
+        threshold: allowed relative increase (0.25 = 25% slower / larger)
+        min_seconds: time changes of cases faster than this are ignored
+    
+    Returns:
+        list of (key, description) for every regressed case
+    """
+    regressions = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        
+        before, after = reference['median_s'], current['median_s']
+        if max(before, after) >= min_seconds and after > before * (1 + threshold):
+            regressions.append((key, f"time {before * 1000:.2f} -> {after * 1000:.2f} ms "
+                                     f"(+{(after / before - 1) * 100:.0f}%)"))
+        
+        before, after = reference.get('peak_bytes'), current.get('peak_bytes')
+        if before and after and after > before * (1 + threshold):
+            regressions.append((key, f"peak {before / 2**20:.2f} -> {after / 2**20:.2f} MiB "
+                                     f"(+{(after / before - 1) * 100:.0f}%)"))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES),
+                        help='universe sizes (default: 1 100 10000 100000)')
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), metavar='CASE',
+                        help=f"cases to run (default: all): {', '.join(CASES)}")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='maximum timed runs per case (default: 5)')
+    parser.add_argument('--max-time', type=float, default=5.0,
+                        help='stop repeating a case after this many seconds (default: 5)')
+    parser.add_argument('--slow-max', type=int, default=10000,
+                        help='largest size for the slow cases without --full (default: 10000)')
+    parser.add_argument('--full', action='store_true',
+                        help=f"run the slow cases at every size: {', '.join(SLOW_CASES)}")
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the tracemalloc run (faster)')
+    parser.add_argument('-o', '--output', help='write results as JSON')
+    parser.add_argument('--baseline', help='JSON from an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown / memory growth vs baseline (default: 0.25)')
+    parser.add_argument('--min-ms', type=float, default=1.0,
+                        help='ignore time changes of cases faster than this (default: 1)')
+    args = parser.parse_args(argv)
+    
+    cases = args.cases or list(CASES)
+    results = {}
+    
+    print(f"{'case':<24}{'tickers':>8}{'median ms':>12}{'tickers/s':>14}{'peak MiB':>10}")
+    for n in args.sizes:
+        fixture = Fixture(n)
+        try:
+            for name in cases:
+                if name in SLOW_CASES and n > args.slow_max and not args.full:
+                    continue
+                result = measure(CASES[name](fixture), n, args.repeat,
+                                 args.max_time, not args.no_memory)
+                results[f'{name}@{n}'] = result
+                
+                peak = result['peak_bytes']
+                rate = result['tickers_per_s']
+                print(f"{name:<24}{n:>8}{result['median_s'] * 1000:>12.3f}"
+                      f"{rate if rate is not None else float('inf'):>14,.0f}"
+                      f"{peak / 2**20 if peak is not None else float('nan'):>10.2f}")
+        finally:
+            fixture.close()
+    
+    report = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'repeat': args.repeat,
+            'full': args.full
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold, args.min_ms / 1000)
+        for key, description in regressions:
+            print(f"REGRESSION {key}: {description}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline} (threshold {args.threshold:.0%})")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Startup Benchmark
+Mengukur waktu import jalur scoring inti di interpreter baru
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --budget-ms 250
+
+Exits with status 1 when a core import pulls in a heavy module (plotly,
+pandas, streamlit, ...) or the median import time exceeds the budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports a batch worker needs; none of them may load a heavy module
+CORE_IMPORTS = {
+    'package': 'import src',
+    'calculator': 'from src import QuadrantCalculator, QuadrantClassifier',
+    'pipeline': 'from src.pipeline import QuadrantPipeline',
+    'parallel': 'from src.parallel import ParallelScorer',
+    'cli': 'import src.cli'
+}
+
+HEAVY_MODULES = ('plotly', 'pandas', 'streamlit', 'pyarrow', 'openpyxl', 'scipy')
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps({{'seconds': elapsed, 'heavy': heavy}}))
+"""
+
+
+def measure(statement, runs=10):
+    """
+    Import time of a statement in fresh interpreters
+    
+    Args:
+        statement: Python import statement
+        runs: number of fresh interpreters
+    
+    Returns:
+        dict with median/min seconds (import only, interpreter start excluded)
+        and the heavy modules that ended up loaded
+    """
+    samples, heavy = [], set()
+    code = PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=ROOT, check=True,
+            capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        samples.append(result['seconds'])
+        heavy.update(result['heavy'])
+    return {
+        'median_ms': statistics.median(samples) * 1000,
+        'min_ms': min(samples) * 1000,
+        'heavy': sorted(heavy)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=10,
+                        help='fresh interpreters per import (default: 10)')
+    parser.add_argument('--budget-ms', type=float, default=250.0,
+                        help='maximum median import time per entry (default: 250)')
+    args = parser.parse_args(argv)
+    
+    failed = False
+    for name, statement in CORE_IMPORTS.items():
+        result = measure(statement, args.runs)
+        problems = []
+        if result['heavy']:
+            problems.append(f"loads {', '.join(result['heavy'])}")
+        if result['median_ms'] > args.budget_ms:
+            problems.append(f"over {args.budget_ms:g} ms budget")
+        failed |= bool(problems)
+        
+        print(f"{name:<12} median {result['median_ms']:7.1f} ms  "
+              f"min {result['min_ms']:7.1f} ms  "
+              f"{'FAIL: ' + '; '.join(problems) if problems else 'ok'}")
+    
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
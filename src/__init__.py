@@ -2,8 +2,26 @@
 Quadrant Stock Analyzer - Source Modules
 """
 
-from .calculator import QuadrantCalculator
-from .classifier import QuadrantClassifier
-from .visualizer import QuadrantVisualizer
+# Public names are imported on first access (PEP 562), so `import src` or
+# `from src import QuadrantCalculator` never loads plotly or pandas
+_EXPORTS = {
+    'QuadrantCalculator': '.calculator',
+    'QuadrantClassifier': '.classifier',
+    'QuadrantVisualizer': '.visualizer',
+    'FinancialPanel': '.panel'
+}
 
-__all__ = ['QuadrantCalculator', 'QuadrantClassifier', 'QuadrantVisualizer']
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
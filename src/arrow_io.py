@@ -0,0 +1,137 @@
+"""
+Arrow I/O Module
+Export dan import hasil batch scoring ke Parquet / Arrow IPC (kolumnar)
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .classifier import QuadrantClassifier
+
+FORMAT_VERSION = 1
+
+# Columns holding int8 codes, stored as dictionary-encoded strings
+DICTIONARY_COLUMNS = {
+    'quadrant': 'QUADRANT_NAMES',
+    'strength': 'STRENGTH_NAMES',
+    'rating': 'RATING_NAMES'
+}
+
+
+def results_to_table(results, pipeline=None):
+    """
+    Convert batch results into a pyarrow Table without per-row conversion
+    
+    Code columns become dictionary arrays (int8 indices + name dictionary);
+    numeric columns are handed to Arrow as the NumPy buffers they already are.
+    
+    Args:
+        results: dict from QuadrantPipeline.score()
+        pipeline: QuadrantPipeline whose weights/threshold go into the metadata
+    
+    Returns:
+        pyarrow.Table
+    """
+    import pyarrow as pa
+    
+    classifier = pipeline.classifier if pipeline is not None else QuadrantClassifier()
+    columns = {}
+    for key, values in results.items():
+        if key in DICTIONARY_COLUMNS:
+            names = getattr(classifier, DICTIONARY_COLUMNS[key])
+            columns[key] = pa.DictionaryArray.from_arrays(
+                pa.array(values, type=pa.int8()), pa.array(names, type=pa.string())
+            )
+        elif values.dtype.kind == 'U':
+            columns[key] = pa.array(values.tolist(), type=pa.string())
+        else:
+            columns[key] = pa.array(values)
+    
+    metadata = {'version': FORMAT_VERSION, 'risk_factors': list(classifier.RISK_FACTORS)}
+    if pipeline is not None:
+        metadata.update({
+            'cs_weights': pipeline.calculator.cs_weights,
+            'ss_weights': pipeline.calculator.ss_weights,
+            'threshold': classifier.threshold
+        })
+    return pa.table(columns).replace_schema_metadata(
+        {'quadrant_results': json.dumps(metadata)}
+    )
+
+
+def table_to_results(table):
+    """
+    Convert a table written by results_to_table() back into result arrays
+    
+    Dictionary columns are mapped by name onto the current classifier codes,
+    so a file stays readable even if the name tuples are reordered.
+    
+    Returns:
+        dict of numpy arrays with the layout of QuadrantPipeline.score()
+    """
+    import pyarrow as pa
+    
+    results = {}
+    for name in table.column_names:
+        column = table.column(name).combine_chunks()
+        if pa.types.is_dictionary(column.type):
+            names = getattr(QuadrantClassifier, DICTIONARY_COLUMNS[name])
+            lookup = np.array([names.index(value) for value in column.dictionary.to_pylist()],
+                              dtype=np.int8)
+            results[name] = lookup[column.indices.to_numpy()]
+        elif pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            results[name] = np.asarray(column.to_pylist(), dtype=str)
+        else:
+            results[name] = column.to_numpy(zero_copy_only=False)
+    return results
+
+
+def export_results(results, path, pipeline=None):
+    """
+    Write batch results to Parquet (.parquet/.pq) or Arrow IPC (.arrow/.feather)
+    
+    Args:
+        results: dict from QuadrantPipeline.score()
+        path: output path, format by extension
+        pipeline: QuadrantPipeline whose settings go into the file metadata
+    """
+    table = results_to_table(results, pipeline)
+    extension = os.path.splitext(path)[1].lower()
+    
+    if extension in ('.parquet', '.pq'):
+        import pyarrow.parquet as pq
+        pq.write_table(table, path)
+    elif extension in ('.arrow', '.feather', '.ipc'):
+        import pyarrow.feather as feather
+        feather.write_feather(table, path)
+    else:
+        raise ValueError(f"Unsupported columnar format: {extension}")
+
+
+def load_results(path):
+    """
+    Load results saved by export_results()
+    
+    Args:
+        path: .parquet/.pq or .arrow/.feather file
+    
+    Returns:
+        (results, metadata): result arrays as from QuadrantPipeline.score(),
+        ready for QuadrantPipeline.matrix_data() / comparison_data(), and the
+        run metadata (weights, threshold, risk factor names)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.parquet', '.pq'):
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+    elif extension in ('.arrow', '.feather', '.ipc'):
+        import pyarrow.feather as feather
+        table = feather.read_table(path)
+    else:
+        raise ValueError(f"Unsupported columnar format: {extension}")
+    
+    raw = (table.schema.metadata or {}).get(b'quadrant_results')
+    metadata = json.loads(raw) if raw else {}
+    return table_to_results(table), metadata
@@ -0,0 +1,281 @@
+"""
+Backtest Module
+Backtest strategi quadrant atas fundamental point-in-time dan histori harga lokal
+"""
+
+import re
+import time
+
+import numpy as np
+
+from .panel import FinancialPanel
+from .pipeline import QuadrantPipeline
+
+
+class PriceStore:
+    """Histori harga kolumnar: matriks (tanggal x ticker) harga penutupan"""
+    
+    def __init__(self, dates, tickers, prices):
+        """
+        Args:
+            dates: ascending dates (D,), anything np.datetime64 accepts
+            tickers: ticker symbols (T,)
+            prices: array (D, T) of close prices, NaN where unavailable
+        """
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.tickers = np.asarray(tickers, dtype=str)
+        self.prices = np.ascontiguousarray(prices, dtype=np.float64)
+        
+        if self.prices.shape != (len(self.dates), len(self.tickers)):
+            raise ValueError(
+                f"prices must have shape ({len(self.dates)}, {len(self.tickers)}), "
+                f"got {self.prices.shape}"
+            )
+        if len(self.dates) > 1 and (np.diff(self.dates) <= np.timedelta64(0, 'D')).any():
+            raise ValueError("dates must be strictly ascending")
+        
+        self._order = np.argsort(self.tickers)
+        self._sorted = self.tickers[self._order]
+    
+    @classmethod
+    def from_frame(cls, frame, date='date', ticker='ticker', price='close'):
+        """Build from a long DataFrame with one row per (date, ticker)"""
+        wide = frame.pivot(index=date, columns=ticker, values=price).sort_index()
+        return cls(
+            wide.index.to_numpy(dtype='datetime64[D]'),
+            wide.columns.to_numpy(dtype=str),
+            wide.to_numpy(dtype=np.float64)
+        )
+    
+    @classmethod
+    def from_csv(cls, path, **columns):
+        """Load a long CSV (date, ticker, close), see from_frame()"""
+        import pandas as pd
+        return cls.from_frame(pd.read_csv(path), **columns)
+    
+    def ticker_index(self, tickers):
+        """Column positions of tickers, -1 where unknown"""
+        tickers = np.asarray(tickers, dtype=str)
+        if not len(self._sorted):
+            return np.full(len(tickers), -1)
+        pos = np.searchsorted(self._sorted, tickers).clip(max=len(self._sorted) - 1)
+        found = self._sorted[pos] == tickers
+        return np.where(found, self._order[pos], -1)
+    
+    def price_at(self, date, tickers):
+        """
+        As-of close prices (last available date <= date)
+        
+        Args:
+            date: one date
+            tickers: ticker symbols
+        
+        Returns:
+            float array, NaN for unknown tickers or dates before the history
+        """
+        row = np.searchsorted(self.dates, np.datetime64(date, 'D'), side='right') - 1
+        columns = self.ticker_index(tickers)
+        prices = np.full(len(columns), np.nan)
+        if row >= 0:
+            known = columns >= 0
+            prices[known] = self.prices[row, columns[known]]
+        return prices
+
+
+POSITION_SIZE = re.compile(r'\s*(\d+(?:\.\d+)?)\s*(?:-\s*(\d+(?:\.\d+)?)\s*)?%\s*')
+
+
+def parse_position_size(size):
+    """
+    Midpoint of a position sizing string, e.g. '5-8%' -> 0.065, '0%' -> 0.0
+    
+    Raises:
+        ValueError: if size is not a percentage or an ascending percentage range
+    """
+    match = POSITION_SIZE.fullmatch(size) if isinstance(size, str) else None
+    if match is None:
+        raise ValueError(f"Invalid position size: {size!r}")
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) is not None else low
+    if high < low:
+        raise ValueError(f"Invalid position size: {size!r}")
+    return (low + high) / 2 / 100
+
+
+class QuadrantBacktester:
+    """Replay QuadrantCalculator + QuadrantClassifier periode demi periode"""
+    
+    def __init__(self, pipeline=None, max_gross=1.0):
+        """
+        Args:
+            pipeline: QuadrantPipeline (default: default weights, threshold 3.0)
+            max_gross: cap on the sum of portfolio weights per period
+        """
+        self.pipeline = pipeline or QuadrantPipeline()
+        self.max_gross = max_gross
+        
+        classifier = self.pipeline.classifier
+        # (quadrant code, strength code) -> target weight from _get_position_sizing
+        self.position_sizes = np.array([
+            [parse_position_size(classifier._get_position_sizing(quadrant, strength))
+             for strength in classifier.STRENGTH_NAMES]
+            for quadrant in classifier.QUADRANT_NAMES
+        ])
+    
+    def run(self, snapshots, prices):
+        """
+        Backtest over point-in-time snapshots
+        
+        Each snapshot is scored with the as-of price on its date (valuation
+        and recommendation price), held until the next snapshot date, and
+        evaluated on the realized forward return. All periods are stacked
+        and scored in a single vectorized pipeline call.
+        
+        Args:
+            snapshots: list of (date, FinancialPanel), ascending by date; each
+                       panel holds only data known at that date
+            prices: PriceStore
+        
+        Returns:
+            dict with per-period and aggregate returns by quadrant, by rating
+            and for the position-sized portfolio
+        """
+        start = time.perf_counter()
+        if len(snapshots) < 2:
+            raise ValueError("Need at least two snapshots to measure forward returns")
+        
+        dates = np.array([date for date, _ in snapshots], dtype='datetime64[D]')
+        panels = [panel for _, panel in snapshots]
+        sizes = np.array([len(panel) for panel in panels])
+        period = np.repeat(np.arange(len(panels)), sizes)
+        
+        stacked = self._stack(panels)
+        tickers = stacked.tickers
+        
+        # Point-in-time prices at each rebalance date and the next one
+        entry = np.empty(len(tickers))
+        exit_ = np.full(len(tickers), np.nan)
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        for p in range(len(panels)):
+            rows = slice(offsets[p], offsets[p + 1])
+            entry[rows] = prices.price_at(dates[p], tickers[rows])
+            if p + 1 < len(panels):
+                exit_[rows] = prices.price_at(dates[p + 1], tickers[rows])
+        
+        valid_price = np.isfinite(entry) & (entry > 0)
+        stacked.sections['valuation_data']['current_price'] = np.where(
+            valid_price, entry, stacked.sections['valuation_data']['current_price']
+        )
+        stacked.info['current_price'] = stacked.sections['valuation_data']['current_price']
+        
+        results = self.pipeline.score(stacked)
+        forward = exit_ / entry - 1
+        usable = valid_price & np.isfinite(forward) & (period < len(panels) - 1)
+        
+        classifier = self.pipeline.classifier
+        n_periods = len(panels) - 1
+        quadrant_returns, quadrant_counts = self._group_means(
+            period, results['quadrant'], forward, usable, n_periods, len(classifier.QUADRANT_NAMES)
+        )
+        rating_returns, rating_counts = self._group_means(
+            period, results['rating'], forward, usable, n_periods, len(classifier.RATING_NAMES)
+        )
+        portfolio_returns, gross = self._portfolio(period, results, forward, usable, n_periods)
+        
+        return {
+            'dates': dates[:-1],
+            'quadrant_returns': quadrant_returns,
+            'quadrant_counts': quadrant_counts,
+            'rating_returns': rating_returns,
+            'rating_counts': rating_counts,
+            'portfolio_returns': portfolio_returns,
+            'portfolio_gross': gross,
+            'portfolio_cumulative': np.cumprod(1 + portfolio_returns) - 1,
+            'summary': {
+                'quadrant': self._summary(results['quadrant'], forward, usable,
+                                          classifier.QUADRANT_NAMES),
+                'rating': self._summary(results['rating'], forward, usable,
+                                        classifier.RATING_NAMES)
+            },
+            'results': results,
+            'forward_return': forward,
+            'period': period,
+            'elapsed': time.perf_counter() - start
+        }
+    
+    # ==================== INTERNALS ====================
+    
+    def _stack(self, panels):
+        """Concatenate snapshot panels row-wise into one panel"""
+        first = panels[0]
+        return FinancialPanel(
+            np.concatenate([panel.tickers for panel in panels]),
+            np.concatenate([panel.historical for panel in panels]),
+            np.concatenate([panel.projected for panel in panels]),
+            historical_years=np.concatenate([panel.historical_years for panel in panels]),
+            projected_years=np.concatenate([panel.projected_years for panel in panels]),
+            sections={
+                section: {
+                    field: np.concatenate([panel.sections[section][field] for panel in panels])
+                    for field in fields
+                }
+                for section, fields in first.sections.items()
+            },
+            info={
+                field: np.concatenate([panel.info[field] for panel in panels])
+                for field in first.info
+            }
+        )
+    
+    def _group_means(self, period, codes, forward, usable, n_periods, n_groups):
+        """Mean forward return per (period, group), NaN for empty groups"""
+        key = period[usable] * n_groups + codes[usable]
+        size = n_periods * n_groups
+        total = np.bincount(key, weights=forward[usable], minlength=size)
+        count = np.bincount(key, minlength=size)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = total / count
+        return means.reshape(n_periods, n_groups), count.reshape(n_periods, n_groups)
+    
+    def _summary(self, codes, forward, usable, names):
+        summary = {}
+        for code, name in enumerate(names):
+            returns = forward[usable & (codes == code)]
+            summary[name] = {
+                'observations': int(len(returns)),
+                'mean_return': float(returns.mean()) if len(returns) else float('nan'),
+                'median_return': float(np.median(returns)) if len(returns) else float('nan'),
+                'hit_rate': float((returns > 0).mean()) if len(returns) else float('nan')
+            }
+        return summary
+    
+    def _portfolio(self, period, results, forward, usable, n_periods):
+        """
+        Position-sized portfolio per period
+        
+        Stocks are taken in compare_stocks() order (priority, then highest
+        upside) and given their _get_position_sizing() midpoint until the
+        gross exposure cap is reached; the rest stays in cash.
+        """
+        target = self.position_sizes[results['quadrant'], results['strength']]
+        target = np.where(usable, target, 0.0)
+        
+        # Rank within period like compare_stocks: period, priority, -upside
+        order = np.lexsort((-results['recommendation_upside'], results['priority'], period))
+        ranked_period = period[order]
+        ranked_target = target[order]
+        
+        # Cumulative exposure within each period, capped at max_gross
+        cumulative = np.cumsum(ranked_target)
+        starts = np.searchsorted(ranked_period, np.arange(n_periods + 1))
+        before = np.concatenate([[0.0], cumulative])[starts[ranked_period]]
+        within = cumulative - before
+        weight = np.clip(self.max_gross - (within - ranked_target), 0, ranked_target)
+        
+        weights = np.empty_like(weight)
+        weights[order] = weight
+        
+        contribution = np.where(usable, weights * np.nan_to_num(forward), 0.0)
+        returns = np.bincount(period, weights=contribution, minlength=n_periods + 1)[:n_periods]
+        gross = np.bincount(period, weights=weights, minlength=n_periods + 1)[:n_periods]
+        return returns, gross
@@ -0,0 +1,314 @@
+"""
+Cache Module
+Cache hasil scoring berbasis hash konten dengan LRU eviction
+"""
+
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+
+def stable_hash(payload):
+    """
+    Stable SHA-256 hex digest of a JSON-like payload
+    
+    Dict keys are sorted, NumPy scalars/arrays are converted to plain Python
+    values and every number is hashed as a float (so 3 and 3.0 share a key),
+    so equal inputs hash the same across processes and runs.
+    """
+    encoded = json.dumps(_normalize(payload), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _normalize(value):
+    """Recursively convert a payload to JSON values with numbers as floats"""
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _normalize(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    raise TypeError(f"Cannot hash value of type {type(value).__name__}")
+
+
+def _json_default(value):
+    """json.dumps fallback for NumPy scalars/arrays inside cached values"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Cannot store value of type {type(value).__name__}")
+
+
+class ScoreCache:
+    """
+    LRU cache untuk hasil calculator/classifier, opsional tersimpan di disk
+    
+    The bound is an entry count, not a memory size: calculator/classifier
+    results are small dicts of similar size, while cached figures (see
+    CachedVisualizer) can be much larger, so size maxsize for the biggest
+    values you cache.
+    """
+    
+    def __init__(self, maxsize=10000, path=None):
+        """
+        Initialize cache
+        
+        Args:
+            maxsize: maximum number of entries kept, regardless of their size
+                (least recently used are evicted)
+            path: optional JSON file; loaded now if it exists, written by save()
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.entries = OrderedDict()   # key -> (namespace, config, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        if path and os.path.exists(path):
+            self.load(path)
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __contains__(self, key):
+        return key in self.entries
+    
+    def make_key(self, namespace, config, inputs):
+        """
+        Build a content-addressed key
+        
+        Args:
+            namespace: method name, e.g. 'company_score'
+            config: fingerprint of the active weights/threshold
+            inputs: JSON-like method inputs
+        """
+        return stable_hash([namespace, config, inputs])
+    
+    def get(self, key, default=None):
+        """Return cached value (and mark it recently used), or default"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+    
+    def put(self, key, value, namespace=None, config=None):
+        """Store a value, evicting least recently used entries beyond maxsize"""
+        self.entries[key] = (namespace, config, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, namespace, keep_config=None):
+        """
+        Drop entries of one namespace
+        
+        Args:
+            namespace: namespace to clear
+            keep_config: if given, entries computed under this config are kept
+        
+        Returns:
+            number of entries removed
+        """
+        stale = [
+            key for key, (entry_namespace, config, _) in self.entries.items()
+            if entry_namespace == namespace and config != keep_config
+        ]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+    
+    def clear(self):
+        """Remove every entry and reset counters"""
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+    
+    def stats(self):
+        """Return hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'size': len(self.entries),
+            'maxsize': self.maxsize
+        }
+    
+    # ==================== PERSISTENCE ====================
+    
+    def save(self, path=None):
+        """
+        Write entries to disk as JSON (atomic replace)
+        
+        JSON rather than pickle, so loading a cache file never executes
+        code; tuples in cached values come back as lists.
+        """
+        path = path or self.path
+        if not path:
+            raise ValueError("No cache path configured")
+        payload = {
+            'version': 1,
+            'entries': [
+                [key, namespace, config, value]
+                for key, (namespace, config, value) in self.entries.items()
+            ]
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, default=_json_default)
+        os.replace(tmp_path, path)
+    
+    def load(self, path=None):
+        """Load entries from disk, keeping at most maxsize most recent"""
+        path = path or self.path
+        with open(path, encoding='utf-8') as f:
+            payload = json.load(f)
+        if not isinstance(payload, dict) or payload.get('version') != 1:
+            raise ValueError(f"Unsupported cache file: {path}")
+        items = [
+            (key, (namespace, config, value))
+            for key, namespace, config, value in payload['entries']
+        ]
+        self.entries = OrderedDict(items[-self.maxsize:] if self.maxsize else [])
+
+
+class _CachedProxy:
+    """Base proxy: cached methods go through ScoreCache, the rest pass through"""
+    
+    def __init__(self, target, cache=None):
+        self.target = target
+        self.cache = cache if cache is not None else ScoreCache()
+        self._configs = {}
+    
+    def __getattr__(self, name):
+        target = self.__dict__.get('target')
+        if target is None:
+            raise AttributeError(name)
+        return getattr(target, name)
+    
+    def _config(self, namespace, settings):
+        """Fingerprint current settings; drop entries made under older ones"""
+        config = stable_hash(settings)
+        if self._configs.get(namespace, config) != config:
+            self.cache.invalidate(namespace, keep_config=config)
+        self._configs[namespace] = config
+        return config
+    
+    def _cached(self, namespace, settings, inputs, compute):
+        config = self._config(namespace, settings)
+        key = self.cache.make_key(namespace, config, inputs)
+        result = self.cache.get(key)
+        if result is None:
+            result = compute()
+            self.cache.put(key, result, namespace, config)
+        # Callers may mutate the returned dict; keep the cached copy pristine
+        return copy.deepcopy(result)
+
+
+class CachedCalculator(_CachedProxy):
+    """
+    QuadrantCalculator dengan cache di depan calculate_company_score dan
+    calculate_stock_score
+    
+    Keys include the active cs_weights / ss_weights, so changing a weight
+    never serves a stale result; entries of the changed namespace computed
+    under the old weights are dropped on the next call.
+    """
+    
+    def calculate_company_score(self, vcs_data, vc_data, fp_data):
+        """Cached QuadrantCalculator.calculate_company_score()"""
+        return self._cached(
+            'company_score', self.target.cs_weights,
+            [vcs_data, vc_data, fp_data],
+            lambda: self.target.calculate_company_score(vcs_data, vc_data, fp_data)
+        )
+    
+    def calculate_stock_score(self, valuation_data, growth_data):
+        """Cached QuadrantCalculator.calculate_stock_score()"""
+        return self._cached(
+            'stock_score', self.target.ss_weights,
+            [valuation_data, growth_data],
+            lambda: self.target.calculate_stock_score(valuation_data, growth_data)
+        )
+
+
+class CachedClassifier(_CachedProxy):
+    """QuadrantClassifier dengan cache di depan classify(), key termasuk threshold"""
+    
+    def classify(self, company_score, stock_score):
+        """Cached QuadrantClassifier.classify()"""
+        return self._cached(
+            'classify', {'threshold': self.target.threshold},
+            [company_score, stock_score],
+            lambda: self.target.classify(company_score, stock_score)
+        )
+
+
+class CachedVisualizer(_CachedProxy):
+    """
+    QuadrantVisualizer dengan cache figure: figure disimpan sebagai JSON dan
+    dibangun ulang tanpa validasi saat input yang sama diminta lagi
+    
+    Keys cover the method inputs plus the visualizer's colors and render
+    thresholds, so a Streamlit rerun with unchanged results skips building
+    the figure entirely.
+    """
+    
+    def _settings(self):
+        target = self.target
+        return {
+            'colors': target.colors,
+            'webgl_threshold': target.webgl_threshold,
+            'density_threshold': target.density_threshold,
+            'density_bins': target.density_bins
+        }
+    
+    def _figure(self, namespace, inputs, compute):
+        figure_json = self._cached(
+            namespace, self._settings(), inputs, lambda: compute().to_json()
+        )
+        return self.target.figure_from_json(figure_json)
+    
+    def create_quadrant_matrix(self, stocks_data, threshold=3.0, render_mode='auto'):
+        """Cached QuadrantVisualizer.create_quadrant_matrix()"""
+        return self._figure(
+            'quadrant_matrix', [stocks_data, threshold, render_mode],
+            lambda: self.target.create_quadrant_matrix(stocks_data, threshold, render_mode)
+        )
+    
+    def create_score_breakdown(self, cs_result, ss_result):
+        """Cached QuadrantVisualizer.create_score_breakdown()"""
+        return self._figure(
+            'score_breakdown', [cs_result, ss_result],
+            lambda: self.target.create_score_breakdown(cs_result, ss_result)
+        )
+    
+    def create_component_radar(self, vcs_data, vc_data, fp_data):
+        """Cached QuadrantVisualizer.create_component_radar()"""
+        return self._figure(
+            'component_radar', [vcs_data, vc_data, fp_data],
+            lambda: self.target.create_component_radar(vcs_data, vc_data, fp_data)
+        )
+    
+    def create_comparison_chart(self, stocks_comparison):
+        """Cached QuadrantVisualizer.create_comparison_chart()"""
+        return self._figure(
+            'comparison_chart', [stocks_comparison],
+            lambda: self.target.create_comparison_chart(stocks_comparison)
+        )
@@ -3,9 +3,17 @@ Score Calculator Module
 Menghitung Company Score dan Stock Score berdasarkan metodologi Quadrant
 """
 
-import pandas as pd
 import numpy as np
 
+from .kernels import (
+    DISCREPANCY_BREAKPOINTS,
+    GDP_BREAKPOINTS,
+    UPSIDE_BREAKPOINTS,
+    GROWTH_BREAKPOINTS,
+    score_by_breakpoints,
+    round_like_python
+)
+
 class QuadrantCalculator:
     """Calculator untuk Company Score dan Stock Score"""
     
@@ -80,6 +88,62 @@ class QuadrantCalculator:
             }
         }
     
+    def calculate_company_score_batch(self, vcs_data, vc_data, fp_data):
+        """
+        Calculate Company Score (CS) untuk banyak saham sekaligus
+        
+        Columnar counterpart of calculate_company_score(): each component is
+        an array with one value per ticker, so a whole universe is scored in
+        one vectorized pass. Every element matches the scalar result exactly.
+        
+        Args:
+            vcs_data: dict/DataFrame with columns [lifecycle, porter, management, esg]
+            vc_data: dict/DataFrame with columns [roa, ebit_margin, sales_growth, profit_growth]
+            fp_data: dict/DataFrame with columns [ocf_ebit, equity_asset, cash_asset]
+        
+        Returns:
+            dict of numpy arrays with the same keys as calculate_company_score()
+        """
+        vcs_keys = ['lifecycle', 'porter', 'management', 'esg']
+        vc_keys = ['roa', 'ebit_margin', 'sales_growth', 'profit_growth']
+        fp_keys = ['ocf_ebit', 'equity_asset', 'cash_asset']
+        
+        vcs = self._stack_columns(vcs_data, vcs_keys)
+        vc = self._stack_columns(vc_data, vc_keys)
+        fp = self._stack_columns(fp_data, fp_keys)
+        
+        # Row means over (N, k) blocks, same summation order as np.mean(list)
+        vcs_score = vcs.mean(axis=1)
+        vc_score = vc.mean(axis=1)
+        fp_score = fp.mean(axis=1)
+        
+        vcs_weighted = vcs_score * self.cs_weights['vcs']
+        vc_weighted = vc_score * self.cs_weights['vc']
+        fp_weighted = fp_score * self.cs_weights['fp']
+        company_score = vcs_weighted + vc_weighted + fp_weighted
+        
+        return {
+            'company_score': np.round(company_score, 2),
+            'vcs_score': np.round(vcs_score, 2),
+            'vc_score': np.round(vc_score, 2),
+            'fp_score': np.round(fp_score, 2),
+            'vcs_weighted': np.round(vcs_weighted, 2),
+            'vc_weighted': np.round(vc_weighted, 2),
+            'fp_weighted': np.round(fp_weighted, 2),
+            'breakdown': {
+                'vcs': dict(zip(vcs_keys, vcs.T)),
+                'vc': dict(zip(vc_keys, vc.T)),
+                'fp': dict(zip(fp_keys, fp.T))
+            }
+        }
+    
+    def _stack_columns(self, data, keys):
+        """Stack columns of a dict/DataFrame into a contiguous (N, k) float array"""
+        return np.column_stack([
+            np.atleast_1d(np.asarray(data[key], dtype=np.float64))
+            for key in keys
+        ])
+    
     # ==================== VCS SCORING ====================
     
     def calculate_esg_score(self, environment, social, governance):
@@ -132,6 +196,24 @@ class QuadrantCalculator:
             else:
                 return 1
     
+    def score_discrepancy_batch(self, future_avg, historical_avg, metric_type='ratio'):
+        """
+        Array version of score_discrepancy() using sorted breakpoint tables
+        
+        Args:
+            future_avg: array of 3-year future averages
+            historical_avg: array of 2-year historical averages
+            metric_type: 'ratio' or 'growth'
+        
+        Returns:
+            int8 array of scores (1-4)
+        """
+        if metric_type not in DISCREPANCY_BREAKPOINTS:
+            raise ValueError(f"metric_type must be 'ratio' or 'growth', got {metric_type!r}")
+        
+        disc_bps = (np.asarray(future_avg) - np.asarray(historical_avg)) * 100
+        return score_by_breakpoints(disc_bps, DISCREPANCY_BREAKPOINTS[metric_type])
+    
     def score_vs_gdp(self, company_growth, gdp_growth):
         """
         Score growth vs GDP
@@ -150,6 +232,16 @@ class QuadrantCalculator:
         else:
             return 1
     
+    def score_vs_gdp_batch(self, company_growth, gdp_growth):
+        """
+        Array version of score_vs_gdp()
+        
+        Returns:
+            int8 array of scores (1-4)
+        """
+        diff_bps = (np.asarray(company_growth) - np.asarray(gdp_growth)) * 100
+        return score_by_breakpoints(diff_bps, GDP_BREAKPOINTS)
+    
     def calculate_roa_score(self, historical_data, projected_data):
         """Calculate ROA score"""
         # Calculate ROA for each year
@@ -279,6 +371,69 @@ class QuadrantCalculator:
         
         return self.score_discrepancy(proj_avg, hist_avg, 'ratio')
     
+    # ==================== PANEL (BATCH) VC & FP SCORING ====================
+    
+    def calculate_vc_scores_batch(self, panel, nominal_gdp=None, real_gdp=None):
+        """
+        Calculate all VC component scores for every ticker in a FinancialPanel
+        
+        Args:
+            panel: FinancialPanel
+            nominal_gdp: scalar or array (N,), default panel macro_data
+            real_gdp: scalar or array (N,), default panel macro_data
+        
+        Returns:
+            dict of arrays with keys [roa, ebit_margin, sales_growth, profit_growth],
+            ready to be passed as vc_data to calculate_company_score_batch()
+        """
+        if nominal_gdp is None:
+            nominal_gdp = panel.section('macro_data')['nominal_gdp']
+        if real_gdp is None:
+            real_gdp = panel.section('macro_data')['real_gdp']
+        
+        names = ['roa', 'ebit_margin']
+        hist = panel.ratio_averages('historical', names)
+        proj = panel.ratio_averages('projected', names)
+        
+        return {
+            'roa': self.score_discrepancy_batch(proj['roa'], hist['roa'], 'ratio'),
+            'ebit_margin': self.score_discrepancy_batch(
+                proj['ebit_margin'], hist['ebit_margin'], 'growth'
+            ),
+            'sales_growth': self._growth_component_scores(panel, 'revenue', nominal_gdp),
+            'profit_growth': self._growth_component_scores(panel, 'net_income', real_gdp)
+        }
+    
+    def calculate_fp_scores_batch(self, panel):
+        """
+        Calculate all FP component scores for every ticker in a FinancialPanel
+        
+        Args:
+            panel: FinancialPanel
+        
+        Returns:
+            dict of arrays with keys [ocf_ebit, equity_asset, cash_asset],
+            ready to be passed as fp_data to calculate_company_score_batch()
+        """
+        names = ['ocf_ebit', 'equity_asset', 'cash_asset']
+        hist = panel.ratio_averages('historical', names)
+        proj = panel.ratio_averages('projected', names)
+        
+        return {
+            name: self.score_discrepancy_batch(proj[name], hist[name], 'ratio')
+            for name in names
+        }
+    
+    def _growth_component_scores(self, panel, metric, gdp_growth):
+        """Sales/Profit Growth score: mean of vs-GDP and acceleration scores"""
+        proj_avg = panel.growth(metric, 'projected').mean(axis=1)
+        hist_avg = panel.growth(metric, 'historical').mean(axis=1)
+        
+        score_gdp = self.score_vs_gdp_batch(proj_avg, gdp_growth)
+        score_accel = self.score_discrepancy_batch(proj_avg, hist_avg, 'growth')
+        
+        return (score_gdp + score_accel) / 2
+    
     # ==================== STOCK SCORE CALCULATION ====================
     
     def calculate_stock_score(self, valuation_data, growth_data):
@@ -326,6 +481,59 @@ class QuadrantCalculator:
             }
         }
     
+    def calculate_stock_score_batch(self, valuation_data, growth_data):
+        """
+        Calculate Stock Score (SS) untuk banyak saham sekaligus
+        
+        Args:
+            valuation_data: dict/DataFrame with columns [model_tp, relative_val, current_price]
+            growth_data: dict/DataFrame with columns [revenue_growth, ebit_growth, np_growth]
+        
+        Returns:
+            dict of numpy arrays with the same keys as calculate_stock_score()
+        """
+        valuation_score = self.calculate_valuation_score_batch(
+            valuation_data['model_tp'],
+            valuation_data['relative_val'],
+            valuation_data['current_price']
+        )
+        
+        growth_score = self.calculate_growth_score_batch(
+            growth_data['revenue_growth'],
+            growth_data['ebit_growth'],
+            growth_data['np_growth']
+        )
+        
+        return self.combine_stock_score_batch(valuation_score, growth_score)
+    
+    def combine_stock_score_batch(self, valuation_score, growth_score):
+        """
+        Weight batch valuation and growth results into the Stock Score
+        
+        Args:
+            valuation_score: dict from calculate_valuation_score_batch()
+            growth_score: dict from calculate_growth_score_batch()
+        
+        Returns:
+            dict of numpy arrays with the same keys as calculate_stock_score()
+        """
+        valuation_weighted = valuation_score['score'] * self.ss_weights['valuation']
+        growth_weighted = growth_score['score'] * self.ss_weights['growth']
+        
+        return {
+            'stock_score': np.round(valuation_weighted + growth_weighted, 2),
+            'valuation_score': valuation_score['score'],
+            'growth_score': growth_score['score'],
+            'valuation_weighted': round_like_python(valuation_weighted),
+            'growth_weighted': np.round(growth_weighted, 2),
+            'blended_tp': valuation_score['blended_tp'],
+            'upside': valuation_score['upside'],
+            'breakdown': {
+                'valuation': valuation_score,
+                'growth': growth_score
+            }
+        }
+    
     def calculate_valuation_score(self, model_tp, relative_val, current_price):
         """Calculate Valuation Score"""
         # Blended Target Price (50% model, 50% relative)
@@ -353,6 +561,24 @@ class QuadrantCalculator:
             'current_price': current_price
         }
     
+    def calculate_valuation_score_batch(self, model_tp, relative_val, current_price):
+        """Array version of calculate_valuation_score()"""
+        model_tp = np.asarray(model_tp, dtype=np.float64)
+        relative_val = np.asarray(relative_val, dtype=np.float64)
+        current_price = np.asarray(current_price, dtype=np.float64)
+        
+        blended_tp = (model_tp + relative_val) / 2
+        upside = (blended_tp - current_price) / current_price
+        
+        return {
+            'score': score_by_breakpoints(upside, UPSIDE_BREAKPOINTS),
+            'blended_tp': round_like_python(blended_tp),
+            'upside': round_like_python(upside * 100),
+            'model_tp': model_tp,
+            'relative_val': relative_val,
+            'current_price': current_price
+        }
+    
     def calculate_growth_score(self, revenue_growth, ebit_growth, np_growth):
         """Calculate Growth Score"""
         # Score each growth component
@@ -383,6 +609,28 @@ class QuadrantCalculator:
             'np_growth': round(np_growth * 100, 2)
         }
     
+    def calculate_growth_score_batch(self, revenue_growth, ebit_growth, np_growth):
+        """Array version of calculate_growth_score()"""
+        revenue_growth = np.asarray(revenue_growth, dtype=np.float64)
+        ebit_growth = np.asarray(ebit_growth, dtype=np.float64)
+        np_growth = np.asarray(np_growth, dtype=np.float64)
+        
+        revenue_score = score_by_breakpoints(revenue_growth, GROWTH_BREAKPOINTS)
+        ebit_score = score_by_breakpoints(ebit_growth, GROWTH_BREAKPOINTS)
+        np_score = score_by_breakpoints(np_growth, GROWTH_BREAKPOINTS)
+        
+        avg_score = np.column_stack([revenue_score, ebit_score, np_score]).mean(axis=1)
+        
+        return {
+            'score': np.round(avg_score, 2),
+            'revenue_score': revenue_score,
+            'ebit_score': ebit_score,
+            'np_score': np_score,
+            'revenue_growth': round_like_python(revenue_growth * 100),
+            'ebit_growth': round_like_python(ebit_growth * 100),
+            'np_growth': round_like_python(np_growth * 100)
+        }
+    
     # ==================== HELPER FUNCTIONS ====================
     
     def get_scoring_rules(self):
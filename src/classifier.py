@@ -3,9 +3,26 @@ Quadrant Classifier Module
 Mengklasifikasikan saham ke dalam 4 quadrant berdasarkan CS dan SS
 """
 
+import heapq
+
+import numpy as np
+
+from .kernels import round_like_python
+
 class QuadrantClassifier:
     """Classifier untuk menentukan quadrant berdasarkan Company Score dan Stock Score"""
     
+    # Compact codes used by the batch API (index into these tuples)
+    QUADRANT_NAMES = ('STAR', 'GROWTH', 'VALUE', 'DOG')
+    STRENGTH_NAMES = ('Strong', 'Moderate', 'Borderline')
+    RATING_NAMES = ('STRONG BUY', 'BUY', 'HOLD', 'SELL', 'AVOID')
+    RISK_FACTORS = (
+        'Weak fundamental quality',
+        'Limited upside potential',
+        'Both fundamentals and valuation are weak',
+        'Near threshold - could shift quadrant'
+    )
+    
     def __init__(self, threshold=3.0):
         """
         Initialize classifier
@@ -134,6 +151,83 @@ class QuadrantClassifier:
             'ss_category': 'High' if ss >= self.threshold else 'Low'
         }
     
+    def classify_batch(self, company_score, stock_score):
+        """
+        Classify many stocks at once into compact typed arrays
+        
+        Only codes and distances are stored; the descriptive quadrant metadata
+        is looked up on demand with expand_classification().
+        
+        Args:
+            company_score: array of Company Scores (CS)
+            stock_score: array of Stock Scores (SS)
+        
+        Returns:
+            dict with keys [quadrant, strength, cs_distance, ss_distance,
+            company_score, stock_score, threshold]; quadrant and strength are
+            int8 codes into QUADRANT_NAMES and STRENGTH_NAMES; a NaN CS or
+            SS classifies as DOG (Moderate), exactly like classify()
+        """
+        cs = np.asarray(company_score, dtype=np.float64)
+        ss = np.asarray(stock_score, dtype=np.float64)
+        
+        # STAR=0, GROWTH=1, VALUE=2, DOG=3 (low CS adds 1, low SS adds 2)
+        quadrant = (~(cs >= self.threshold)).astype(np.int8)
+        quadrant += 2 * (~(ss >= self.threshold))
+        # A NaN score fails every comparison of the classify() if/elif chain,
+        # which therefore falls through to DOG whichever score is NaN
+        quadrant[np.isnan(cs) | np.isnan(ss)] = 3
+        
+        cs_distance = cs - self.threshold
+        ss_distance = ss - self.threshold
+        cs_abs = np.abs(cs_distance)
+        ss_abs = np.abs(ss_distance)
+        
+        # Strong=0, Moderate=1, Borderline=2, same precedence as _get_position_details
+        borderline = (cs_abs < 0.3) | (ss_abs < 0.3)
+        strong = (cs_abs > 0.7) & (ss_abs > 0.7)
+        strength = np.where(borderline, 2, np.where(strong, 0, 1)).astype(np.int8)
+        
+        return {
+            'quadrant': quadrant,
+            'strength': strength,
+            'cs_distance': cs_distance,
+            'ss_distance': ss_distance,
+            'company_score': cs,
+            'stock_score': ss,
+            'threshold': self.threshold
+        }
+    
+    def expand_classification(self, batch, index):
+        """
+        Rebuild the classify() dict for one row of a classify_batch() result
+        
+        Args:
+            batch: dict from classify_batch()
+            index: row position
+        
+        Returns:
+            dict identical to classify(company_score, stock_score)
+        """
+        quadrant = self.QUADRANT_NAMES[batch['quadrant'][index]]
+        cs = batch['company_score'][index].item()
+        ss = batch['stock_score'][index].item()
+        threshold = batch['threshold']
+        
+        quadrant_info = self.quadrants[quadrant].copy()
+        quadrant_info['company_score'] = cs
+        quadrant_info['stock_score'] = ss
+        quadrant_info['threshold'] = threshold
+        quadrant_info['position'] = {
+            'cs_distance': round(batch['cs_distance'][index].item(), 2),
+            'ss_distance': round(batch['ss_distance'][index].item(), 2),
+            'strength': self.STRENGTH_NAMES[batch['strength'][index]],
+            'cs_category': 'High' if cs >= threshold else 'Low',
+            'ss_category': 'High' if ss >= threshold else 'Low'
+        }
+        
+        return quadrant_info
+    
     def get_investment_recommendation(self, quadrant_info, target_price, 
                                      current_price):
         """
@@ -198,6 +292,91 @@ class QuadrantClassifier:
             'position_sizing': self._get_position_sizing(quadrant, strength)
         }
     
+    def get_investment_recommendation_batch(self, batch, target_price,
+                                            current_price):
+        """
+        Generate recommendations for a classify_batch() result
+        
+        Args:
+            batch: dict from classify_batch()
+            target_price: array of target prices
+            current_price: array of current prices
+        
+        Returns:
+            dict with keys [rating, priority, upside, risk_flags, target_price,
+            current_price]; rating is an int8 code into RATING_NAMES and
+            risk_flags a bitmask over RISK_FACTORS
+        """
+        target_price = np.asarray(target_price, dtype=np.float64)
+        current_price = np.asarray(current_price, dtype=np.float64)
+        quadrant = batch['quadrant']
+        
+        upside = ((target_price - current_price) / current_price) * 100
+        
+        # Rating per quadrant code (STAR, GROWTH, VALUE, DOG), downgraded when borderline
+        base_rating = np.array([0, 1, 2, 3], dtype=np.int8)
+        borderline_rating = np.array([1, 2, 2, 4], dtype=np.int8)
+        rating = np.where(
+            batch['strength'] == 2,
+            borderline_rating[quadrant],
+            base_rating[quadrant]
+        )
+        
+        return {
+            'rating': rating,
+            'priority': (quadrant + 1).astype(np.int8),
+            'upside': round_like_python(upside),
+            'risk_flags': self._assess_risk_flags(batch),
+            'target_price': target_price,
+            'current_price': current_price
+        }
+    
+    def expand_recommendation(self, batch, recommendation, index):
+        """
+        Rebuild the get_investment_recommendation() dict for one row
+        
+        Args:
+            batch: dict from classify_batch()
+            recommendation: dict from get_investment_recommendation_batch()
+            index: row position
+        
+        Returns:
+            dict identical to get_investment_recommendation()
+        """
+        quadrant = self.QUADRANT_NAMES[batch['quadrant'][index]]
+        strength = self.STRENGTH_NAMES[batch['strength'][index]]
+        flags = int(recommendation['risk_flags'][index])
+        risk_factors = [
+            factor for bit, factor in enumerate(self.RISK_FACTORS)
+            if flags & (1 << bit)
+        ]
+        
+        return {
+            'rating': self.RATING_NAMES[recommendation['rating'][index]],
+            'quadrant': quadrant,
+            'priority': int(recommendation['priority'][index]),
+            'target_price': recommendation['target_price'][index].item(),
+            'current_price': recommendation['current_price'][index].item(),
+            'upside': recommendation['upside'][index].item(),
+            'risk_level': self.quadrants[quadrant]['risk_level'],
+            'action': self.quadrants[quadrant]['action'],
+            'risk_factors': risk_factors if risk_factors else ['Minimal risk factors'],
+            'time_horizon': self._get_time_horizon(quadrant),
+            'position_sizing': self._get_position_sizing(quadrant, strength)
+        }
+    
+    def _assess_risk_flags(self, batch):
+        """Array version of _assess_risk_factors() as a bitmask over RISK_FACTORS"""
+        cs = batch['company_score']
+        ss = batch['stock_score']
+        
+        flags = (cs < 2.5).astype(np.int8)
+        flags |= (ss < 2.5).astype(np.int8) << 1
+        threshold = batch['threshold']
+        flags |= ((cs < threshold) & (ss < threshold)).astype(np.int8) << 2
+        flags |= (batch['strength'] == 2).astype(np.int8) << 3
+        return flags
+    
     def _assess_risk_factors(self, quadrant_info):
         """Assess risk factors based on scores"""
         cs = quadrant_info['company_score']
@@ -247,12 +426,14 @@ class QuadrantClassifier:
         else:
             return base_size
     
-    def compare_stocks(self, stocks_data):
+    def compare_stocks(self, stocks_data, top=None):
         """
         Compare multiple stocks and rank them
         
         Args:
             stocks_data: list of dicts with keys [ticker, cs, ss, target_price, current_price]
+            top: optional number of leading stocks to return (partial sort);
+                 see ranking.StockRanking for continuously updated rankings
         
         Returns:
             list of dicts with ranking and recommendations
@@ -279,6 +460,9 @@ class QuadrantClassifier:
             })
         
         # Sort by priority (STAR > GROWTH > VALUE > DOG)
+        if top is not None:
+            # Same order as the full sort, but O(n log k)
+            return heapq.nsmallest(top, results, key=lambda x: (x['priority'], -x['upside']))
         results.sort(key=lambda x: (x['priority'], -x['upside']))
         
         return results
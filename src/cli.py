@@ -0,0 +1,201 @@
+"""
+Command Line Module
+Batch scoring universe saham tanpa Streamlit
+
+Usage:
+    python -m src.cli data/sample_data.json -o results.csv
+    python -m src.cli universe.parquet -o results.json --threshold 2.8
+    python -m src.cli universe.parquet -o results.csv --store history.db
+    python -m src.cli big_universe.json -o results.parquet --chunk-size 5000
+    python -m src.cli universe.csv -o results.csv --cache
+    python -m src.cli universe.parquet -o report.xlsx
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from .calculator import QuadrantCalculator
+from .classifier import QuadrantClassifier
+from .loader import iter_universe_chunks, load_universe, load_universe_cached
+from .parallel import ParallelScorer, concat_results
+from .pipeline import QuadrantPipeline
+from .sector import SectorNormalizer
+from .store import ResultStore, inputs_hashes
+
+
+def build_parser():
+    """Build the argument parser"""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description='Score a universe file (CS -> SS -> quadrant -> recommendation).'
+    )
+    parser.add_argument('universe', help='universe file (.json, .csv or .parquet)')
+    parser.add_argument('-o', '--output',
+                        help='output file (.csv, .json, .parquet, .arrow or .xlsx); default: CSV to stdout')
+    parser.add_argument('--threshold', type=float, default=3.0,
+                        help='High/Low threshold for CS and SS (default: 3.0)')
+    parser.add_argument('--sector-relative', choices=('percentile', 'zscore'),
+                        help='score VC/FP/growth within each sector instead of absolute breakpoints')
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help='worker processes for scoring (default: 1, serial)')
+    parser.add_argument('--chunk-size', type=int, metavar='N',
+                        help='stream a .json universe N tickers at a time (bounded memory)')
+    parser.add_argument('--cache', action='store_true',
+                        help='load through a memory-mapped panel cache (<universe>.panel)')
+    parser.add_argument('--store', metavar='DB',
+                        help='also append the run to a SQLite result store')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='do not print the run summary to stderr')
+    return parser
+
+
+def write_results(records, output):
+    """
+    Write result records as JSON or CSV (by extension), or CSV to stdout
+    
+    Parquet / Arrow output goes through arrow_io.export_results() instead,
+    straight from the result arrays.
+    
+    Args:
+        records: list of dicts from QuadrantPipeline.to_records()
+        output: output path, or None for stdout
+    """
+    extension = os.path.splitext(output)[1].lower() if output else '.csv'
+    
+    if extension == '.json':
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2)
+    elif extension == '.csv':
+        fieldnames = list(records[0]) if records else ['ticker']
+        f = open(output, 'w', newline='', encoding='utf-8') if output else sys.stdout
+        try:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(records)
+        finally:
+            if output:
+                f.close()
+    else:
+        raise ValueError(f"Unsupported output format: {extension}")
+
+
+def stream_scores(pipeline, path, chunk_size, with_hashes=False, quiet=False):
+    """
+    Load and score a universe JSON file chunk by chunk
+    
+    Args:
+        pipeline: QuadrantPipeline
+        path: universe JSON file
+        chunk_size: tickers per chunk
+        with_hashes: also compute the inputs hashes for the result store
+        quiet: do not print progress to stderr
+    
+    Returns:
+        (results, hashes): concatenated score() columns and the list of
+        inputs hashes (None unless with_hashes)
+    """
+    def progress(stats):
+        if not quiet:
+            print(f"Loaded {stats['tickers']} tickers "
+                  f"({stats['tickers_per_s']:,.0f} tickers/s)", file=sys.stderr)
+    
+    parts = []
+    hashes = [] if with_hashes else None
+    for panel in iter_universe_chunks(path, chunk_size, progress):
+        parts.append(pipeline.score(panel))
+        if with_hashes:
+            hashes.extend(inputs_hashes(panel))
+    if not parts:
+        raise ValueError(f"{path}: universe is empty")
+    return concat_results(parts), hashes
+
+
+def main(argv=None):
+    """Entry point, returns the process exit code"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('-j/--workers must be at least 1')
+    if args.chunk_size is not None:
+        if args.chunk_size < 1:
+            parser.error('--chunk-size must be at least 1')
+        if not args.universe.lower().endswith('.json'):
+            parser.error('--chunk-size only applies to .json universe files')
+        if args.cache:
+            parser.error('--chunk-size cannot be combined with --cache')
+    if args.workers > 1 and (args.sector_relative or args.chunk_size):
+        # Sector statistics need the whole universe, and chunks are scored
+        # one at a time as they stream in
+        parser.error('-j/--workers cannot be combined with --sector-relative or --chunk-size')
+    
+    pipeline = QuadrantPipeline(
+        QuadrantCalculator(), QuadrantClassifier(threshold=args.threshold),
+        SectorNormalizer(args.sector_relative) if args.sector_relative else None
+    )
+    
+    start = time.perf_counter()
+    if args.chunk_size:
+        if pipeline.sector_normalizer is not None:
+            # Sector statistics must cover the whole file, not the first chunk
+            pipeline.sector_normalizer.fit_chunks(
+                iter_universe_chunks(args.universe, args.chunk_size)
+            )
+        results, hashes = stream_scores(pipeline, args.universe, args.chunk_size,
+                                        args.store is not None, args.quiet)
+        loaded = start
+    else:
+        panel = (load_universe_cached if args.cache else load_universe)(args.universe)
+        loaded = time.perf_counter()
+        if args.workers > 1:
+            results = ParallelScorer(workers=args.workers).score(
+                panel, {'threshold': args.threshold}
+            )
+        else:
+            results = pipeline.score(panel)
+        hashes = inputs_hashes(panel) if args.store else None
+    scored = time.perf_counter()
+    extension = os.path.splitext(args.output)[1].lower() if args.output else ''
+    export = None
+    if extension in ('.parquet', '.pq', '.arrow', '.feather'):
+        # Columnar output keeps the int8 codes as dictionary-encoded columns
+        from .arrow_io import export_results
+        export_results(results, args.output, pipeline)
+    elif extension == '.xlsx':
+        # Streams straight from the result arrays, no per-row dicts
+        from .excel_exporter import ExcelExporter
+        export = ExcelExporter(pipeline.classifier).export(results, args.output)
+    else:
+        write_results(pipeline.to_records(results), args.output)
+    written = time.perf_counter()
+    
+    if args.store:
+        with ResultStore(args.store) as store:
+            store.save_run(results, pipeline, hashes=hashes)
+    
+    if not args.quiet:
+        n = len(results['ticker'])
+        score_time = scored - loaded
+        rate = n / score_time if score_time > 0 else float('inf')
+        counts = ', '.join(f"{name} {count}" for name, count in pipeline.quadrant_counts(results).items())
+        # Streaming interleaves loading and scoring, so they are timed together
+        timing = (f"load+score {score_time:.3f}s" if loaded == start else
+                  f"load {loaded - start:.3f}s, score {score_time:.3f}s")
+        print(
+            f"Scored {n} tickers: {timing} ({rate:,.0f} tickers/s), "
+            f"write {written - scored:.3f}s",
+            file=sys.stderr
+        )
+        print(f"Quadrants: {counts}", file=sys.stderr)
+        if export:
+            print(f"Excel: {export['rows']} rows in {len(export['sheets'])} sheets "
+                  f"({export['rows_per_s']:,.0f} rows/s)", file=sys.stderr)
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Snapshot Diff Module
+Migrasi quadrant dan perubahan komponen antara dua snapshot scoring
+"""
+
+import numpy as np
+
+from .classifier import QuadrantClassifier
+
+# Score components compared between snapshots: name -> (score, weighted, axis)
+COMPONENTS = {
+    'vcs': ('vcs_score', 'vcs_weighted', 'cs'),
+    'vc': ('vc_score', 'vc_weighted', 'cs'),
+    'fp': ('fp_score', 'fp_weighted', 'cs'),
+    'valuation': ('valuation_score', 'valuation_weighted', 'ss'),
+    'growth': ('growth_score', 'growth_weighted', 'ss')
+}
+DRIVER_NAMES = tuple(COMPONENTS)
+
+
+class SnapshotDiff:
+    """Membandingkan dua hasil scoring per ticker dengan sorted join"""
+    
+    def __init__(self, classifier=None):
+        """
+        Args:
+            classifier: QuadrantClassifier providing the threshold and names
+        """
+        self.classifier = classifier or QuadrantClassifier()
+    
+    def diff(self, before, after):
+        """
+        Join two snapshots by ticker and compare them
+        
+        Args:
+            before: dict from QuadrantPipeline.score() (or arrow_io.load_results)
+            after: same, for the later snapshot
+        
+        Returns:
+            dict with keys:
+                ticker, quadrant_before, quadrant_after, moved  (common tickers)
+                company_score_delta, stock_score_delta
+                <component>_delta / <component>_weighted_delta for VCS, VC,
+                FP, valuation and growth
+                driver: int8 code into DRIVER_NAMES, the component with the
+                largest weighted change on the axis that crossed the threshold
+                transition: (4, 4) counts, rows = before, columns = after
+                added, removed: tickers present in only one snapshot
+        """
+        for name, snapshot in (('before', before), ('after', after)):
+            if len(np.unique(snapshot['ticker'])) != len(snapshot['ticker']):
+                raise ValueError(f"Duplicate tickers in the {name} snapshot")
+        
+        tickers, i, j = np.intersect1d(
+            before['ticker'], after['ticker'], assume_unique=True, return_indices=True
+        )
+        q_before = before['quadrant'][i]
+        q_after = after['quadrant'][j]
+        n_quadrants = len(self.classifier.QUADRANT_NAMES)
+        
+        result = {
+            'ticker': tickers,
+            'quadrant_before': q_before,
+            'quadrant_after': q_after,
+            'moved': q_before != q_after,
+            'company_score_delta': after['company_score'][j] - before['company_score'][i],
+            'stock_score_delta': after['stock_score'][j] - before['stock_score'][i]
+        }
+        
+        weighted = []
+        for name, (score, weight, _) in COMPONENTS.items():
+            result[f'{name}_delta'] = (
+                after[score][j].astype(np.float64) - before[score][i].astype(np.float64)
+            )
+            result[f'{name}_weighted_delta'] = after[weight][j] - before[weight][i]
+            weighted.append(np.abs(result[f'{name}_weighted_delta']))
+        weighted = np.stack(weighted, axis=1)
+        
+        # Restrict the driver to the axis that changed side of the threshold
+        threshold = self.classifier.threshold
+        crossed = {
+            'cs': (before['company_score'][i] >= threshold) != (after['company_score'][j] >= threshold),
+            'ss': (before['stock_score'][i] >= threshold) != (after['stock_score'][j] >= threshold)
+        }
+        eligible = np.stack([crossed[axis] for _, _, axis in COMPONENTS.values()], axis=1)
+        eligible[~eligible.any(axis=1)] = True
+        result['driver'] = np.where(eligible, weighted, -1.0).argmax(axis=1).astype(np.int8)
+        
+        result['transition'] = np.bincount(
+            q_before.astype(np.intp) * n_quadrants + q_after,
+            minlength=n_quadrants * n_quadrants
+        ).reshape(n_quadrants, n_quadrants)
+        result['added'] = np.setdiff1d(after['ticker'], before['ticker'], assume_unique=True)
+        result['removed'] = np.setdiff1d(before['ticker'], after['ticker'], assume_unique=True)
+        return result
+    
+    def history(self, snapshots):
+        """
+        Transition matrices of consecutive snapshot pairs
+        
+        Args:
+            snapshots: list of result dicts, oldest first
+        
+        Returns:
+            int array (len(snapshots) - 1, 4, 4)
+        """
+        n_quadrants = len(self.classifier.QUADRANT_NAMES)
+        matrices = np.zeros((max(len(snapshots) - 1, 0), n_quadrants, n_quadrants), dtype=np.int64)
+        for t in range(1, len(snapshots)):
+            matrices[t - 1] = self.diff(snapshots[t - 1], snapshots[t])['transition']
+        return matrices
+    
+    def migrations(self, result, source, target):
+        """
+        Tickers that moved from one quadrant to another, e.g. STAR -> VALUE
+        
+        Args:
+            result: dict from diff()
+            source, target: quadrant names
+        
+        Returns:
+            dict of the diff() per-ticker columns restricted to those tickers
+        """
+        names = self.classifier.QUADRANT_NAMES
+        mask = ((result['quadrant_before'] == names.index(source)) &
+                (result['quadrant_after'] == names.index(target)))
+        n = len(result['ticker'])
+        return {
+            key: values[mask] for key, values in result.items()
+            if isinstance(values, np.ndarray) and values.ndim == 1 and len(values) == n
+        }
+    
+    def transition_table(self, result):
+        """Transition counts as {before name: {after name: count}}"""
+        names = self.classifier.QUADRANT_NAMES
+        return {
+            source: dict(zip(names, row))
+            for source, row in zip(names, result['transition'].tolist())
+        }
+    
+    def to_records(self, result, moved_only=True):
+        """
+        Per-ticker rows with quadrant and driver names
+        
+        Args:
+            result: dict from diff()
+            moved_only: keep only tickers whose quadrant changed
+        
+        Returns:
+            list of dicts
+        """
+        names = np.array(self.classifier.QUADRANT_NAMES, dtype=object)
+        drivers = np.array(DRIVER_NAMES, dtype=object)
+        mask = result['moved'] if moved_only else np.ones(len(result['ticker']), dtype=bool)
+        
+        columns = {
+            'ticker': result['ticker'][mask].tolist(),
+            'quadrant_before': names[result['quadrant_before'][mask]].tolist(),
+            'quadrant_after': names[result['quadrant_after'][mask]].tolist(),
+            'driver': drivers[result['driver'][mask]].tolist(),
+            'company_score_delta': result['company_score_delta'][mask].tolist(),
+            'stock_score_delta': result['stock_score_delta'][mask].tolist()
+        }
+        for name in COMPONENTS:
+            columns[f'{name}_delta'] = result[f'{name}_delta'][mask].tolist()
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
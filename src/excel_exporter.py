@@ -0,0 +1,152 @@
+"""
+Excel Exporter Module
+Export hasil batch scoring ke Excel secara streaming (openpyxl write-only)
+"""
+
+import time
+
+import numpy as np
+
+from .classifier import QuadrantClassifier
+
+# Sheet name -> result columns, in column order. Decoded columns
+# (quadrant/strength/rating names, position sizing, time horizon,
+# risk factors) are derived from the int8 codes chunk by chunk.
+SHEETS = {
+    'Scores': (
+        'ticker', 'company_name', 'sector',
+        'company_score', 'vcs_score', 'vc_score', 'fp_score',
+        'vcs_weighted', 'vc_weighted', 'fp_weighted',
+        'stock_score', 'valuation_score', 'growth_score',
+        'valuation_weighted', 'growth_weighted', 'blended_tp', 'upside'
+    ),
+    'Breakdown': None,   # every component column not shown elsewhere
+    'Recommendations': (
+        'ticker', 'quadrant', 'strength', 'cs_distance', 'ss_distance',
+        'rating', 'priority', 'target_price', 'current_price',
+        'recommendation_upside', 'position_sizing', 'time_horizon'
+    ),
+    'Risk Factors': ('ticker', 'quadrant', 'rating', 'risk_flags', 'risk_factors')
+}
+
+DERIVED = ('position_sizing', 'time_horizon', 'risk_factors')
+
+
+class ExcelExporter:
+    """Menulis hasil QuadrantPipeline.score() ke workbook multi-sheet, baris demi chunk"""
+    
+    def __init__(self, classifier=None, chunk_size=5000):
+        """
+        Args:
+            classifier: QuadrantClassifier used for names, sizing and horizons
+            chunk_size: rows decoded and appended per step
+        """
+        self.classifier = classifier or QuadrantClassifier()
+        self.chunk_size = chunk_size
+        
+        classifier = self.classifier
+        quadrants = classifier.QUADRANT_NAMES
+        self.lookups = {
+            'quadrant': np.array(quadrants, dtype=object),
+            'strength': np.array(classifier.STRENGTH_NAMES, dtype=object),
+            'rating': np.array(classifier.RATING_NAMES, dtype=object),
+            'time_horizon': np.array(
+                [classifier._get_time_horizon(name) for name in quadrants], dtype=object
+            ),
+            # (quadrant, strength) -> sizing string
+            'position_sizing': np.array([
+                [classifier._get_position_sizing(name, strength)
+                 for strength in classifier.STRENGTH_NAMES]
+                for name in quadrants
+            ], dtype=object),
+            # risk_flags bitmask -> '; '-joined factors, as in to_records()
+            'risk_factors': np.array([
+                '; '.join(
+                    factor for bit, factor in enumerate(classifier.RISK_FACTORS)
+                    if flags & (1 << bit)
+                ) or 'Minimal risk factors'
+                for flags in range(1 << len(classifier.RISK_FACTORS))
+            ], dtype=object)
+        }
+    
+    def sheet_columns(self, results):
+        """Resolve SHEETS against the columns present in a result dict"""
+        shown = set()
+        sheets = {}
+        for name, columns in SHEETS.items():
+            if columns is None:
+                continue
+            sheets[name] = [c for c in columns if c in results or c in DERIVED]
+            shown.update(sheets[name])
+        
+        breakdown = ['ticker'] + [c for c in results if c not in shown]
+        ordered = {}
+        for name in SHEETS:
+            ordered[name] = breakdown if SHEETS[name] is None else sheets[name]
+        return ordered
+    
+    def _chunk_column(self, results, column, rows):
+        """One column of a row slice as a Python list, codes decoded"""
+        lookups = self.lookups
+        if column == 'position_sizing':
+            values = lookups[column][results['quadrant'][rows], results['strength'][rows]]
+        elif column == 'time_horizon':
+            values = lookups[column][results['quadrant'][rows]]
+        elif column == 'risk_factors':
+            values = lookups[column][results['risk_flags'][rows]]
+        elif column in ('quadrant', 'strength', 'rating'):
+            values = lookups[column][results[column][rows]]
+        else:
+            values = results[column][rows]
+            if values.dtype.kind == 'f':
+                # Excel has no NaN/inf; leave those cells empty
+                values = np.where(np.isfinite(values), values, None)
+        return values.tolist()
+    
+    def export(self, results, path, progress=None):
+        """
+        Write a multi-sheet workbook straight from batch result arrays
+        
+        The workbook is opened in openpyxl write-only mode, which streams
+        rows to disk, and rows are decoded chunk_size at a time, so memory
+        stays bounded regardless of the number of tickers.
+        
+        Args:
+            results: dict from QuadrantPipeline.score()
+            path: output .xlsx path
+            progress: optional callback(stats) after every chunk, stats being a
+                      dict with keys [sheet, rows, elapsed, rows_per_s]
+        
+        Returns:
+            dict with rows per sheet, total rows, elapsed seconds and rows/s
+        """
+        from openpyxl import Workbook
+        
+        start = time.perf_counter()
+        workbook = Workbook(write_only=True)
+        n = len(results['ticker'])
+        written = 0
+        sheet_rows = {}
+        
+        for name, columns in self.sheet_columns(results).items():
+            sheet = workbook.create_sheet(name)
+            sheet.append(columns)
+            for begin in range(0, n, self.chunk_size):
+                rows = slice(begin, min(begin + self.chunk_size, n))
+                for row in zip(*[self._chunk_column(results, c, rows) for c in columns]):
+                    sheet.append(row)
+                written += rows.stop - rows.start
+                if progress is not None:
+                    elapsed = time.perf_counter() - start
+                    progress({'sheet': name, 'rows': written, 'elapsed': elapsed,
+                              'rows_per_s': written / elapsed if elapsed > 0 else float('inf')})
+            sheet_rows[name] = n
+        
+        workbook.save(path)
+        elapsed = time.perf_counter() - start
+        return {
+            'sheets': sheet_rows,
+            'rows': written,
+            'elapsed': elapsed,
+            'rows_per_s': written / elapsed if elapsed > 0 else float('inf')
+        }
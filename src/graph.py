@@ -0,0 +1,244 @@
+"""
+Scoring Graph Module
+Pipeline scoring sebagai dependency graph dengan rekomputasi inkremental
+"""
+
+import numpy as np
+
+from .calculator import QuadrantCalculator
+from .classifier import QuadrantClassifier
+from .panel import FinancialPanel
+from .pipeline import QuadrantPipeline
+
+
+class ScoringGraph:
+    """
+    Dependency graph untuk CS -> SS -> classify -> recommendation
+    
+    Inputs:
+        financials      FinancialPanel (historical / projected data)
+        nominal_gdp     array (N,) or scalar
+        real_gdp        array (N,) or scalar
+        vcs_data        dict of arrays [lifecycle, porter, management, esg]
+        model_tp        array (N,)
+        relative_val    array (N,)
+        current_price   array (N,), valuation price
+        growth_data     dict of arrays [revenue_growth, ebit_growth, np_growth]
+        market_price    array (N,), company_info price used for the recommendation
+    
+    Changing an input only recomputes the nodes downstream of it; e.g. a new
+    current_price reruns valuation -> stock_score -> classification ->
+    recommendation and leaves VC, FP and CS untouched.
+    """
+    
+    INPUTS = (
+        'financials', 'nominal_gdp', 'real_gdp', 'vcs_data',
+        'model_tp', 'relative_val', 'current_price', 'growth_data', 'market_price'
+    )
+    
+    # node -> dependencies, listed in topological order
+    NODES = {
+        'vc': ('financials', 'nominal_gdp', 'real_gdp'),
+        'fp': ('financials',),
+        'company_score': ('vcs_data', 'vc', 'fp'),
+        'valuation': ('model_tp', 'relative_val', 'current_price'),
+        'growth': ('growth_data',),
+        'stock_score': ('valuation', 'growth'),
+        'classification': ('company_score', 'stock_score'),
+        'recommendation': ('classification', 'stock_score', 'market_price')
+    }
+    
+    def __init__(self, calculator=None, classifier=None):
+        """
+        Initialize graph
+        
+        Args:
+            calculator: QuadrantCalculator (default: new instance)
+            classifier: QuadrantClassifier (default: new instance)
+        """
+        self.calculator = calculator or QuadrantCalculator()
+        self.classifier = classifier or QuadrantClassifier()
+        self.pipeline = QuadrantPipeline(self.calculator, self.classifier)
+        
+        self.values = {}
+        self.dirty = set(self.NODES)
+        self.last_recomputed = []
+        
+        self.dependents = {name: [] for name in self.INPUTS + tuple(self.NODES)}
+        for node, deps in self.NODES.items():
+            for dep in deps:
+                self.dependents[dep].append(node)
+    
+    # ==================== INPUTS ====================
+    
+    def update(self, **inputs):
+        """
+        Set input values; unchanged values do not invalidate anything
+        
+        Args:
+            **inputs: input name -> new value (see class docstring)
+        
+        Returns:
+            list of input names that actually changed
+        """
+        changed = []
+        for name, value in inputs.items():
+            if name not in self.dependents or name in self.NODES:
+                raise KeyError(f"Unknown graph input: {name}")
+            if name in self.values and self._same(self.values[name], value):
+                continue
+            self.values[name] = value
+            self.invalidate(name)
+            changed.append(name)
+        return changed
+    
+    def update_from_panel(self, panel):
+        """Set every input from a FinancialPanel with all sections"""
+        valuation = panel.section('valuation_data')
+        macro = panel.section('macro_data')
+        return self.update(
+            financials=panel,
+            nominal_gdp=macro['nominal_gdp'],
+            real_gdp=macro['real_gdp'],
+            vcs_data=panel.section('vcs_data'),
+            model_tp=valuation['model_tp'],
+            relative_val=valuation['relative_val'],
+            current_price=valuation['current_price'],
+            growth_data=panel.section('growth_data'),
+            market_price=panel.info.get('current_price', valuation['current_price'])
+        )
+    
+    def invalidate(self, *names):
+        """
+        Mark nodes downstream of the given inputs/nodes as dirty
+        
+        Call with a node name after changing calculator weights or the
+        classifier threshold, e.g. invalidate('company_score').
+        """
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in self.NODES:
+                self.dirty.add(name)
+            stack.extend(self.dependents[name])
+    
+    def _same(self, old, new):
+        if old is new:
+            return True
+        if isinstance(old, FinancialPanel) and isinstance(new, FinancialPanel):
+            return (
+                np.array_equal(old.tickers, new.tickers) and
+                np.array_equal(old.historical, new.historical, equal_nan=True) and
+                np.array_equal(old.projected, new.projected, equal_nan=True)
+            )
+        if isinstance(old, dict) and isinstance(new, dict):
+            return old.keys() == new.keys() and all(
+                self._same(old[key], new[key]) for key in old
+            )
+        if isinstance(old, (dict, FinancialPanel)) or isinstance(new, (dict, FinancialPanel)):
+            return False
+        return np.array_equal(np.asarray(old), np.asarray(new))
+    
+    # ==================== EVALUATION ====================
+    
+    def compute(self):
+        """
+        Recompute dirty nodes in dependency order
+        
+        Returns:
+            list of node names recomputed (also kept in last_recomputed)
+        """
+        missing = [name for name in self.INPUTS if name not in self.values]
+        if missing:
+            raise ValueError(f"Missing graph inputs: {', '.join(missing)}")
+        
+        recomputed = []
+        for node in self.NODES:
+            if node in self.dirty:
+                self.values[node] = getattr(self, f'_compute_{node}')()
+                self.dirty.discard(node)
+                recomputed.append(node)
+        
+        self.last_recomputed = recomputed
+        return recomputed
+    
+    def _compute_vc(self):
+        v = self.values
+        return self.calculator.calculate_vc_scores_batch(
+            v['financials'], v['nominal_gdp'], v['real_gdp']
+        )
+    
+    def _compute_fp(self):
+        return self.calculator.calculate_fp_scores_batch(self.values['financials'])
+    
+    def _compute_company_score(self):
+        v = self.values
+        return self.calculator.calculate_company_score_batch(v['vcs_data'], v['vc'], v['fp'])
+    
+    def _compute_valuation(self):
+        v = self.values
+        return self.calculator.calculate_valuation_score_batch(
+            v['model_tp'], v['relative_val'], v['current_price']
+        )
+    
+    def _compute_growth(self):
+        growth = self.values['growth_data']
+        return self.calculator.calculate_growth_score_batch(
+            growth['revenue_growth'], growth['ebit_growth'], growth['np_growth']
+        )
+    
+    def _compute_stock_score(self):
+        v = self.values
+        return self.calculator.combine_stock_score_batch(v['valuation'], v['growth'])
+    
+    def _compute_classification(self):
+        v = self.values
+        return self.classifier.classify_batch(
+            v['company_score']['company_score'], v['stock_score']['stock_score']
+        )
+    
+    def _compute_recommendation(self):
+        v = self.values
+        return self.classifier.get_investment_recommendation_batch(
+            v['classification'], v['stock_score']['blended_tp'], v['market_price']
+        )
+    
+    # ==================== OUTPUTS ====================
+    
+    def results(self):
+        """Return the columnar results (same columns as QuadrantPipeline.score())"""
+        self.compute()
+        v = self.values
+        return self.pipeline.assemble(
+            v['financials'], v['company_score'], v['stock_score'],
+            v['classification'], v['recommendation']
+        )
+    
+    def scalar_results(self, index=0):
+        """
+        Return the scalar result dicts of one ticker, as used by app.py
+        
+        Args:
+            index: row position
+        
+        Returns:
+            dict with keys [cs_result, ss_result, quadrant_info, recommendation]
+            shaped like the outputs of the scalar calculator/classifier methods
+        """
+        self.compute()
+        v = self.values
+        return {
+            'cs_result': self._row(v['company_score'], index),
+            'ss_result': self._row(v['stock_score'], index),
+            'quadrant_info': self.classifier.expand_classification(v['classification'], index),
+            'recommendation': self.classifier.expand_recommendation(
+                v['classification'], v['recommendation'], index
+            )
+        }
+    
+    def _row(self, value, index):
+        if isinstance(value, dict):
+            return {key: self._row(item, index) for key, item in value.items()}
+        if isinstance(value, np.ndarray) and value.ndim:
+            return value[index].item()
+        return value
@@ -0,0 +1,72 @@
+"""
+Scoring Kernels Module
+Kernel scoring berbasis tabel breakpoint untuk array NumPy
+"""
+
+import numpy as np
+
+# Sorted breakpoint tables. A value scores 1 + the number of breakpoints it
+# strictly exceeds, which is exactly the `>` ladder used by the scalar
+# QuadrantCalculator methods.
+DISCREPANCY_BREAKPOINTS = {
+    'ratio': np.array([10.0, 15.0, 20.0]),   # bps, ROA / OCF-EBIT / Equity / Cash
+    'growth': np.array([0.0, 5.0, 10.0])     # bps, EBIT margin / growth acceleration
+}
+GDP_BREAKPOINTS = np.array([-2.0, 0.0, 4.0])          # bps vs GDP growth
+UPSIDE_BREAKPOINTS = np.array([0.0, 0.15, 0.30])      # valuation upside
+GROWTH_BREAKPOINTS = np.array([0.05, 0.25, 0.50])     # blended-forward growth
+
+
+def score_by_breakpoints(values, breakpoints):
+    """
+    Score values against a sorted breakpoint table
+    
+    Args:
+        values: scalar or array of values
+        breakpoints: ascending array of breakpoints
+    
+    Returns:
+        int8 array of scores (1 .. len(breakpoints) + 1); NaN scores 1
+    """
+    values = np.asarray(values, dtype=np.float64)
+    
+    # side='left' counts breakpoints strictly below each value (strict `>`)
+    scores = np.searchsorted(breakpoints, values, side='left').astype(np.int8)
+    scores += 1
+    
+    # searchsorted sorts NaN after every breakpoint, the scalar ladder gives 1
+    nan_mask = np.isnan(values)
+    if nan_mask.any():
+        scores[nan_mask] = 1
+    return scores
+
+
+def round_like_python(values, ndigits=2):
+    """
+    Round an array exactly like Python's built-in round() on floats
+    
+    np.round() scales, rounds and unscales, which can differ from Python's
+    correctly-rounded round() right at a .5 tie. Near-tie elements fall back
+    to the built-in so batch results match the scalar path bit for bit.
+    
+    Args:
+        values: scalar or array of floats
+        ndigits: number of decimals
+    
+    Returns:
+        float64 array
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** ndigits
+    rounded = np.array(np.round(values, ndigits), dtype=np.float64)
+    
+    with np.errstate(invalid='ignore', over='ignore'):
+        scaled = values * scale
+        fraction = scaled - np.floor(scaled)
+        near_tie = np.abs(fraction - 0.5) <= 1e-9 * np.maximum(1.0, np.abs(scaled))
+        # Huge and non-finite values are rare; let Python handle them too
+        fallback = near_tie | ~(np.abs(scaled) < 2.0 ** 52)
+    
+    if fallback.any():
+        rounded[fallback] = [round(value, ndigits) for value in values[fallback].tolist()]
+    return rounded
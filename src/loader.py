@@ -0,0 +1,317 @@
+"""
+Universe Loader Module
+Membaca file universe (JSON / CSV / Parquet) menjadi FinancialPanel
+"""
+
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+
+import numpy as np
+
+from .panel import FinancialPanel
+
+PERIODS = {'historical': 'historical_data', 'projected': 'projected_data'}
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def load_universe(path):
+    """
+    Load a universe file into a FinancialPanel
+    
+    Supported formats (by extension):
+        .json     - dict {ticker: record}, schema of data/sample_data.json
+        .csv      - long table, one row per ticker per year (see load_universe_frame)
+        .parquet  - same table as CSV
+    
+    Args:
+        path: path to the universe file
+    
+    Returns:
+        FinancialPanel
+    """
+    extension = os.path.splitext(path)[1].lower()
+    
+    if extension == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            return FinancialPanel.from_universe(json.load(f))
+    
+    # pandas is only needed for tabular inputs
+    import pandas as pd
+    
+    if extension == '.csv':
+        return load_universe_frame(pd.read_csv(path))
+    elif extension in ('.parquet', '.pq'):
+        return load_universe_frame(pd.read_parquet(path))
+    
+    raise ValueError(f"Unsupported universe format: {extension or path}")
+
+
+def load_universe_cached(path, cache_dir=None):
+    """
+    Load a universe through a memory-mapped binary panel cache
+    
+    The first call parses the source with load_universe() and writes the
+    panel with FinancialPanel.save(). Later calls map the cached arrays
+    read-only, which costs only a few milliseconds and copies nothing.
+    The cache is rebuilt automatically when the source file's size or
+    modification time no longer matches the cached fingerprint.
+    
+    Args:
+        path: universe file (any format supported by load_universe)
+        cache_dir: cache directory (default: '<path>.panel' next to the source)
+    
+    Returns:
+        FinancialPanel
+    """
+    cache_dir = cache_dir or path + '.panel'
+    stat = os.stat(path)
+    fingerprint = {
+        'source': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns
+    }
+    
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    if os.path.exists(meta_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                layout = json.load(f)
+            if (layout.get('meta') == fingerprint
+                    and layout.get('version') == FinancialPanel.BINARY_VERSION):
+                return FinancialPanel.open(cache_dir)
+        except (OSError, ValueError):
+            # Swapped out by a concurrent rebuild while reading; rebuild too
+            pass
+    
+    panel = load_universe(path)
+    
+    # Write next to the target and swap in, so readers never see a half cache.
+    # os.mkdir applies the normal umask (mkdtemp would force 0700), so a
+    # cache shared between users or services stays readable.
+    parent = os.path.dirname(os.path.abspath(cache_dir))
+    staging = os.path.join(parent, f'.panel-{os.getpid()}-{uuid.uuid4().hex}')
+    os.mkdir(staging, 0o777)
+    try:
+        panel.save(staging, meta=fingerprint)
+        _swap_cache(staging, cache_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    
+    # Whether our swap won or a concurrent rebuild's did, a cache miss never
+    # fails the load: the parsed panel holds the same data
+    try:
+        return FinancialPanel.open(cache_dir)
+    except (OSError, ValueError):
+        return panel
+
+
+def _swap_cache(staging, cache_dir):
+    """
+    Atomically move a freshly written cache into place
+    
+    The old cache is first renamed away (readers holding its mapped files
+    keep working) and deleted only after the swap. When a concurrent
+    rebuild swaps in first, its cache is kept and ours left for the caller
+    to discard.
+    
+    Returns:
+        True if staging became cache_dir, False if another rebuild won
+    """
+    retired = f'{staging}.old'
+    try:
+        os.replace(cache_dir, retired)
+    except FileNotFoundError:
+        retired = None
+    try:
+        os.replace(staging, cache_dir)
+        return True
+    except OSError:
+        # cache_dir was recreated (non-empty) by another rebuild meanwhile
+        return False
+    finally:
+        if retired is not None:
+            shutil.rmtree(retired, ignore_errors=True)
+
+
+def load_universe_frame(frame):
+    """
+    Build a FinancialPanel from a long DataFrame
+    
+    Expected columns:
+        ticker, period ('historical' / 'projected'), year,
+        revenue, ebit, net_income, ocf, total_assets, equity, cash,
+        plus per-ticker fields repeated on every row of that ticker:
+        company_name, sector, current_price, shares_outstanding, market_cap,
+        lifecycle, porter, management, esg, model_tp, relative_val,
+        revenue_growth, ebit_growth, np_growth, nominal_gdp, real_gdp
+    
+    The valuation price defaults to current_price; a separate
+    valuation_current_price column overrides it.
+    
+    Args:
+        frame: pandas DataFrame
+    
+    Returns:
+        FinancialPanel
+    """
+    # Keep tickers in order of first appearance, years ascending
+    ticker_codes, tickers = frame['ticker'].factorize()
+    frame = frame.assign(_ticker_code=ticker_codes)
+    frame = frame.sort_values(['_ticker_code', 'year'], kind='stable')
+    n = len(tickers)
+    
+    blocks = {}
+    years = {}
+    for period in PERIODS:
+        rows = frame[frame['period'] == period]
+        counts = np.bincount(rows['_ticker_code'].to_numpy(), minlength=n)
+        if n and (counts != counts[0]).any():
+            raise ValueError(
+                f"All tickers need the same number of {period} years, "
+                f"got {sorted(set(counts.tolist()))}"
+            )
+        width = int(counts[0]) if n else 0
+        blocks[period] = rows[list(FinancialPanel.METRICS)].to_numpy(
+            dtype=np.float64
+        ).reshape(n, width, len(FinancialPanel.METRICS))
+        years[period] = rows['year'].to_numpy(dtype=np.int64).reshape(n, width)
+    
+    first = frame.drop_duplicates('_ticker_code')
+    
+    sections = {}
+    for section, fields in FinancialPanel.SECTIONS.items():
+        columns = {}
+        for field in fields:
+            column = field
+            if section == 'valuation_data' and field == 'current_price':
+                if 'valuation_current_price' in first:
+                    column = 'valuation_current_price'
+            if column in first:
+                columns[field] = first[column].to_numpy(dtype=np.float64)
+        if len(columns) == len(fields):
+            sections[section] = columns
+    
+    info = {
+        field: first[field].to_numpy()
+        for field in FinancialPanel.INFO_TEXT + FinancialPanel.INFO_NUMERIC
+        if field in first
+    }
+    
+    return FinancialPanel(
+        np.asarray(tickers, dtype=str),
+        blocks['historical'],
+        blocks['projected'],
+        historical_years=years['historical'],
+        projected_years=years['projected'],
+        sections=sections,
+        info=info
+    )
+
+
+def iter_universe_json(path, buffer_size=1 << 20):
+    """
+    Stream (ticker, record) pairs from a universe JSON file
+    
+    The file is read in buffer_size pieces and decoded one record at a time,
+    so memory stays at roughly one buffer plus one record regardless of the
+    number of tickers. While one entry keeps failing to decode, each refill
+    doubles, so a record much larger than buffer_size is re-decoded only
+    O(log(record / buffer_size)) times instead of once per buffer_size.
+    
+    Args:
+        path: JSON file with the schema of data/sample_data.json
+        buffer_size: characters read per refill (initially, see above)
+    
+    Yields:
+        (ticker, record) in file order
+    """
+    decoder = json.JSONDecoder()
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer, pos, eof = '', 0, False
+        started = False
+        read_size, stalled = buffer_size, False
+        
+        while True:
+            # Positions advance on p and are only committed once a full
+            # entry is decoded; on a partial entry the buffer is refilled
+            # and the entry is decoded again from pos.
+            try:
+                p = _WHITESPACE.match(buffer, pos).end()
+                if not started:
+                    if buffer[p] != '{':
+                        raise ValueError(f"{path}: universe JSON must be an object")
+                    started = True
+                    pos, stalled = p + 1, False
+                    continue
+                
+                if buffer[p] == '}':
+                    return
+                if buffer[p] == ',':
+                    p = _WHITESPACE.match(buffer, p + 1).end()
+                
+                ticker, p = decoder.raw_decode(buffer, p)
+                p = _WHITESPACE.match(buffer, p).end()
+                if buffer[p] != ':':
+                    raise ValueError(f"{path}: expected ':' after {ticker!r}")
+                p = _WHITESPACE.match(buffer, p + 1).end()
+                record, p = decoder.raw_decode(buffer, p)
+            except (json.JSONDecodeError, IndexError):
+                if eof:
+                    raise ValueError(f"{path}: truncated or invalid universe JSON")
+                # No entry decoded since the last refill: the entry is larger
+                # than what we read, so read geometrically more
+                read_size = read_size * 2 if stalled else buffer_size
+                chunk = f.read(read_size)
+                eof = not chunk
+                buffer, pos, stalled = buffer[pos:] + chunk, 0, True
+                continue
+            
+            pos, stalled = p, False
+            yield ticker, record
+
+
+def iter_universe_chunks(path, chunk_size=1000, progress=None):
+    """
+    Stream a universe JSON file as fixed-size FinancialPanel chunks
+    
+    Args:
+        path: JSON file with the schema of data/sample_data.json
+        chunk_size: tickers per panel
+        progress: optional callback(stats) after every chunk, stats being a
+                  dict with keys [tickers, elapsed, tickers_per_s]
+    
+    Yields:
+        FinancialPanel with at most chunk_size tickers
+    """
+    start = time.perf_counter()
+    loaded = 0
+    tickers, records = [], []
+    
+    def flush():
+        nonlocal loaded
+        panel = FinancialPanel.from_records(tickers, records)
+        loaded += len(tickers)
+        tickers.clear()
+        records.clear()
+        if progress is not None:
+            elapsed = time.perf_counter() - start
+            progress({
+                'tickers': loaded,
+                'elapsed': elapsed,
+                'tickers_per_s': loaded / elapsed if elapsed > 0 else float('inf')
+            })
+        return panel
+    
+    for ticker, record in iter_universe_json(path):
+        tickers.append(ticker)
+        records.append(record)
+        if len(tickers) >= chunk_size:
+            yield flush()
+    if tickers:
+        yield flush()
@@ -0,0 +1,324 @@
+"""
+Financial Panel Module
+Menyimpan data keuangan banyak saham dalam array NumPy (ticker x year x metric)
+"""
+
+import json
+import os
+
+import numpy as np
+
+class FinancialPanel:
+    """Panel data keuangan kolumnar untuk scoring banyak saham sekaligus"""
+    
+    # Financial metrics per year, in the order of the last panel axis
+    METRICS = ('revenue', 'ebit', 'net_income', 'ocf', 'total_assets', 'equity', 'cash')
+    
+    # Ratio name -> (numerator, denominator), as used by the VC/FP scorers
+    RATIOS = {
+        'roa': ('net_income', 'total_assets'),
+        'ebit_margin': ('ebit', 'revenue'),
+        'ocf_ebit': ('ocf', 'ebit'),
+        'equity_asset': ('equity', 'total_assets'),
+        'cash_asset': ('cash', 'total_assets')
+    }
+    
+    # Per-ticker scalar inputs, grouped like the sections of sample_data.json
+    SECTIONS = {
+        'vcs_data': ('lifecycle', 'porter', 'management', 'esg'),
+        'valuation_data': ('model_tp', 'relative_val', 'current_price'),
+        'growth_data': ('revenue_growth', 'ebit_growth', 'np_growth'),
+        'macro_data': ('nominal_gdp', 'real_gdp')
+    }
+    
+    INFO_TEXT = ('company_name', 'sector')
+    INFO_NUMERIC = ('current_price', 'shares_outstanding', 'market_cap')
+    
+    def __init__(self, tickers, historical, projected, historical_years=None,
+                 projected_years=None, sections=None, info=None):
+        """
+        Initialize panel
+        
+        Args:
+            tickers: sequence of N ticker symbols
+            historical: array (N, H, len(METRICS)) of historical financials
+            projected: array (N, P, len(METRICS)) of projected financials
+            historical_years: optional int array (N, H), 0 = unknown year
+            projected_years: optional int array (N, P), 0 = unknown year
+            sections: optional dict {section: {field: array (N,)}}
+            info: optional dict {field: array (N,)} from company_info
+        """
+        self.tickers = np.asarray(tickers, dtype=str)
+        self.historical = np.ascontiguousarray(historical, dtype=np.float64)
+        self.projected = np.ascontiguousarray(projected, dtype=np.float64)
+        
+        n = len(self.tickers)
+        for name, block in (('historical', self.historical),
+                            ('projected', self.projected)):
+            if block.ndim != 3 or block.shape[0] != n or block.shape[2] != len(self.METRICS):
+                raise ValueError(
+                    f"{name} must have shape ({n}, years, {len(self.METRICS)}), "
+                    f"got {block.shape}"
+                )
+        
+        if historical_years is None:
+            historical_years = np.zeros(self.historical.shape[:2], dtype=np.int64)
+        if projected_years is None:
+            projected_years = np.zeros(self.projected.shape[:2], dtype=np.int64)
+        self.historical_years = np.asarray(historical_years, dtype=np.int64)
+        self.projected_years = np.asarray(projected_years, dtype=np.int64)
+        
+        self.sections = {
+            section: {
+                field: np.asarray(values, dtype=np.float64)
+                for field, values in fields.items()
+            }
+            for section, fields in (sections or {}).items()
+        }
+        self.info = {
+            field: np.asarray(values, dtype=str if field in self.INFO_TEXT else np.float64)
+            for field, values in (info or {}).items()
+        }
+    
+    # ==================== CONSTRUCTORS ====================
+    
+    @classmethod
+    def from_universe(cls, universe):
+        """
+        Build panel from a universe dict (schema of data/sample_data.json)
+        
+        Args:
+            universe: dict {ticker: record} with keys [company_info, vcs_data,
+                      historical_data, projected_data, valuation_data,
+                      growth_data, macro_data]
+        
+        Returns:
+            FinancialPanel
+        """
+        return cls.from_records(list(universe.keys()), list(universe.values()))
+    
+    @classmethod
+    def from_records(cls, tickers, records):
+        """Build panel from parallel lists of tickers and stock records"""
+        def block(period):
+            years = {len(record[period]) for record in records}
+            if len(years) > 1:
+                raise ValueError(
+                    f"All tickers need the same number of {period} years, got {sorted(years)}"
+                )
+            return np.array([
+                [[row[metric] for metric in cls.METRICS] for row in record[period]]
+                for record in records
+            ], dtype=np.float64).reshape(len(records), years.pop() if years else 0,
+                                         len(cls.METRICS))
+        
+        def years(period):
+            return np.array([
+                [row.get('year', 0) for row in record[period]]
+                for record in records
+            ], dtype=np.int64).reshape(len(records), -1)
+        
+        sections = {
+            section: {
+                field: [record[section][field] for record in records]
+                for field in fields
+            }
+            for section, fields in cls.SECTIONS.items()
+            if all(section in record for record in records)
+        }
+        
+        info = {}
+        if all('company_info' in record for record in records):
+            for field in cls.INFO_TEXT + cls.INFO_NUMERIC:
+                if all(field in record['company_info'] for record in records):
+                    info[field] = [record['company_info'][field] for record in records]
+        
+        return cls(
+            tickers,
+            block('historical_data'),
+            block('projected_data'),
+            historical_years=years('historical_data'),
+            projected_years=years('projected_data'),
+            sections=sections,
+            info=info
+        )
+    
+    # ==================== BINARY FORMAT ====================
+    
+    # Bumped whenever the on-disk layout written by save() changes
+    BINARY_VERSION = 1
+    
+    def save(self, directory, meta=None):
+        """
+        Write the panel as one .npy file per array plus meta.json
+        
+        Args:
+            directory: target directory (created if missing)
+            meta: optional extra JSON-serializable metadata
+        """
+        os.makedirs(directory, exist_ok=True)
+        arrays = {
+            'tickers': self.tickers,
+            'historical': self.historical,
+            'projected': self.projected,
+            'historical_years': self.historical_years,
+            'projected_years': self.projected_years
+        }
+        for section, fields in self.sections.items():
+            for field, values in fields.items():
+                arrays[f'{section}.{field}'] = values
+        for field, values in self.info.items():
+            arrays[f'info.{field}'] = values
+        
+        for name, values in arrays.items():
+            np.save(os.path.join(directory, f'{name}.npy'), np.ascontiguousarray(values))
+        
+        with open(os.path.join(directory, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.BINARY_VERSION,
+                'arrays': list(arrays),
+                'meta': meta or {}
+            }, f)
+    
+    @classmethod
+    def open(cls, directory, mmap=True):
+        """
+        Load a panel written by save()
+        
+        Args:
+            directory: directory written by save()
+            mmap: memory-map the arrays read-only instead of reading them
+        
+        Returns:
+            FinancialPanel whose arrays are views on the mapped files
+        """
+        with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+            layout = json.load(f)
+        if layout.get('version') != cls.BINARY_VERSION:
+            raise ValueError(f"{directory}: unsupported panel format {layout.get('version')!r}")
+        
+        mode = 'r' if mmap else None
+        arrays = {
+            name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mode)
+            for name in layout['arrays']
+        }
+        
+        sections, info = {}, {}
+        for name, values in arrays.items():
+            prefix, _, field = name.partition('.')
+            if prefix == 'info':
+                info[field] = values
+            elif field:
+                sections.setdefault(prefix, {})[field] = values
+        
+        return cls(
+            arrays['tickers'],
+            arrays['historical'],
+            arrays['projected'],
+            historical_years=arrays['historical_years'],
+            projected_years=arrays['projected_years'],
+            sections=sections,
+            info=info
+        )
+    
+    # ==================== ACCESSORS ====================
+    
+    def __len__(self):
+        return len(self.tickers)
+    
+    def _block(self, period):
+        if period == 'historical':
+            return self.historical
+        elif period == 'projected':
+            return self.projected
+        raise ValueError(f"period must be 'historical' or 'projected', got {period!r}")
+    
+    def metric(self, name, period='historical'):
+        """Return (N, years) view of one financial metric"""
+        return self._block(period)[:, :, self.METRICS.index(name)]
+    
+    def ratio(self, name, period='historical'):
+        """Return (N, years) values of one ratio from RATIOS"""
+        numerator, denominator = self.RATIOS[name]
+        return self.metric(numerator, period) / self.metric(denominator, period)
+    
+    def ratio_averages(self, period='historical', names=None):
+        """
+        Average every ratio over the years of one period in a single pass
+        
+        Args:
+            period: 'historical' or 'projected'
+            names: ratio names (default: all of RATIOS)
+        
+        Returns:
+            dict {ratio name: array (N,)}
+        """
+        names = list(names or self.RATIOS)
+        block = self._block(period)
+        num_idx = [self.METRICS.index(self.RATIOS[name][0]) for name in names]
+        den_idx = [self.METRICS.index(self.RATIOS[name][1]) for name in names]
+        
+        # (N, years, R) / (N, years, R), then mean over years
+        averages = (block[:, :, num_idx] / block[:, :, den_idx]).mean(axis=1)
+        return dict(zip(names, averages.T))
+    
+    def growth(self, name, period='historical'):
+        """Return (N, years - 1) year-over-year growth of one metric"""
+        values = self.metric(name, period)
+        return values[:, 1:] / values[:, :-1] - 1
+    
+    def section(self, name):
+        """Return one scalar section (e.g. 'vcs_data') as dict of arrays"""
+        return self.sections[name]
+    
+    def take(self, indices):
+        """
+        Select a subset of tickers
+        
+        Args:
+            indices: integer index array, boolean mask or slice
+        
+        Returns:
+            new FinancialPanel with the selected rows
+        """
+        return FinancialPanel(
+            self.tickers[indices],
+            self.historical[indices],
+            self.projected[indices],
+            historical_years=self.historical_years[indices],
+            projected_years=self.projected_years[indices],
+            sections={
+                section: {field: values[indices] for field, values in fields.items()}
+                for section, fields in self.sections.items()
+            },
+            info={field: values[indices] for field, values in self.info.items()}
+        )
+    
+    def record(self, index):
+        """
+        Rebuild the dict record of one ticker (schema of sample_data.json)
+        
+        Args:
+            index: row position in the panel
+        
+        Returns:
+            dict usable by the scalar QuadrantCalculator methods
+        """
+        def rows(block, years):
+            result = []
+            for year, values in zip(years[index], block[index]):
+                row = {'year': int(year)} if year else {}
+                row.update(zip(self.METRICS, values.tolist()))
+                result.append(row)
+            return result
+        
+        record = {
+            'company_info': {'ticker': str(self.tickers[index])},
+            'historical_data': rows(self.historical, self.historical_years),
+            'projected_data': rows(self.projected, self.projected_years)
+        }
+        for field, values in self.info.items():
+            record['company_info'][field] = values[index].item()
+        for section, fields in self.sections.items():
+            record[section] = {field: values[index].item() for field, values in fields.items()}
+        return record
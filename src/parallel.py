@@ -0,0 +1,250 @@
+"""
+Parallel Executor Module
+Scoring universe besar dan banyak skenario secara paralel dengan process pool
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .calculator import QuadrantCalculator
+from .classifier import QuadrantClassifier
+from .panel import FinancialPanel
+from .pipeline import QuadrantPipeline
+
+# Panel attached by each worker process (see _init_worker)
+_WORKER_PANEL = None
+_WORKER_SEGMENTS = []
+
+
+class SharedPanel:
+    """
+    Copy of a FinancialPanel placed in shared memory
+    
+    Workers rebuild the panel as zero-copy views on the shared segments, so
+    the arrays are never pickled per task. Use as a context manager; the
+    segments are unlinked on exit.
+    """
+    
+    def __init__(self, panel):
+        self.segments = []
+        self.spec = {
+            'tickers': self._share(panel.tickers),
+            'historical': self._share(panel.historical),
+            'projected': self._share(panel.projected),
+            'historical_years': self._share(panel.historical_years),
+            'projected_years': self._share(panel.projected_years),
+            'sections': {
+                section: {field: self._share(values) for field, values in fields.items()}
+                for section, fields in panel.sections.items()
+            },
+            'info': {field: self._share(values) for field, values in panel.info.items()}
+        }
+    
+    def _share(self, array):
+        array = np.ascontiguousarray(array)
+        segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+        self.segments.append(segment)
+        return (segment.name, array.shape, array.dtype.str)
+    
+    def close(self):
+        """Release and unlink all shared segments"""
+        for segment in self.segments:
+            segment.close()
+            segment.unlink()
+        self.segments = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @staticmethod
+    def attach(spec, segments):
+        """
+        Rebuild a FinancialPanel from a spec, viewing the shared segments
+        
+        Args:
+            spec: SharedPanel.spec
+            segments: list that receives the attached SharedMemory objects
+                      (they must stay referenced while the panel is used)
+        
+        Returns:
+            FinancialPanel backed by shared memory
+        """
+        def view(entry):
+            name, shape, dtype = entry
+            segment = shared_memory.SharedMemory(name=name)
+            segments.append(segment)
+            return np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+        
+        return FinancialPanel(
+            view(spec['tickers']),
+            view(spec['historical']),
+            view(spec['projected']),
+            historical_years=view(spec['historical_years']),
+            projected_years=view(spec['projected_years']),
+            sections={
+                section: {field: view(entry) for field, entry in fields.items()}
+                for section, fields in spec['sections'].items()
+            },
+            info={field: view(entry) for field, entry in spec['info'].items()}
+        )
+
+
+def build_pipeline(scenario=None):
+    """
+    Build a QuadrantPipeline for one scenario
+    
+    Args:
+        scenario: optional dict with keys [cs_weights, ss_weights, threshold]
+    
+    Returns:
+        QuadrantPipeline
+    """
+    scenario = scenario or {}
+    calculator = QuadrantCalculator()
+    calculator.cs_weights.update(scenario.get('cs_weights', {}))
+    calculator.ss_weights.update(scenario.get('ss_weights', {}))
+    classifier = QuadrantClassifier(threshold=scenario.get('threshold', 3.0))
+    return QuadrantPipeline(calculator, classifier)
+
+
+def concat_results(parts):
+    """Concatenate result dicts of consecutive ticker slices, in order"""
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+def _init_worker(spec):
+    global _WORKER_PANEL
+    _WORKER_PANEL = SharedPanel.attach(spec, _WORKER_SEGMENTS)
+
+
+def _score_task(task):
+    scenario, start, stop = task
+    return build_pipeline(scenario).score(_WORKER_PANEL.take(slice(start, stop)))
+
+
+class ParallelScorer:
+    """Executor paralel di atas QuadrantCalculator dan QuadrantClassifier"""
+    
+    def __init__(self, workers=None, chunk_size=None):
+        """
+        Initialize executor
+        
+        Args:
+            workers: number of worker processes (default: os.cpu_count())
+            chunk_size: tickers per task (default: split each scenario so
+                        every worker gets about two tasks)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+    
+    def _tasks(self, n, scenarios):
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunks_per_scenario = max(1, math.ceil(2 * self.workers / len(scenarios)))
+            chunk_size = max(1, math.ceil(n / chunks_per_scenario))
+        
+        tasks = []
+        for scenario in scenarios:
+            tasks.append([
+                (scenario, start, min(start + chunk_size, n))
+                for start in range(0, n, chunk_size)
+            ])
+        return tasks
+    
+    def score(self, panel, scenario=None):
+        """
+        Score a panel in parallel
+        
+        Args:
+            panel: FinancialPanel
+            scenario: optional dict with keys [cs_weights, ss_weights, threshold]
+        
+        Returns:
+            dict of result columns, identical to QuadrantPipeline.score()
+        """
+        return self.score_scenarios(panel, [scenario or {}])[0]
+    
+    def score_scenarios(self, panel, scenarios):
+        """
+        Score a panel under several scenarios in parallel
+        
+        Tickers and scenarios are sharded across the pool. Each task scores a
+        contiguous ticker slice, and slices are concatenated back in order, so
+        results are deterministic and equal to the serial path.
+        
+        Args:
+            panel: FinancialPanel
+            scenarios: list of dicts with keys [cs_weights, ss_weights, threshold]
+        
+        Returns:
+            list of result dicts, one per scenario
+        """
+        scenarios = list(scenarios)
+        if not scenarios:
+            return []
+        if len(panel) == 0 or self.workers == 1:
+            return [build_pipeline(scenario).score(panel) for scenario in scenarios]
+        
+        tasks = self._tasks(len(panel), scenarios)
+        flat = [task for scenario_tasks in tasks for task in scenario_tasks]
+        
+        with SharedPanel(panel) as shared:
+            with ProcessPoolExecutor(max_workers=self.workers,
+                                     initializer=_init_worker,
+                                     initargs=(shared.spec,)) as executor:
+                parts = list(executor.map(_score_task, flat))
+        
+        results = []
+        offset = 0
+        for scenario_tasks in tasks:
+            results.append(concat_results(parts[offset:offset + len(scenario_tasks)]))
+            offset += len(scenario_tasks)
+        return results
+    
+    def benchmark(self, panel, scenarios=None):
+        """
+        Compare serial and parallel scoring of the same workload
+        
+        Args:
+            panel: FinancialPanel
+            scenarios: list of scenario dicts (default: one default scenario)
+        
+        Returns:
+            dict with serial/parallel wall time, speedup, workers and whether
+            both paths produced identical results
+        """
+        scenarios = list(scenarios or [{}])
+        
+        start = time.perf_counter()
+        serial = [build_pipeline(scenario).score(panel) for scenario in scenarios]
+        serial_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        parallel = self.score_scenarios(panel, scenarios)
+        parallel_time = time.perf_counter() - start
+        
+        identical = all(
+            a.keys() == b.keys() and all(
+                np.array_equal(a[k], b[k], equal_nan=a[k].dtype.kind == 'f') for k in a
+            )
+            for a, b in zip(serial, parallel)
+        )
+        
+        return {
+            'workers': self.workers,
+            'tickers': len(panel),
+            'scenarios': len(scenarios),
+            'serial_time': serial_time,
+            'parallel_time': parallel_time,
+            'speedup': serial_time / parallel_time if parallel_time > 0 else float('inf'),
+            'identical': identical
+        }
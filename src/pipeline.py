@@ -0,0 +1,234 @@
+"""
+Batch Pipeline Module
+Menjalankan CS -> SS -> classify -> recommendation untuk satu universe sekaligus
+"""
+
+import numpy as np
+
+from .calculator import QuadrantCalculator
+from .classifier import QuadrantClassifier
+
+class QuadrantPipeline:
+    """Pipeline scoring kolumnar untuk seluruh universe saham"""
+    
+    # Columns holding int8 codes, decoded through the classifier name tuples
+    CODE_COLUMNS = {
+        'quadrant': 'QUADRANT_NAMES',
+        'strength': 'STRENGTH_NAMES',
+        'rating': 'RATING_NAMES'
+    }
+    
+    def __init__(self, calculator=None, classifier=None, sector_normalizer=None):
+        """
+        Initialize pipeline
+        
+        Args:
+            calculator: QuadrantCalculator (default: new instance)
+            classifier: QuadrantClassifier (default: new instance, threshold 3.0)
+            sector_normalizer: optional SectorNormalizer; when given, VC, FP and
+                growth components are scored relative to the ticker's sector
+                instead of against the absolute breakpoints
+        """
+        self.calculator = calculator or QuadrantCalculator()
+        self.classifier = classifier or QuadrantClassifier()
+        self.sector_normalizer = sector_normalizer
+    
+    def score(self, panel):
+        """
+        Score every ticker of a FinancialPanel
+        
+        Args:
+            panel: FinancialPanel with vcs/valuation/growth/macro sections
+        
+        Returns:
+            dict of equal-length numpy arrays, one entry per result column
+        """
+        calc = self.calculator
+        
+        if self.sector_normalizer is not None:
+            return self.classify(panel, *self._score_sector_relative(panel))
+        
+        vc_data = calc.calculate_vc_scores_batch(panel)
+        fp_data = calc.calculate_fp_scores_batch(panel)
+        cs_result = calc.calculate_company_score_batch(
+            panel.section('vcs_data'), vc_data, fp_data
+        )
+        ss_result = calc.calculate_stock_score_batch(
+            panel.section('valuation_data'), panel.section('growth_data')
+        )
+        
+        return self.classify(panel, cs_result, ss_result)
+    
+    def _score_sector_relative(self, panel):
+        """CS/SS with sector-relative VC, FP and growth scores; valuation stays absolute"""
+        calc = self.calculator
+        vc_data, fp_data, growth_score = self.sector_normalizer.score_panel(panel)
+        cs_result = calc.calculate_company_score_batch(
+            panel.section('vcs_data'), vc_data, fp_data
+        )
+        
+        valuation = panel.section('valuation_data')
+        valuation_score = calc.calculate_valuation_score_batch(
+            valuation['model_tp'], valuation['relative_val'], valuation['current_price']
+        )
+        ss_result = calc.combine_stock_score_batch(valuation_score, growth_score)
+        return cs_result, ss_result
+    
+    def classify(self, panel, cs_result, ss_result):
+        """
+        Classify and recommend from batch CS/SS results
+        
+        Args:
+            panel: FinancialPanel the scores were computed from
+            cs_result: dict from calculate_company_score_batch()
+            ss_result: dict from calculate_stock_score_batch()
+        
+        Returns:
+            dict of result columns (see score())
+        """
+        classifier = self.classifier
+        batch = classifier.classify_batch(
+            cs_result['company_score'], ss_result['stock_score']
+        )
+        
+        # Recommendation uses the company_info price, like app.py does
+        current_price = panel.info.get(
+            'current_price', panel.section('valuation_data')['current_price']
+        )
+        recommendation = classifier.get_investment_recommendation_batch(
+            batch, ss_result['blended_tp'], current_price
+        )
+        
+        return self.assemble(panel, cs_result, ss_result, batch, recommendation)
+    
+    def assemble(self, panel, cs_result, ss_result, batch, recommendation):
+        """
+        Flatten batch CS/SS/classification/recommendation dicts into result columns
+        
+        Args:
+            panel: FinancialPanel providing tickers and company info
+            cs_result: dict from calculate_company_score_batch()
+            ss_result: dict from calculate_stock_score_batch()
+            batch: dict from classify_batch()
+            recommendation: dict from get_investment_recommendation_batch()
+        
+        Returns:
+            dict of result columns (see score())
+        """
+        results = {'ticker': panel.tickers}
+        for field in ('company_name', 'sector'):
+            if field in panel.info:
+                results[field] = panel.info[field]
+        
+        for key in ('company_score', 'vcs_score', 'vc_score', 'fp_score',
+                    'vcs_weighted', 'vc_weighted', 'fp_weighted'):
+            results[key] = cs_result[key]
+        for component in ('vcs', 'vc', 'fp'):
+            results.update(cs_result['breakdown'][component])
+        
+        for key in ('stock_score', 'valuation_score', 'growth_score',
+                    'valuation_weighted', 'growth_weighted', 'blended_tp', 'upside'):
+            results[key] = ss_result[key]
+        growth = ss_result['breakdown']['growth']
+        for key in ('revenue_score', 'ebit_score', 'np_score'):
+            results[key] = growth[key]
+        
+        results['quadrant'] = batch['quadrant']
+        results['strength'] = batch['strength']
+        results['cs_distance'] = batch['cs_distance']
+        results['ss_distance'] = batch['ss_distance']
+        results['rating'] = recommendation['rating']
+        results['priority'] = recommendation['priority']
+        results['target_price'] = recommendation['target_price']
+        results['current_price'] = recommendation['current_price']
+        results['recommendation_upside'] = recommendation['upside']
+        results['risk_flags'] = recommendation['risk_flags']
+        
+        return results
+    
+    def quadrant_counts(self, results):
+        """Return {quadrant name: count} for a score() result"""
+        counts = np.bincount(results['quadrant'], minlength=len(self.classifier.QUADRANT_NAMES))
+        return dict(zip(self.classifier.QUADRANT_NAMES, counts.tolist()))
+    
+    def matrix_data(self, results):
+        """Columnar input for QuadrantVisualizer.create_quadrant_matrix()"""
+        return {
+            'ticker': results['ticker'],
+            'cs': results['company_score'],
+            'ss': results['stock_score'],
+            'quadrant': results['quadrant']
+        }
+    
+    def comparison_data(self, results, top=None):
+        """
+        Rows for QuadrantVisualizer.create_comparison_chart(), ranked like
+        QuadrantClassifier.compare_stocks() (priority, then highest upside)
+        
+        Args:
+            results: dict from score()
+            top: optional number of leading rows to keep
+        
+        Returns:
+            list of dicts with keys [ticker, company_score, stock_score,
+            quadrant, rating, priority, upside]
+        """
+        classifier = self.classifier
+        order = np.lexsort((-results['recommendation_upside'], results['priority']))
+        if top is not None:
+            order = order[:top]
+        
+        quadrants = np.array(classifier.QUADRANT_NAMES, dtype=object)
+        ratings = np.array(classifier.RATING_NAMES, dtype=object)
+        columns = {
+            'ticker': results['ticker'][order].tolist(),
+            'company_score': results['company_score'][order].tolist(),
+            'stock_score': results['stock_score'][order].tolist(),
+            'quadrant': quadrants[results['quadrant'][order]].tolist(),
+            'rating': ratings[results['rating'][order]].tolist(),
+            'priority': results['priority'][order].tolist(),
+            'upside': results['recommendation_upside'][order].tolist()
+        }
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+    
+    def to_records(self, results):
+        """
+        Convert columnar results into row dicts with readable labels
+        
+        Args:
+            results: dict from score()
+        
+        Returns:
+            list of dicts (one per ticker), codes decoded to names and the
+            position sizing / time horizon / risk factors spelled out
+        """
+        classifier = self.classifier
+        columns = {}
+        for key, values in results.items():
+            if key in self.CODE_COLUMNS:
+                names = np.array(getattr(classifier, self.CODE_COLUMNS[key]), dtype=object)
+                columns[key] = names[values].tolist()
+            elif key == 'risk_flags':
+                continue
+            else:
+                columns[key] = values.tolist()
+        
+        risk_factors = [
+            '; '.join(
+                factor for bit, factor in enumerate(classifier.RISK_FACTORS)
+                if flags & (1 << bit)
+            ) or 'Minimal risk factors'
+            for flags in results['risk_flags'].tolist()
+        ]
+        
+        keys = list(columns)
+        records = []
+        for i, row in enumerate(zip(*columns.values())):
+            record = dict(zip(keys, row))
+            record['position_sizing'] = classifier._get_position_sizing(
+                record['quadrant'], record['strength']
+            )
+            record['time_horizon'] = classifier._get_time_horizon(record['quadrant'])
+            record['risk_factors'] = risk_factors[i]
+            records.append(record)
+        return records
@@ -0,0 +1,292 @@
+"""
+Ranking Module
+Ranking saham yang dipelihara secara inkremental (urutan compare_stocks)
+"""
+
+import random
+from itertools import islice
+
+import numpy as np
+
+from .classifier import QuadrantClassifier
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+    
+    def __init__(self, key, level):
+        self.key = key
+        self.next = [None] * level
+        # width[i]: bottom-level steps from this node to next[i] (to the end
+        # of the list plus one when next[i] is None)
+        self.width = [0] * level
+
+
+class SkipList:
+    """
+    Indexable skip list: keys kept sorted with O(log n) expected insert,
+    remove and rank
+    
+    Every link stores how many keys it skips, so the position of a key is
+    the sum of the link widths followed while searching for it.
+    """
+    
+    MAX_LEVEL = 32
+    
+    def __init__(self, keys=()):
+        """
+        Args:
+            keys: initial keys, unique and already sorted (built in O(n))
+        """
+        self._random = random.Random(0)
+        self._head = _Node(None, self.MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        
+        last = [self._head] * self.MAX_LEVEL
+        last_position = [0] * self.MAX_LEVEL
+        for position, key in enumerate(keys, 1):
+            node = _Node(key, self._random_level())
+            for level in range(len(node.next)):
+                last[level].next[level] = node
+                last[level].width[level] = position - last_position[level]
+                last[level], last_position[level] = node, position
+            self._level = max(self._level, len(node.next))
+            self._size = position
+        for level in range(self._level):
+            last[level].width[level] = self._size + 1 - last_position[level]
+    
+    def __len__(self):
+        return self._size
+    
+    def __iter__(self):
+        node = self._head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+    
+    def _random_level(self):
+        """1 + number of trailing one bits: level l with probability 2**-l"""
+        bits = self._random.getrandbits(self.MAX_LEVEL - 1)
+        return (~bits & (bits + 1)).bit_length()
+    
+    def _search(self, key):
+        """Last node before key on every level, and the steps taken per level"""
+        chain = [self._head] * self.MAX_LEVEL
+        steps = [0] * self.MAX_LEVEL
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                steps[level] += node.width[level]
+                node = following
+                following = node.next[level]
+            chain[level] = node
+        return chain, steps
+    
+    def insert(self, key):
+        """Add a key (must not be present yet)"""
+        chain, steps = self._search(key)
+        level = self._random_level()
+        for new_level in range(self._level, level):
+            # Levels used for the first time: the head spans the whole list
+            self._head.width[new_level] = self._size + 1
+        self._level = max(self._level, level)
+        
+        node = _Node(key, level)
+        skipped = 0
+        for i in range(level):
+            previous = chain[i]
+            node.next[i] = previous.next[i]
+            previous.next[i] = node
+            node.width[i] = previous.width[i] - skipped
+            previous.width[i] = skipped + 1
+            skipped += steps[i]
+        for i in range(level, self._level):
+            chain[i].width[i] += 1
+        self._size += 1
+    
+    def remove(self, key):
+        """
+        Remove a key
+        
+        Raises:
+            KeyError: if the key is not present
+        """
+        chain, _ = self._search(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        for i in range(len(node.next)):
+            chain[i].width[i] += node.width[i] - 1
+            chain[i].next[i] = node.next[i]
+        for i in range(len(node.next), self._level):
+            chain[i].width[i] -= 1
+        self._size -= 1
+    
+    def rank(self, key):
+        """Number of keys smaller than key (bisect_left on the sorted keys)"""
+        position = 0
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+        return position
+    
+    def head(self, k):
+        """The k smallest keys, in order"""
+        return list(islice(self, k))
+
+
+class StockRanking:
+    """
+    Ranking terurut (priority, -upside) dengan update per ticker dan query top-k
+    
+    Entries are kept in a SkipList of keys (priority, -upside, seq), where
+    seq is the order in which a ticker was first added; it breaks ties the
+    same way the stable sort in compare_stocks() does. update(), remove()
+    and rank() are O(log n) expected, top(k) is O(k).
+    """
+    
+    def __init__(self, classifier=None):
+        """
+        Args:
+            classifier: QuadrantClassifier (default: threshold 3.0)
+        """
+        self.classifier = classifier or QuadrantClassifier()
+        self.keys = SkipList()   # sorted (priority, -upside, seq)
+        self.entries = {}     # ticker -> (key, company_score, stock_score, quadrant, rating)
+        self.tickers = {}     # seq -> ticker
+        self._next_seq = 0
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def __contains__(self, ticker):
+        return ticker in self.entries
+    
+    @staticmethod
+    def _key(priority, upside, seq):
+        # NaN upside (e.g. zero price) ranks last within its priority
+        return (priority, -upside if upside == upside else float('inf'), seq)
+    
+    # ==================== BULK ====================
+    
+    def load(self, tickers, company_score, stock_score, target_price, current_price):
+        """
+        Rank a whole universe at once through the vectorized classifier
+        
+        Replaces the current contents.
+        
+        Args:
+            tickers: ticker symbols
+            company_score, stock_score, target_price, current_price: arrays
+        """
+        classifier = self.classifier
+        batch = classifier.classify_batch(company_score, stock_score)
+        recommendation = classifier.get_investment_recommendation_batch(
+            batch, target_price, current_price
+        )
+        self._load_arrays(
+            np.asarray(tickers, dtype=str), batch['company_score'], batch['stock_score'],
+            batch['quadrant'], recommendation['rating'], recommendation['priority'],
+            recommendation['upside']
+        )
+    
+    def load_results(self, results):
+        """Rank a QuadrantPipeline.score() result without reclassifying"""
+        self._load_arrays(
+            results['ticker'], results['company_score'], results['stock_score'],
+            results['quadrant'], results['rating'], results['priority'],
+            results['recommendation_upside']
+        )
+    
+    def _load_arrays(self, tickers, cs, ss, quadrant, rating, priority, upside):
+        n = len(tickers)
+        sort_upside = np.where(np.isnan(upside), -np.inf, upside)
+        order = np.lexsort((np.arange(n), -sort_upside, priority))
+        
+        tickers = tickers.tolist()
+        priority, upside = priority.tolist(), upside.tolist()
+        cs, ss = cs.tolist(), ss.tolist()
+        quadrant, rating = quadrant.tolist(), rating.tolist()
+        
+        keys = [self._key(priority[i], upside[i], i) for i in range(n)]
+        self.keys = SkipList([keys[i] for i in order.tolist()])
+        self.entries = {
+            tickers[i]: (keys[i], cs[i], ss[i], quadrant[i], rating[i]) for i in range(n)
+        }
+        self.tickers = dict(enumerate(tickers))
+        self._next_seq = n
+    
+    # ==================== INCREMENTAL ====================
+    
+    def update(self, ticker, company_score, stock_score, target_price, current_price):
+        """
+        Add a ticker or re-rank it after its scores or prices changed
+        
+        Uses the scalar classify() / get_investment_recommendation(), exactly
+        like compare_stocks().
+        """
+        classifier = self.classifier
+        quadrant_info = classifier.classify(company_score, stock_score)
+        recommendation = classifier.get_investment_recommendation(
+            quadrant_info, target_price, current_price
+        )
+        
+        entry = self.entries.get(ticker)
+        if entry is None:
+            seq = self._next_seq
+            self._next_seq += 1
+            self.tickers[seq] = ticker
+        else:
+            seq = entry[0][2]
+            self.keys.remove(entry[0])
+        
+        key = self._key(recommendation['priority'], recommendation['upside'], seq)
+        self.keys.insert(key)
+        self.entries[ticker] = (
+            key, company_score, stock_score,
+            classifier.QUADRANT_NAMES.index(quadrant_info['name']),
+            classifier.RATING_NAMES.index(recommendation['rating'])
+        )
+    
+    def remove(self, ticker):
+        """Drop a ticker from the ranking"""
+        key = self.entries.pop(ticker)[0]
+        self.keys.remove(key)
+        del self.tickers[key[2]]
+    
+    # ==================== QUERIES ====================
+    
+    def rank(self, ticker):
+        """0-based position of a ticker in compare_stocks() order"""
+        return self.keys.rank(self.entries[ticker][0])
+    
+    def top(self, k=20):
+        """
+        First k stocks in compare_stocks() order
+        
+        Returns:
+            list of dicts with the keys of compare_stocks() results
+        """
+        classifier = self.classifier
+        results = []
+        for priority, neg_upside, seq in self.keys.head(k):
+            ticker = self.tickers[seq]
+            _, cs, ss, quadrant, rating = self.entries[ticker]
+            name = classifier.QUADRANT_NAMES[quadrant]
+            results.append({
+                'ticker': ticker,
+                'company_score': cs,
+                'stock_score': ss,
+                'quadrant': name,
+                'rating': classifier.RATING_NAMES[rating],
+                'priority': priority,
+                'upside': -neg_upside if neg_upside != float('inf') else float('nan'),
+                'risk_level': classifier.quadrants[name]['risk_level']
+            })
+        return results
@@ -0,0 +1,234 @@
+"""
+Sector Normalization Module
+Scoring relatif terhadap sektor: persentil atau z-score per sektor sebelum scoring
+"""
+
+import numpy as np
+
+from .kernels import round_like_python, score_by_breakpoints
+
+# Relative position -> score 1-4 at the sector quartiles. For z-scores the
+# cut points are the quartiles of a normal distribution.
+RELATIVE_BREAKPOINTS = {
+    'percentile': np.array([0.25, 0.50, 0.75]),
+    'zscore': np.array([-0.6745, 0.0, 0.6745])
+}
+
+
+class SectorNormalizer:
+    """
+    Mengubah rasio dan growth mentah menjadi posisi relatif dalam sektor
+    
+    Sector statistics are computed once by fit() in one grouped pass (rows
+    sorted by sector once, then segment reductions) and cached, so
+    rescoring with new prices or intraday inputs only runs transform().
+    Tickers whose sector was not seen by fit() are placed against the
+    statistics of the whole universe.
+    """
+    
+    # Raw inputs normalized within the sector (see raw_metrics)
+    METRICS = (
+        'roa', 'ebit_margin', 'sales_growth', 'sales_acceleration',
+        'profit_growth', 'profit_acceleration', 'ocf_ebit', 'equity_asset',
+        'cash_asset', 'revenue_growth', 'ebit_growth', 'np_growth'
+    )
+    
+    def __init__(self, method='percentile'):
+        """
+        Args:
+            method: 'percentile' (within-sector midrank) or 'zscore'
+        """
+        if method not in RELATIVE_BREAKPOINTS:
+            raise ValueError(f"method must be 'percentile' or 'zscore', got {method!r}")
+        self.method = method
+        self.sectors = None
+        self.stats = None
+    
+    @property
+    def is_fitted(self):
+        return self.stats is not None
+    
+    # ==================== RAW INPUTS ====================
+    
+    def raw_metrics(self, panel):
+        """
+        Raw values that the absolute scorers compare with fixed breakpoints
+        
+        Returns:
+            array (N, len(METRICS)): ratio discrepancies and growth spreads
+            in bps, and the blended-forward growth rates
+        """
+        macro = panel.section('macro_data')
+        growth = panel.section('growth_data')
+        hist = panel.ratio_averages('historical')
+        proj = panel.ratio_averages('projected')
+        
+        columns = {}
+        for name in ('roa', 'ebit_margin', 'ocf_ebit', 'equity_asset', 'cash_asset'):
+            columns[name] = (proj[name] - hist[name]) * 100
+        for prefix, metric, gdp in (('sales', 'revenue', macro['nominal_gdp']),
+                                    ('profit', 'net_income', macro['real_gdp'])):
+            proj_avg = panel.growth(metric, 'projected').mean(axis=1)
+            hist_avg = panel.growth(metric, 'historical').mean(axis=1)
+            columns[f'{prefix}_growth'] = (proj_avg - gdp) * 100
+            columns[f'{prefix}_acceleration'] = (proj_avg - hist_avg) * 100
+        for name in ('revenue_growth', 'ebit_growth', 'np_growth'):
+            columns[name] = growth[name]
+        
+        return np.column_stack([columns[name] for name in self.METRICS])
+    
+    def _sector_codes(self, panel):
+        if 'sector' not in panel.info:
+            raise ValueError("Sector-relative scoring needs company_info sector")
+        return panel.info['sector']
+    
+    # ==================== STATISTICS ====================
+    
+    def fit(self, panel):
+        """
+        Compute and cache per-sector statistics of every raw metric
+        
+        Args:
+            panel: FinancialPanel with company_info sector
+        
+        Returns:
+            self
+        """
+        return self._fit(self._sector_codes(panel), self.raw_metrics(panel))
+    
+    def fit_chunks(self, panels):
+        """
+        Fit on a universe that arrives as a stream of panels
+        
+        Only the sector names and raw metrics of each chunk are kept (one
+        row of len(METRICS) floats per ticker), so the statistics equal
+        those of fit() on the whole universe at a fraction of its memory.
+        
+        Args:
+            panels: iterable of FinancialPanel, e.g. loader.iter_universe_chunks()
+        
+        Returns:
+            self
+        """
+        sectors, values = [], []
+        for panel in panels:
+            sectors.append(self._sector_codes(panel))
+            values.append(self.raw_metrics(panel))
+        if not values:
+            raise ValueError("Cannot fit sector statistics on an empty universe")
+        return self._fit(np.concatenate(sectors), np.concatenate(values))
+    
+    def _fit(self, sector_names, values):
+        sectors, codes = np.unique(sector_names, return_inverse=True)
+        
+        # Group rows by sector once; append the universe as an extra group
+        order = np.argsort(codes, kind='stable')
+        grouped = np.concatenate([values[order], values])
+        starts = np.concatenate([
+            np.searchsorted(codes[order], np.arange(len(sectors))), [len(values)]
+        ])
+        ends = np.append(starts[1:len(sectors)], len(values)).tolist() + [len(grouped)]
+        starts = starts.tolist()
+        
+        finite = np.isfinite(grouped)
+        if self.method == 'zscore':
+            filled = np.where(finite, grouped, 0.0)
+            counts = np.add.reduceat(finite.astype(np.float64), starts, axis=0)
+            sums = np.add.reduceat(filled, starts, axis=0)
+            squares = np.add.reduceat(filled * filled, starts, axis=0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = sums / counts
+                std = np.sqrt(np.maximum(squares / counts - mean * mean, 0.0))
+            self.stats = {'mean': mean, 'std': std}
+        else:
+            # Sorted reference values per group (NaN sort last) and finite counts
+            self.stats = {
+                'sorted': [np.sort(grouped[s:e], axis=0) for s, e in zip(starts, ends)],
+                'count': [finite[s:e].sum(axis=0) for s, e in zip(starts, ends)]
+            }
+        self.sectors = {name: i for i, name in enumerate(sectors.tolist())}
+        return self
+    
+    def transform(self, panel):
+        """
+        Position of every raw metric within its sector
+        
+        Returns:
+            array (N, len(METRICS)) of percentiles (0-1) or z-scores;
+            NaN where the raw value is NaN
+        """
+        values = self.raw_metrics(panel)
+        universe = len(self.sectors)
+        groups = np.array([self.sectors.get(name, universe)
+                           for name in self._sector_codes(panel).tolist()], dtype=np.intp)
+        
+        if self.method == 'zscore':
+            mean = self.stats['mean'][groups]
+            std = self.stats['std'][groups]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                relative = np.where(std > 0, (values - mean) / std, 0.0)
+            relative[~np.isfinite(values)] = np.nan
+            return relative
+        
+        relative = np.full(values.shape, np.nan)
+        for group in np.unique(groups).tolist():
+            rows = groups == group
+            reference = self.stats['sorted'][group]
+            count = self.stats['count'][group]
+            for m in range(values.shape[1]):
+                column = values[rows, m]
+                finite_ref = reference[:count[m], m]
+                if not len(finite_ref):
+                    continue
+                # Midrank percentile: values below plus half of the ties
+                below = np.searchsorted(finite_ref, column, side='left')
+                at_or_below = np.searchsorted(finite_ref, column, side='right')
+                percentile = (below + at_or_below) / (2 * len(finite_ref))
+                relative[rows, m] = np.where(np.isfinite(column), percentile, np.nan)
+        return relative
+    
+    # ==================== SCORING ====================
+    
+    def score_panel(self, panel):
+        """
+        Sector-relative component scores for a panel
+        
+        Statistics are fitted on the first panel seen and then reused for
+        every later panel, so a panel is scored against the sectors of the
+        universe the normalizer was fitted on, not against itself. Call
+        fit() / fit_chunks() first when scoring a universe in pieces.
+        
+        Returns:
+            (vc_data, fp_data, growth_score): the first two in the layout of
+            calculate_vc_scores_batch() / calculate_fp_scores_batch(), the
+            last in the layout of calculate_growth_score_batch()
+        """
+        if not self.is_fitted:
+            self.fit(panel)
+        
+        relative = self.transform(panel)
+        scores = score_by_breakpoints(relative, RELATIVE_BREAKPOINTS[self.method])
+        score = {name: scores[:, i] for i, name in enumerate(self.METRICS)}
+        
+        vc_data = {
+            'roa': score['roa'],
+            'ebit_margin': score['ebit_margin'],
+            'sales_growth': (score['sales_growth'] + score['sales_acceleration']) / 2,
+            'profit_growth': (score['profit_growth'] + score['profit_acceleration']) / 2
+        }
+        fp_data = {name: score[name] for name in ('ocf_ebit', 'equity_asset', 'cash_asset')}
+        
+        growth = panel.section('growth_data')
+        growth_scores = np.column_stack(
+            [score['revenue_growth'], score['ebit_growth'], score['np_growth']]
+        )
+        growth_score = {
+            'score': np.round(growth_scores.mean(axis=1), 2),
+            'revenue_score': score['revenue_growth'],
+            'ebit_score': score['ebit_growth'],
+            'np_score': score['np_growth'],
+            'revenue_growth': round_like_python(growth['revenue_growth'] * 100),
+            'ebit_growth': round_like_python(growth['ebit_growth'] * 100),
+            'np_growth': round_like_python(growth['np_growth'] * 100)
+        }
+        return vc_data, fp_data, growth_score
@@ -0,0 +1,161 @@
+"""
+Sensitivity Module
+Sweep threshold dan bobot CS/SS atas seluruh universe dalam satu pass vectorized
+"""
+
+import itertools
+
+import numpy as np
+
+from .calculator import QuadrantCalculator
+from .classifier import QuadrantClassifier
+
+CS_PARTS = ('vcs', 'vc', 'fp')
+SS_PARTS = ('valuation', 'growth')
+
+
+def _weight_matrix(grid, parts, default):
+    """Turn a list of weight dicts (or an array) into a (G, len(parts)) matrix"""
+    if grid is None:
+        grid = [default]
+    rows = [
+        [weights[part] for part in parts] if isinstance(weights, dict) else list(weights)
+        for weights in grid
+    ]
+    matrix = np.asarray(rows, dtype=np.float64)
+    if matrix.ndim != 2 or matrix.shape[1] != len(parts):
+        raise ValueError(f"Weight grid needs {len(parts)} columns {parts}, got {matrix.shape}")
+    return matrix
+
+
+class SensitivitySweep:
+    """Analisis sensitivitas threshold x bobot untuk klasifikasi quadrant"""
+    
+    def __init__(self, calculator=None, classifier=None):
+        """
+        Args:
+            calculator: QuadrantCalculator providing the baseline weights
+            classifier: QuadrantClassifier providing the baseline threshold
+        """
+        self.calculator = calculator or QuadrantCalculator()
+        self.classifier = classifier or QuadrantClassifier()
+    
+    def components(self, results):
+        """
+        Unrounded pillar scores from a QuadrantPipeline.score() result
+        
+        Returns:
+            (cs_parts (N, 3), ss_parts (N, 2)) in CS_PARTS / SS_PARTS order
+        """
+        groups = (
+            ('lifecycle', 'porter', 'management', 'esg'),
+            ('roa', 'ebit_margin', 'sales_growth', 'profit_growth'),
+            ('ocf_ebit', 'equity_asset', 'cash_asset')
+        )
+        cs_parts = np.column_stack([
+            np.column_stack([results[key] for key in keys]).mean(axis=1)
+            for keys in groups
+        ])
+        ss_parts = np.column_stack([
+            np.asarray(results['valuation_score'], dtype=np.float64),
+            np.asarray(results['growth_score'], dtype=np.float64)
+        ])
+        return cs_parts, ss_parts
+    
+    def weighted_scores(self, parts, weights):
+        """
+        Score every ticker under every weight vector at once
+        
+        The (N, k) x (k, G) product is accumulated one component at a time,
+        the same summation order as calculate_company_score(), so each column
+        equals re-instantiating the calculator with that weight vector.
+        
+        Returns:
+            (N, G) array of rounded scores
+        """
+        scores = parts[:, :1] * weights[:, 0]
+        for k in range(1, parts.shape[1]):
+            scores = scores + parts[:, k:k + 1] * weights[:, k]
+        return np.round(scores, 2)
+    
+    def run(self, results, thresholds=None, cs_weight_grid=None, ss_weight_grid=None):
+        """
+        Evaluate a grid of thresholds x CS weights x SS weights
+        
+        Args:
+            results: dict from QuadrantPipeline.score()
+            thresholds: list of thresholds (default: classifier threshold)
+            cs_weight_grid: list of dicts {vcs, vc, fp} or (G, 3) array
+            ss_weight_grid: list of dicts {valuation, growth} or (G, 2) array
+        
+        Returns:
+            dict with keys:
+                grid      list of {threshold, cs_weights, ss_weights} per grid point
+                quadrant  (N, G) int8 quadrant codes
+                counts    (G, 4) quadrant counts, QUADRANT_NAMES order
+                changed   list (per grid point) of tickers whose quadrant
+                          differs from the baseline configuration
+                baseline  (N,) baseline quadrant codes
+                table     list of summary rows per grid point
+        """
+        thresholds = np.asarray(
+            thresholds if thresholds is not None else [self.classifier.threshold],
+            dtype=np.float64
+        )
+        cs_weights = _weight_matrix(cs_weight_grid, CS_PARTS, self.calculator.cs_weights)
+        ss_weights = _weight_matrix(ss_weight_grid, SS_PARTS, self.calculator.ss_weights)
+        
+        cs_parts, ss_parts = self.components(results)
+        cs = self.weighted_scores(cs_parts, cs_weights)     # (N, Gc)
+        ss = self.weighted_scores(ss_parts, ss_weights)     # (N, Gs)
+        
+        # (N, Gc, Gs, T): low CS adds 1, low SS adds 2 -> STAR/GROWTH/VALUE/DOG
+        low_cs = ~(cs[:, :, None, None] >= thresholds)
+        low_ss = ~(ss[:, None, :, None] >= thresholds)
+        quadrant = (low_cs.astype(np.int8) + 2 * low_ss.astype(np.int8))
+        # NaN scores are DOG, as in QuadrantClassifier.classify_batch()
+        missing = np.isnan(cs)[:, :, None, None] | np.isnan(ss)[:, None, :, None]
+        quadrant = np.where(missing, np.int8(3), quadrant)
+        n = quadrant.shape[0]
+        quadrant = quadrant.reshape(n, -1)
+        
+        baseline = self._baseline(cs_parts, ss_parts)
+        changed_mask = quadrant != baseline[:, None]
+        
+        n_quadrants = len(self.classifier.QUADRANT_NAMES)
+        counts = np.stack([(quadrant == code).sum(axis=0) for code in range(n_quadrants)], axis=1)
+        
+        tickers = np.asarray(results['ticker'])
+        grid = []
+        changed = []
+        table = []
+        for g, (i, j, t) in enumerate(itertools.product(
+                range(len(cs_weights)), range(len(ss_weights)), range(len(thresholds)))):
+            point = {
+                'threshold': float(thresholds[t]),
+                'cs_weights': dict(zip(CS_PARTS, cs_weights[i].tolist())),
+                'ss_weights': dict(zip(SS_PARTS, ss_weights[j].tolist()))
+            }
+            grid.append(point)
+            changed.append(tickers[changed_mask[:, g]].tolist())
+            row = {'threshold': point['threshold']}
+            row.update({f'w_{part}': value for part, value in point['cs_weights'].items()})
+            row.update({f'w_{part}': value for part, value in point['ss_weights'].items()})
+            row.update(zip(self.classifier.QUADRANT_NAMES, counts[g].tolist()))
+            row['changed'] = len(changed[-1])
+            table.append(row)
+        
+        return {
+            'grid': grid,
+            'quadrant': quadrant,
+            'counts': counts,
+            'changed': changed,
+            'baseline': baseline,
+            'table': table
+        }
+    
+    def _baseline(self, cs_parts, ss_parts):
+        """Quadrant codes under the current calculator weights and threshold"""
+        cs = self.weighted_scores(cs_parts, _weight_matrix(None, CS_PARTS, self.calculator.cs_weights))
+        ss = self.weighted_scores(ss_parts, _weight_matrix(None, SS_PARTS, self.calculator.ss_weights))
+        return self.classifier.classify_batch(cs[:, 0], ss[:, 0])['quadrant']
@@ -0,0 +1,524 @@
+"""
+Scoring Service Module
+HTTP service asyncio untuk CS/SS/quadrant dengan micro-batching request
+
+Usage:
+    python -m src.service --port 8080 --max-batch-size 256 --max-wait-ms 5
+    python -m src.service --load-test 2000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from .calculator import QuadrantCalculator
+from .classifier import QuadrantClassifier
+from .panel import FinancialPanel
+from .pipeline import QuadrantPipeline
+
+REQUIRED_SECTIONS = ('vcs_data', 'historical_data', 'projected_data',
+                     'valuation_data', 'growth_data', 'macro_data')
+
+INFO_FIELDS = FinancialPanel.INFO_TEXT + FinancialPanel.INFO_NUMERIC
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 413: 'Payload Too Large',
+               431: 'Request Header Fields Too Large', 500: 'Internal Server Error'}
+
+
+class HTTPError(Exception):
+    """Request that cannot be parsed; answered with status and the connection closed"""
+    
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def validate_record(ticker, record):
+    """
+    Check the section types of one /score record
+    
+    Args:
+        ticker: ticker symbol (for the error message)
+        record: stock record with the schema of data/sample_data.json
+    
+    Raises:
+        ValueError: describing the first problem found
+    """
+    if not isinstance(record, dict):
+        raise ValueError(f"{ticker}: record must be a JSON object")
+    missing = [s for s in REQUIRED_SECTIONS if s not in record]
+    if missing:
+        raise ValueError(f"{ticker}: missing {', '.join(missing)}")
+    
+    for section, fields in FinancialPanel.SECTIONS.items():
+        if not isinstance(record[section], dict):
+            raise ValueError(f"{ticker}: {section} must be a JSON object")
+        missing = [field for field in fields if field not in record[section]]
+        if missing:
+            raise ValueError(f"{ticker}: {section} missing {', '.join(missing)}")
+    
+    for period in ('historical_data', 'projected_data'):
+        rows = record[period]
+        if not isinstance(rows, list) or not rows:
+            raise ValueError(f"{ticker}: {period} must be a non-empty list of years")
+        for row in rows:
+            if not isinstance(row, dict):
+                raise ValueError(f"{ticker}: {period} entries must be JSON objects")
+            missing = [metric for metric in FinancialPanel.METRICS if metric not in row]
+            if missing:
+                raise ValueError(f"{ticker}: {period} missing {', '.join(missing)}")
+    
+    if 'company_info' in record and not isinstance(record['company_info'], dict):
+        raise ValueError(f"{ticker}: company_info must be a JSON object")
+
+
+class MicroBatcher:
+    """Menggabungkan request yang datang bersamaan menjadi satu batch vektor"""
+    
+    def __init__(self, pipeline, max_batch_size=256, max_wait=0.005):
+        """
+        Args:
+            pipeline: QuadrantPipeline used to score each batch
+            max_batch_size: maximum stocks per batch
+            max_wait: seconds the first queued stock waits for more to arrive
+        """
+        self.pipeline = pipeline
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue = None
+        self.task = None
+        
+        self.batches = 0
+        self.scored = 0
+        self.batch_sizes = deque(maxlen=10000)
+    
+    def start(self):
+        self.queue = asyncio.Queue()
+        self.task = asyncio.get_running_loop().create_task(self._worker())
+    
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+    
+    async def submit(self, ticker, record):
+        """Queue one stock and wait for its result row"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((ticker, record, future))
+        return await future
+    
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Scoring is CPU-bound; keep the event loop free for I/O meanwhile.
+            # An unexpected failure fails this batch only, never the worker.
+            try:
+                outcomes = await loop.run_in_executor(None, self._score, batch)
+            except Exception as exc:
+                outcomes = [exc] * len(batch)
+            for (_, _, future), outcome in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+            
+            self.batches += 1
+            self.scored += len(batch)
+            self.batch_sizes.append(len(batch))
+    
+    def _score(self, batch):
+        """
+        Score a batch, grouped by financial shape and company_info fields so a
+        stock's result never depends on the requests it was batched with;
+        failing groups retry per stock
+        """
+        outcomes = [None] * len(batch)
+        groups = {}
+        for i, (_, record, _) in enumerate(batch):
+            info = record.get('company_info', {})
+            shape = (len(record['historical_data']), len(record['projected_data']),
+                     tuple(field in info for field in INFO_FIELDS))
+            groups.setdefault(shape, []).append(i)
+        
+        for indices in groups.values():
+            try:
+                rows = self._score_records([batch[i][:2] for i in indices])
+            except Exception:
+                if len(indices) == 1:
+                    outcomes[indices[0]] = ValueError('Could not score record')
+                    continue
+                rows = []
+                for i in indices:
+                    try:
+                        rows.extend(self._score_records([batch[i][:2]]))
+                    except Exception as exc:
+                        rows.append(ValueError(f'Could not score {batch[i][0]}: {exc!r}'))
+            for i, row in zip(indices, rows):
+                outcomes[i] = row
+        return outcomes
+    
+    def _score_records(self, items):
+        panel = FinancialPanel.from_records(
+            [ticker for ticker, _ in items], [record for _, record in items]
+        )
+        return self.pipeline.to_records(self.pipeline.score(panel))
+
+
+class ScoringService:
+    """HTTP/1.1 service minimal di atas asyncio (tanpa dependency eksternal)"""
+    
+    MAX_BODY = 16 * 1024 * 1024
+    MAX_HEADERS = 100
+    
+    def __init__(self, pipeline=None, max_batch_size=256, max_wait=0.005):
+        """
+        Args:
+            pipeline: QuadrantPipeline (default: default weights, threshold 3.0)
+            max_batch_size: maximum stocks per micro-batch
+            max_wait: micro-batch wait time in seconds
+        """
+        self.pipeline = pipeline or QuadrantPipeline()
+        self.batcher = MicroBatcher(self.pipeline, max_batch_size, max_wait)
+        self.server = None
+        
+        self.started = None
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=100000)
+    
+    async def start(self, host='127.0.0.1', port=8080):
+        """Start listening; returns the bound (host, port)"""
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle, host, port)
+        self.started = time.perf_counter()
+        return self.server.sockets[0].getsockname()[:2]
+    
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        await self.batcher.stop()
+    
+    async def serve_forever(self, host='127.0.0.1', port=8080):
+        await self.start(host, port)
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+    
+    # ==================== ENDPOINTS ====================
+    
+    async def score(self, payload):
+        """
+        POST /score
+        
+        Args:
+            payload: {ticker: record} with the schema of data/sample_data.json
+        
+        Returns:
+            {ticker: result row}, rows as from QuadrantPipeline.to_records()
+        """
+        if not isinstance(payload, dict) or not payload:
+            raise ValueError('Body must be a non-empty JSON object {ticker: record}')
+        for ticker, record in payload.items():
+            validate_record(ticker, record)
+        
+        rows = await asyncio.gather(*[
+            self.batcher.submit(ticker, record) for ticker, record in payload.items()
+        ])
+        return dict(zip(payload, rows))
+    
+    def metrics(self):
+        """GET /metrics: request counts, throughput, batch sizes and latency"""
+        uptime = time.perf_counter() - self.started if self.started else 0.0
+        latencies = np.array(self.latencies, dtype=np.float64) * 1000
+        sizes = np.array(self.batcher.batch_sizes, dtype=np.float64)
+        
+        metrics = {
+            'uptime_s': uptime,
+            'requests': self.requests,
+            'errors': self.errors,
+            'stocks_scored': self.batcher.scored,
+            'batches': self.batcher.batches,
+            'mean_batch_size': float(sizes.mean()) if len(sizes) else 0.0,
+            'max_batch_size': self.batcher.max_batch_size,
+            'max_wait_ms': self.batcher.max_wait * 1000,
+            'requests_per_s': self.requests / uptime if uptime else 0.0,
+            'stocks_per_s': self.batcher.scored / uptime if uptime else 0.0
+        }
+        if len(latencies):
+            for percentile, value in zip((50, 90, 99), np.percentile(latencies, (50, 90, 99))):
+                metrics[f'latency_p{percentile}_ms'] = float(value)
+            metrics['latency_max_ms'] = float(latencies.max())
+        return metrics
+    
+    # ==================== HTTP ====================
+    
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                
+                start = time.perf_counter()
+                status, payload = await self._dispatch(method, path, body)
+                self.requests += 1
+                if status != 200:
+                    self.errors += 1
+                if path == '/score':
+                    self.latencies.append(time.perf_counter() - start)
+                
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except HTTPError as exc:
+            self.requests += 1
+            self.errors += 1
+            self._write_response(writer, exc.status, {'error': str(exc)}, False)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _read_request(self, reader):
+        # readline() raises ValueError once a line exceeds the stream limit
+        try:
+            line = await reader.readline()
+        except ValueError:
+            raise HTTPError(400, 'Request line too long') from None
+        if not line:
+            return None
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise HTTPError(400, 'Malformed request line')
+        method, path, _ = parts
+        
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise HTTPError(431, 'Header line too long') from None
+            if line in (b'\r\n', b'\n', b''):
+                break
+            if len(headers) >= self.MAX_HEADERS:
+                raise HTTPError(431, f'More than {self.MAX_HEADERS} header fields')
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HTTPError(400, 'Invalid Content-Length') from None
+        if length < 0:
+            raise HTTPError(400, 'Invalid Content-Length')
+        if length > self.MAX_BODY:
+            raise HTTPError(413, f'Body larger than {self.MAX_BODY} bytes')
+        body = await reader.readexactly(length) if length else b''
+        return method, path.split('?', 1)[0], headers, body
+    
+    async def _dispatch(self, method, path, body):
+        if path == '/score':
+            if method != 'POST':
+                return 405, {'error': 'Use POST'}
+            try:
+                payload = json.loads(body or b'null')
+            except json.JSONDecodeError as exc:
+                return 400, {'error': f'Invalid JSON: {exc}'}
+            try:
+                return 200, await self.score(payload)
+            except ValueError as exc:
+                return 400, {'error': str(exc)}
+            except Exception as exc:
+                return 500, {'error': repr(exc)}
+        elif path == '/metrics':
+            return 200, self.metrics()
+        elif path == '/health':
+            return 200, {'status': 'ok'}
+        return 404, {'error': f'Unknown path {path}'}
+    
+    def _write_response(self, writer, status, payload, keep_alive):
+        try:
+            body = json.dumps(payload, allow_nan=False)
+        except ValueError:
+            # NaN/Infinity are not JSON; send them as null
+            body = json.dumps(_finite_or_none(payload), allow_nan=False)
+        body = body.encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+
+
+def _finite_or_none(value):
+    """Copy of a JSON-like payload with non-finite floats replaced by None"""
+    if isinstance(value, float):
+        return value if np.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+
+# ==================== LOAD TEST ====================
+
+async def _post(reader, writer, host, path, body):
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode('latin-1')
+        + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def load_test(host, port, universe, requests=1000, concurrency=32):
+    """
+    Fire single-stock /score requests from concurrent keep-alive clients
+    
+    Args:
+        host, port: service address
+        universe: {ticker: record} to cycle through
+        requests: total number of requests
+        concurrency: number of concurrent connections
+    
+    Returns:
+        dict with request count, failures, elapsed time, throughput and
+        client-side latency percentiles in ms
+    """
+    bodies = [json.dumps({ticker: record}).encode('utf-8') for ticker, record in universe.items()]
+    counter = iter(range(requests))
+    latencies = []
+    failures = 0
+    
+    async def client():
+        nonlocal failures
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for i in counter:
+                start = time.perf_counter()
+                status, _ = await _post(reader, writer, host, '/score', bodies[i % len(bodies)])
+                latencies.append(time.perf_counter() - start)
+                failures += status != 200
+        finally:
+            writer.close()
+    
+    start = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    
+    latencies = np.array(latencies) * 1000
+    p50, p90, p99 = np.percentile(latencies, (50, 90, 99)) if len(latencies) else (0.0,) * 3
+    return {
+        'requests': len(latencies),
+        'failures': failures,
+        'elapsed_s': elapsed,
+        'requests_per_s': len(latencies) / elapsed if elapsed else 0.0,
+        'latency_p50_ms': float(p50),
+        'latency_p90_ms': float(p90),
+        'latency_p99_ms': float(p99)
+    }
+
+
+def build_parser():
+    """Build the argument parser"""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.service',
+        description='Serve CS/SS/quadrant scoring over HTTP (POST /score, GET /metrics).'
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--threshold', type=float, default=3.0,
+                        help='High/Low threshold for CS and SS (default: 3.0)')
+    parser.add_argument('--max-batch-size', type=int, default=256,
+                        help='maximum stocks per micro-batch (default: 256)')
+    parser.add_argument('--max-wait-ms', type=float, default=5.0,
+                        help='micro-batch wait time in ms (default: 5)')
+    parser.add_argument('--load-test', type=int, metavar='REQUESTS',
+                        help='start the service, send REQUESTS requests and print metrics')
+    parser.add_argument('--concurrency', type=int, default=32,
+                        help='concurrent connections for --load-test (default: 32)')
+    parser.add_argument('--universe', default='data/sample_data.json',
+                        help='records cycled through by --load-test')
+    return parser
+
+
+async def _run_load_test(service, args):
+    host, port = await service.start(args.host, 0)
+    try:
+        with open(args.universe, 'r', encoding='utf-8') as f:
+            universe = json.load(f)
+        client = await load_test(host, port, universe, args.load_test, args.concurrency)
+        return {'client': client, 'server': service.metrics()}
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    """Entry point, returns the process exit code"""
+    args = build_parser().parse_args(argv)
+    service = ScoringService(
+        QuadrantPipeline(QuadrantCalculator(), QuadrantClassifier(threshold=args.threshold)),
+        max_batch_size=args.max_batch_size,
+        max_wait=args.max_wait_ms / 1000
+    )
+    
+    if args.load_test:
+        print(json.dumps(asyncio.run(_run_load_test(service, args)), indent=2))
+        return 0
+    
+    print(f"Serving on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+Simulation Module
+Simulasi Monte Carlo probabilitas quadrant dari ketidakpastian proyeksi
+"""
+
+import time
+import zlib
+
+import numpy as np
+
+from .calculator import QuadrantCalculator
+from .classifier import QuadrantClassifier
+from .panel import FinancialPanel
+
+
+class MonteCarloSimulator:
+    """Monte Carlo engine di atas kernel CS/SS kolumnar"""
+    
+    # Input -> (distribution, scale). 'lognormal' multiplies by exp(N(0, scale)),
+    # 'normal' adds N(0, scale). None disables the perturbation.
+    DEFAULT_DISTRIBUTIONS = {
+        'projected': ('lognormal', 0.10),   # every projected financial metric
+        'price': ('lognormal', 0.05),       # current price used for valuation upside
+        'vcs': ('normal', 0.25),            # VCS components, clipped to 1-4
+        'growth': None                      # blended-forward growth rates
+    }
+    
+    def __init__(self, calculator=None, classifier=None, draws=10000, seed=0,
+                 distributions=None, percentiles=(5, 25, 50, 75, 95),
+                 max_elements=4_000_000):
+        """
+        Initialize simulator
+        
+        Args:
+            calculator: QuadrantCalculator (default: new instance)
+            classifier: QuadrantClassifier (default: new instance)
+            draws: simulations per ticker
+            seed: base seed; each ticker gets its own stream derived from
+                  (seed, ticker), so results don't depend on chunking or on
+                  the rest of the universe
+            distributions: overrides for DEFAULT_DISTRIBUTIONS
+            percentiles: CS/SS percentiles to report
+            max_elements: cap on simulated panel cells held in memory at once
+        """
+        self.calculator = calculator or QuadrantCalculator()
+        self.classifier = classifier or QuadrantClassifier()
+        self.draws = draws
+        self.seed = seed
+        self.distributions = dict(self.DEFAULT_DISTRIBUTIONS)
+        self.distributions.update(distributions or {})
+        self.percentiles = tuple(percentiles)
+        self.max_elements = max_elements
+    
+    def run(self, panel):
+        """
+        Simulate every ticker of a panel
+        
+        Args:
+            panel: FinancialPanel with all sections
+        
+        Returns:
+            dict with keys:
+                ticker                (N,)
+                quadrant_probability  (N, 4), columns in QUADRANT_NAMES order
+                most_likely           (N,) quadrant code with highest probability
+                cs_mean, ss_mean      (N,)
+                cs_percentiles        (N, len(percentiles))
+                ss_percentiles        (N, len(percentiles))
+                percentiles, draws, elapsed, simulations_per_second
+        """
+        start = time.perf_counter()
+        n = len(panel)
+        cells = (panel.historical.shape[1] + panel.projected.shape[1]) * len(panel.METRICS)
+        chunk = max(1, self.max_elements // max(1, self.draws * cells))
+        
+        n_quadrants = len(self.classifier.QUADRANT_NAMES)
+        probability = np.empty((n, n_quadrants))
+        cs_mean = np.empty(n)
+        ss_mean = np.empty(n)
+        cs_pct = np.empty((n, len(self.percentiles)))
+        ss_pct = np.empty((n, len(self.percentiles)))
+        
+        for begin in range(0, n, chunk):
+            index = np.arange(begin, min(begin + chunk, n))
+            cs, ss, quadrant = self._simulate(panel, index)
+            
+            for code in range(n_quadrants):
+                probability[index, code] = (quadrant == code).mean(axis=1)
+            cs_mean[index] = cs.mean(axis=1)
+            ss_mean[index] = ss.mean(axis=1)
+            cs_pct[index] = np.percentile(cs, self.percentiles, axis=1).T
+            ss_pct[index] = np.percentile(ss, self.percentiles, axis=1).T
+        
+        elapsed = time.perf_counter() - start
+        return {
+            'ticker': panel.tickers,
+            'quadrant_probability': probability,
+            'most_likely': probability.argmax(axis=1).astype(np.int8),
+            'cs_mean': cs_mean,
+            'ss_mean': ss_mean,
+            'cs_percentiles': cs_pct,
+            'ss_percentiles': ss_pct,
+            'percentiles': self.percentiles,
+            'draws': self.draws,
+            'elapsed': elapsed,
+            'simulations_per_second': n * self.draws / elapsed if elapsed > 0 else float('inf')
+        }
+    
+    # ==================== INTERNALS ====================
+    
+    def _noise(self, panel, index):
+        """Standard normal draws for a chunk, one reproducible stream per ticker"""
+        draws = self.draws
+        years = panel.projected.shape[1]
+        metrics = len(panel.METRICS)
+        
+        streams = {'projected': [], 'price': [], 'vcs': [], 'growth': []}
+        for i in index:
+            ticker = str(panel.tickers[i])
+            rng = np.random.default_rng([self.seed, zlib.crc32(ticker.encode('utf-8'))])
+            # Always draw every stream, in a fixed order, so switching one
+            # distribution off doesn't reshuffle the others
+            streams['projected'].append(rng.standard_normal((draws, years, metrics)))
+            streams['price'].append(rng.standard_normal(draws))
+            streams['vcs'].append(rng.standard_normal((draws, 4)))
+            streams['growth'].append(rng.standard_normal((draws, 3)))
+        return {name: np.concatenate(values) for name, values in streams.items()}
+    
+    def _perturb(self, values, noise, name):
+        spec = self.distributions.get(name)
+        if not spec:
+            return values
+        kind, scale = spec
+        if kind == 'lognormal':
+            return values * np.exp(scale * noise)
+        elif kind == 'normal':
+            return values + scale * noise
+        raise ValueError(f"Unknown distribution for {name}: {kind!r}")
+    
+    def _simulate(self, panel, index):
+        """Return (cs, ss, quadrant) arrays of shape (len(index), draws)"""
+        draws = self.draws
+        rows = np.repeat(index, draws)
+        noise = self._noise(panel, index)
+        
+        projected = self._perturb(panel.projected[rows], noise['projected'], 'projected')
+        
+        vcs = panel.section('vcs_data')
+        vcs_keys = list(FinancialPanel.SECTIONS['vcs_data'])
+        vcs_sim = np.column_stack([vcs[key][rows] for key in vcs_keys])
+        vcs_sim = np.clip(self._perturb(vcs_sim, noise['vcs'], 'vcs'), 1, 4)
+        
+        growth = panel.section('growth_data')
+        growth_keys = list(FinancialPanel.SECTIONS['growth_data'])
+        growth_sim = np.column_stack([growth[key][rows] for key in growth_keys])
+        growth_sim = self._perturb(growth_sim, noise['growth'], 'growth')
+        
+        valuation = panel.section('valuation_data')
+        price = self._perturb(valuation['current_price'][rows], noise['price'], 'price')
+        macro = panel.section('macro_data')
+        
+        sim_panel = FinancialPanel(
+            panel.tickers[rows], panel.historical[rows], projected
+        )
+        
+        calc = self.calculator
+        vc_data = calc.calculate_vc_scores_batch(
+            sim_panel, macro['nominal_gdp'][rows], macro['real_gdp'][rows]
+        )
+        fp_data = calc.calculate_fp_scores_batch(sim_panel)
+        cs = calc.calculate_company_score_batch(
+            dict(zip(vcs_keys, vcs_sim.T)), vc_data, fp_data
+        )['company_score']
+        
+        valuation_score = calc.calculate_valuation_score_batch(
+            valuation['model_tp'][rows], valuation['relative_val'][rows], price
+        )
+        growth_score = calc.calculate_growth_score_batch(*growth_sim.T)
+        ss = calc.combine_stock_score_batch(valuation_score, growth_score)['stock_score']
+        
+        quadrant = self.classifier.classify_batch(cs, ss)['quadrant']
+        shape = (len(index), draws)
+        return cs.reshape(shape), ss.reshape(shape), quadrant.reshape(shape)
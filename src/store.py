@@ -0,0 +1,242 @@
+"""
+Result Store Module
+Menyimpan setiap run scoring ke SQLite dengan index ticker, tanggal run, dan quadrant
+"""
+
+import datetime
+import hashlib
+import json
+import sqlite3
+
+import numpy as np
+
+from .cache import stable_hash
+
+# Result columns persisted per stock, in table order (name, SQLite type)
+SCORE_COLUMNS = (
+    ('company_score', 'REAL'), ('vcs_score', 'REAL'), ('vc_score', 'REAL'),
+    ('fp_score', 'REAL'), ('stock_score', 'REAL'), ('valuation_score', 'INTEGER'),
+    ('growth_score', 'REAL'), ('blended_tp', 'REAL'), ('upside', 'REAL'),
+    ('quadrant', 'INTEGER'), ('strength', 'INTEGER'), ('rating', 'INTEGER'),
+    ('priority', 'INTEGER'), ('cs_distance', 'REAL'), ('ss_distance', 'REAL'),
+    ('target_price', 'REAL'), ('current_price', 'REAL'),
+    ('recommendation_upside', 'REAL'), ('risk_flags', 'INTEGER')
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    run_at TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    weights_version TEXT NOT NULL,
+    config TEXT NOT NULL,
+    stocks INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    run_date TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    inputs_hash TEXT NOT NULL,
+    {columns}
+);
+CREATE INDEX IF NOT EXISTS idx_scores_ticker ON scores (ticker, run_date);
+CREATE INDEX IF NOT EXISTS idx_scores_date_quadrant ON scores (run_date, quadrant);
+""".format(columns=',\n    '.join(f'{name} {kind}' for name, kind in SCORE_COLUMNS))
+
+
+def inputs_hashes(panel):
+    """
+    Per-ticker digest of every scoring input in a FinancialPanel
+    
+    Covers the financials, every section and the company_info columns
+    (current_price drives the recommendation, sector the sector-relative
+    mode), so a changed input always changes the digest.
+    
+    Args:
+        panel: FinancialPanel
+    
+    Returns:
+        list of 32-character hex digests, one per ticker
+    """
+    n = len(panel)
+    parts = [panel.historical.reshape(n, -1), panel.projected.reshape(n, -1)]
+    for section in sorted(panel.sections):
+        fields = panel.sections[section]
+        parts.extend(fields[field][:, None] for field in sorted(fields))
+    numeric = sorted(field for field in panel.info if field not in panel.INFO_TEXT)
+    parts.extend(panel.info[field][:, None] for field in numeric)
+    rows = np.ascontiguousarray(np.concatenate(parts, axis=1), dtype=np.float64)
+    
+    # Text fields are joined with a separator that cannot occur in them
+    text = sorted(field for field in panel.info if field in panel.INFO_TEXT)
+    labels = ['\x00'.join(values) for values in zip(
+        *(panel.info[field].tolist() for field in text)
+    )] if text else [''] * n
+    
+    return [
+        hashlib.blake2b(
+            ticker.encode('utf-8') + row.tobytes() + b'\x00' + label.encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        for ticker, row, label in zip(panel.tickers.tolist(), rows, labels)
+    ]
+
+
+class ResultStore:
+    """Penyimpanan persisten hasil scoring (satu baris per saham per run)"""
+    
+    def __init__(self, path, batch_size=50000):
+        """
+        Open (or create) a result store
+        
+        Args:
+            path: SQLite database file (':memory:' for a temporary store)
+            batch_size: rows per executemany() call when saving
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+    
+    def close(self):
+        self.connection.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    # ==================== WRITE ====================
+    
+    def save_run(self, results, pipeline, panel=None, run_at=None, hashes=None):
+        """
+        Persist one scoring run
+        
+        Args:
+            results: dict from QuadrantPipeline.score()
+            pipeline: QuadrantPipeline that produced the results
+            panel: FinancialPanel that was scored, for the inputs hashes
+            run_at: datetime of the run (default: now)
+            hashes: precomputed inputs_hashes(), used instead of panel
+        
+        Returns:
+            run_id of the new run
+        """
+        run_at = run_at or datetime.datetime.now()
+        run_date = run_at.date().isoformat()
+        normalizer = pipeline.sector_normalizer
+        config = {
+            'cs_weights': pipeline.calculator.cs_weights,
+            'ss_weights': pipeline.calculator.ss_weights,
+            'threshold': pipeline.classifier.threshold,
+            # Sector-relative scores are not comparable with absolute ones
+            'sector_relative': normalizer.method if normalizer is not None else None
+        }
+        tickers = results['ticker'].tolist()
+        if hashes is None:
+            hashes = inputs_hashes(panel) if panel is not None else [''] * len(tickers)
+        
+        # Column-wise tolist() converts NumPy values to Python scalars in bulk
+        columns = [results[name].tolist() for name, _ in SCORE_COLUMNS]
+        placeholders = ', '.join('?' * (len(SCORE_COLUMNS) + 4))
+        insert = f'INSERT INTO scores VALUES ({placeholders})'
+        
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT INTO runs (run_at, run_date, weights_version, config, stocks) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (run_at.isoformat(), run_date, stable_hash(config)[:12],
+                 json.dumps(config, sort_keys=True), len(tickers))
+            )
+            run_id = cursor.lastrowid
+            rows = zip([run_id] * len(tickers), [run_date] * len(tickers),
+                       tickers, hashes, *columns)
+            while True:
+                chunk = [row for _, row in zip(range(self.batch_size), rows)]
+                if not chunk:
+                    break
+                self.connection.executemany(insert, chunk)
+        return run_id
+    
+    # ==================== READ ====================
+    
+    def runs(self):
+        """All runs as a list of dicts, oldest first"""
+        cursor = self.connection.execute(
+            'SELECT run_id, run_at, run_date, weights_version, config, stocks '
+            'FROM runs ORDER BY run_id'
+        )
+        keys = [column[0] for column in cursor.description]
+        return [dict(zip(keys, row)) for row in cursor]
+    
+    def query(self, ticker=None, run_date=None, quadrant=None, run_id=None,
+              start=None, end=None, columns=None):
+        """
+        Select stored scores
+        
+        Args:
+            ticker: ticker symbol
+            run_date: exact run date (date, datetime or 'YYYY-MM-DD')
+            quadrant: quadrant name ('STAR', ...) or code
+            run_id: one run
+            start, end: inclusive run date range
+            columns: result columns to return (default: all)
+        
+        Returns:
+            dict of numpy arrays with run_id, run_date, ticker, inputs_hash
+            and the requested columns, ordered by run date and ticker
+        """
+        from .classifier import QuadrantClassifier
+        
+        conditions, params = [], []
+        for column, operator, value in (('ticker', '=', ticker), ('run_date', '=', run_date),
+                                        ('run_id', '=', run_id), ('run_date', '>=', start),
+                                        ('run_date', '<=', end)):
+            if value is not None:
+                conditions.append(f'{column} {operator} ?')
+                if isinstance(value, datetime.datetime):
+                    value = value.date()
+                params.append(value.isoformat() if isinstance(value, datetime.date) else value)
+        if quadrant is not None:
+            if isinstance(quadrant, str):
+                quadrant = QuadrantClassifier.QUADRANT_NAMES.index(quadrant)
+            conditions.append('quadrant = ?')
+            params.append(int(quadrant))
+        
+        names = ['run_id', 'run_date', 'ticker', 'inputs_hash'] + list(
+            columns or [name for name, _ in SCORE_COLUMNS]
+        )
+        known = {name for name, _ in SCORE_COLUMNS} | {'run_id', 'run_date', 'ticker', 'inputs_hash'}
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        
+        sql = f"SELECT {', '.join(names)} FROM scores"
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY run_date, run_id, ticker'
+        rows = self.connection.execute(sql, params).fetchall()
+        
+        kinds = dict(SCORE_COLUMNS)
+        result = {}
+        for i, name in enumerate(names):
+            values = [row[i] for row in rows]
+            if name in ('run_date', 'ticker', 'inputs_hash'):
+                result[name] = np.array(values, dtype=str)
+            elif name == 'run_id' or kinds.get(name) == 'INTEGER':
+                result[name] = np.array(values, dtype=np.int64)
+            else:
+                result[name] = np.array(values, dtype=np.float64)
+        return result
+    
+    def quadrant_members(self, run_date, quadrant):
+        """Tickers in one quadrant on one run date, e.g. all STARs last Friday"""
+        return self.query(run_date=run_date, quadrant=quadrant,
+                          columns=('company_score', 'stock_score'))
+    
+    def history(self, ticker, columns=('company_score', 'vcs_score', 'vc_score', 'fp_score')):
+        """Score history of one ticker across runs, e.g. AMRT's CS history"""
+        return self.query(ticker=ticker, columns=columns)
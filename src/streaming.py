@@ -0,0 +1,258 @@
+"""
+Streaming Revaluation Module
+Revaluasi Stock Score per tick harga memakai breakpoint harga yang dihitung di muka
+"""
+
+import math
+import socket
+import time
+from bisect import bisect_right
+from collections import deque
+
+import numpy as np
+
+from .kernels import UPSIDE_BREAKPOINTS
+from .pipeline import QuadrantPipeline
+
+
+def open_feed(source):
+    """
+    Open a tick feed as an iterator of text lines
+    
+    Args:
+        source: file path, 'host:port' of a TCP line feed, or any iterable
+                of lines (e.g. an open file or list)
+    
+    Returns:
+        iterable of 'timestamp,ticker,price' lines
+    """
+    if not isinstance(source, str):
+        return source
+    
+    host, sep, port = source.rpartition(':')
+    if sep and port.isdigit():
+        connection = socket.create_connection((host or 'localhost', int(port)))
+        return connection.makefile('r', encoding='utf-8')
+    return open(source, 'r', encoding='utf-8')
+
+
+def parse_ticks(lines, on_error=None):
+    """
+    Parse 'timestamp,ticker,price' lines into (timestamp, ticker, price)
+    
+    Blank lines, '#' comments and a 'timestamp,...' header are skipped.
+    Malformed lines (wrong field count, non-numeric or non-finite price,
+    e.g. a line cut off by a dropped connection) are skipped too, so one bad
+    line never ends the feed.
+    
+    Args:
+        lines: iterable of text lines
+        on_error: optional callback called with every malformed line
+    """
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#') or line.startswith('timestamp'):
+            continue
+        fields = line.split(',')
+        try:
+            timestamp, ticker, price = fields
+            price = float(price)
+        except ValueError:
+            price = math.nan
+        if not math.isfinite(price):
+            if on_error is not None:
+                on_error(line)
+            continue
+        yield timestamp, ticker, price
+
+
+class TickRevaluator:
+    """Revaluasi streaming: event hanya saat harga melewati breakpoint valuasi"""
+    
+    # Valuation score for each number of breakpoint prices at or below the price
+    SCORES = (4, 3, 2, 1)
+    
+    def __init__(self, panel, pipeline=None, latency_window=100000):
+        """
+        Precompute breakpoint prices and the state behind every bucket
+        
+        The valuation score only changes where the upside crosses 0%, 15% or
+        30%, i.e. at the prices blended_tp / 1.30, / 1.15 and / 1.00. For
+        each ticker the Stock Score, quadrant, strength and rating of all four
+        valuation scores are computed once, so a tick only needs a bisect
+        over its breakpoint prices.
+        
+        Args:
+            panel: FinancialPanel with the universe to monitor
+            pipeline: QuadrantPipeline (default: default weights, threshold 3.0)
+            latency_window: most recent ticks kept for latency_stats()
+        """
+        self.pipeline = pipeline or QuadrantPipeline()
+        calculator = self.pipeline.calculator
+        classifier = self.pipeline.classifier
+        
+        results = self.pipeline.score(panel)
+        valuation = panel.section('valuation_data')
+        blended_tp = (valuation['model_tp'] + valuation['relative_val']) / 2
+        n = len(panel)
+        
+        # (N, 3) ascending breakpoint prices: tp/1.30 < tp/1.15 < tp/1.00
+        self.breakpoints = blended_tp[:, None] / (1 + UPSIDE_BREAKPOINTS[::-1])
+        self.blended_tp = blended_tp
+        
+        # (N, 4) state per valuation score 1..4 (column = score - 1)
+        growth = {'score': results['growth_score']}
+        states = {'stock_score': [], 'quadrant': [], 'strength': [], 'rating': []}
+        for score in range(1, 5):
+            ss = calculator.combine_stock_score_batch(
+                {'score': np.full(n, score, dtype=np.int8), 'blended_tp': blended_tp,
+                 'upside': np.zeros(n)},
+                growth
+            )['stock_score']
+            batch = classifier.classify_batch(results['company_score'], ss)
+            rating = classifier.get_investment_recommendation_batch(
+                batch, blended_tp, np.ones(n)
+            )['rating']
+            for key, values in (('stock_score', ss), ('quadrant', batch['quadrant']),
+                                ('strength', batch['strength']), ('rating', rating)):
+                states[key].append(values)
+        
+        self.states = {key: np.stack(columns, axis=1) for key, columns in states.items()}
+        self.tickers = results['ticker']
+        self.company_score = results['company_score']
+        self.index = {ticker: i for i, ticker in enumerate(self.tickers.tolist())}
+        
+        # Plain Python lists keep the per-tick path free of NumPy scalar overhead
+        self._breakpoints = self.breakpoints.tolist()
+        self._blended = blended_tp.tolist()
+        self._stock_score = self.states['stock_score'].tolist()
+        self._quadrant = self.states['quadrant'].tolist()
+        self._strength = self.states['strength'].tolist()
+        self._rating = self.states['rating'].tolist()
+        self.valuation_score = results['valuation_score'].tolist()
+        
+        self.latencies = deque(maxlen=latency_window)
+        self.ticks = 0
+        self.rejected = 0
+        self.events = 0
+    
+    def valuation_score_at(self, index, price):
+        """
+        Valuation score of one ticker at a price
+        
+        Args:
+            index: row of the ticker in the panel
+            price: trade price
+        
+        Returns:
+            int score 1-4, identical to calculate_valuation_score()
+        """
+        breakpoints = self._breakpoints[index]
+        position = bisect_right(breakpoints, price)
+        
+        # Right at a breakpoint the division can round either way; fall back
+        # to the exact upside comparison of calculate_valuation_score()
+        near = position > 0 and price - breakpoints[position - 1] <= 1e-9 * abs(price)
+        if not near and position < len(breakpoints):
+            near = breakpoints[position] - price <= 1e-9 * abs(price)
+        if near:
+            upside = (self._blended[index] - price) / price
+            return 1 + sum(upside > bound for bound in UPSIDE_BREAKPOINTS.tolist())
+        return self.SCORES[position]
+    
+    def on_tick(self, timestamp, ticker, price):
+        """
+        Process one tick
+        
+        Args:
+            timestamp: tick timestamp (passed through to the event)
+            ticker: ticker symbol
+            price: trade price
+        
+        Returns:
+            event dict when the valuation score changed, else None
+        """
+        start = time.perf_counter_ns()
+        self.ticks += 1
+        
+        index = self.index.get(ticker)
+        if index is None or not price > 0:
+            self.rejected += 1
+            self.latencies.append(time.perf_counter_ns() - start)
+            return None
+        
+        score = self.valuation_score_at(index, price)
+        previous = self.valuation_score[index]
+        event = None
+        if score != previous:
+            self.valuation_score[index] = score
+            old, new = previous - 1, score - 1
+            quadrant = self._quadrant[index]
+            event = {
+                'timestamp': timestamp,
+                'ticker': ticker,
+                'price': price,
+                'valuation_score': score,
+                'previous_valuation_score': previous,
+                'stock_score': self._stock_score[index][new],
+                'previous_stock_score': self._stock_score[index][old],
+                'quadrant': self.pipeline.classifier.QUADRANT_NAMES[quadrant[new]],
+                'previous_quadrant': self.pipeline.classifier.QUADRANT_NAMES[quadrant[old]],
+                'strength': self.pipeline.classifier.STRENGTH_NAMES[self._strength[index][new]],
+                'rating': self.pipeline.classifier.RATING_NAMES[self._rating[index][new]],
+                'quadrant_changed': quadrant[new] != quadrant[old]
+            }
+            self.events += 1
+        
+        self.latencies.append(time.perf_counter_ns() - start)
+        return event
+    
+    def run(self, source, on_event=None):
+        """
+        Consume a tick feed until it ends
+        
+        Malformed lines are counted as rejected ticks and skipped.
+        
+        Args:
+            source: anything open_feed() accepts
+            on_event: optional callback called with every event
+        
+        Returns:
+            list of events (empty if on_event is given)
+        """
+        events = []
+        feed = open_feed(source)
+        try:
+            for timestamp, ticker, price in parse_ticks(feed, self._reject_line):
+                event = self.on_tick(timestamp, ticker, price)
+                if event is not None:
+                    if on_event is None:
+                        events.append(event)
+                    else:
+                        on_event(event)
+        finally:
+            if feed is not source and hasattr(feed, 'close'):
+                feed.close()
+        return events
+    
+    def _reject_line(self, line):
+        """Count a malformed feed line as a rejected tick"""
+        self.ticks += 1
+        self.rejected += 1
+    
+    def latency_stats(self, percentiles=(50, 90, 99, 99.9)):
+        """
+        Per-tick processing latency
+        
+        Returns:
+            dict with tick/event counts (since start) and latency percentiles in
+            microseconds over the last latency_window ticks
+        """
+        latencies = np.array(self.latencies, dtype=np.float64) / 1000
+        stats = {'ticks': self.ticks, 'events': self.events, 'rejected': self.rejected}
+        if len(latencies):
+            for percentile, value in zip(percentiles, np.percentile(latencies, percentiles)):
+                stats[f'p{percentile:g}_us'] = float(value)
+            stats['max_us'] = float(latencies.max())
+            stats['mean_us'] = float(latencies.mean())
+        return stats
@@ -3,35 +3,147 @@ Visualizer Module
 Generate charts and visualizations untuk Quadrant Matrix
 """
 
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import json
+
+import numpy as np
+
+from .classifier import QuadrantClassifier
+
+QUADRANT_NAMES = QuadrantClassifier.QUADRANT_NAMES
+
+
+def _plotly():
+    """Import plotly on first use; it is by far the slowest import of the package"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    return go, make_subplots
+
 
 class QuadrantVisualizer:
     """Visualizer untuk Quadrant Matrix dan score breakdowns"""
     
-    def __init__(self):
+    def __init__(self, webgl_threshold=100, density_threshold=20000, density_bins=60):
+        """
+        Initialize visualizer
+        
+        Args:
+            webgl_threshold: above this many stocks the matrix uses one WebGL trace
+            density_threshold: above this many stocks the matrix shows a density grid
+            density_bins: grid cells per axis of the density view
+        """
         self.colors = {
             'STAR': '#28a745',
             'GROWTH': '#ffc107',
             'VALUE': '#17a2b8',
             'DOG': '#dc3545'
         }
+        self.webgl_threshold = webgl_threshold
+        self.density_threshold = density_threshold
+        self.density_bins = density_bins
+        self._templates = {}
     
-    def create_quadrant_matrix(self, stocks_data, threshold=3.0):
+    def create_quadrant_matrix(self, stocks_data, threshold=3.0, render_mode='auto'):
         """
         Create Quadrant Matrix scatter plot
         
+        Render modes:
+            scatter  - one labelled trace per stock (original look, small N)
+            webgl    - all stocks in one Scattergl trace, colored by quadrant
+            density  - 2D histogram of (CS, SS), payload independent of N
+            auto     - scatter up to webgl_threshold stocks, webgl up to
+                       density_threshold, density above
+        
         Args:
-            stocks_data: list of dicts with keys [ticker, cs, ss, quadrant]
+            stocks_data: list of dicts with keys [ticker, cs, ss, quadrant], or
+                         a dict of equal-length arrays with the same keys
+                         (quadrant as names or QUADRANT_NAMES codes)
             threshold: threshold line (default 3.0)
+            render_mode: 'auto', 'scatter', 'webgl' or 'density'
         
         Returns:
             plotly figure
         """
-        fig = go.Figure()
+        go, _ = _plotly()
+        columns = self._matrix_columns(stocks_data)
+        n = len(columns['cs'])
+        
+        if render_mode == 'auto':
+            if n <= self.webgl_threshold:
+                render_mode = 'scatter'
+            elif n <= self.density_threshold:
+                render_mode = 'webgl'
+            else:
+                render_mode = 'density'
+        
+        fig = self.figure_from_json(self.matrix_template(threshold))
+        
+        if render_mode == 'scatter':
+            self._add_stock_traces(fig, stocks_data)
+        elif render_mode == 'webgl':
+            self._add_webgl_trace(fig, columns)
+        elif render_mode == 'density':
+            self._add_density_trace(fig, columns)
+        else:
+            raise ValueError(f"Unknown render_mode: {render_mode!r}")
+        
+        return fig
+    
+    def matrix_template(self, threshold=3.0):
+        """
+        Serialized quadrant matrix without stocks (background, labels,
+        threshold lines and layout), built once per threshold
         
-        # Add quadrant background rectangles
+        The template is kept as a JSON string, so it cannot be mutated by the
+        figures cloned from it.
+        """
+        template = self._templates.get(threshold)
+        if template is None:
+            go, _ = _plotly()
+            fig = go.Figure()
+            self._add_quadrant_background(fig, threshold)
+            self._apply_matrix_layout(fig)
+            template = self._templates[threshold] = fig.to_json()
+        return template
+    
+    def figure_from_json(self, figure_json):
+        """
+        Rebuild a figure serialized with fig.to_json()
+        
+        The JSON comes from a figure plotly already validated, so validation
+        (most of plotly's construction cost) is skipped.
+        """
+        go, _ = _plotly()
+        return go.Figure(json.loads(figure_json), _validate=False)
+    
+    def _matrix_columns(self, stocks_data):
+        """Normalize matrix input into arrays: ticker, cs, ss, quadrant code"""
+        if isinstance(stocks_data, dict):
+            ticker, cs = stocks_data['ticker'], stocks_data['cs']
+            ss, quadrant = stocks_data['ss'], stocks_data['quadrant']
+        else:
+            ticker = [stock['ticker'] for stock in stocks_data]
+            cs = [stock['cs'] for stock in stocks_data]
+            ss = [stock['ss'] for stock in stocks_data]
+            quadrant = [stock['quadrant'] for stock in stocks_data]
+        
+        quadrant = np.asarray(quadrant)
+        if quadrant.dtype.kind in 'iu':
+            codes = quadrant.astype(np.int8)
+        else:
+            # Unknown names get code -1, drawn gray like the per-stock traces
+            lookup = {name: code for code, name in enumerate(QUADRANT_NAMES)}
+            codes = np.array([lookup.get(name, -1) for name in quadrant.tolist()],
+                             dtype=np.int8)
+        
+        return {
+            'ticker': np.asarray(ticker, dtype=str),
+            'cs': np.asarray(cs, dtype=np.float64),
+            'ss': np.asarray(ss, dtype=np.float64),
+            'quadrant': codes
+        }
+    
+    def _add_quadrant_background(self, fig, threshold):
+        """Quadrant rectangles, labels and threshold lines"""
         quadrants = [
             {'name': 'DOG', 'x': [1, threshold], 'y': [1, threshold], 'color': 'rgba(220, 53, 69, 0.1)'},
             {'name': 'VALUE', 'x': [threshold, 4], 'y': [1, threshold], 'color': 'rgba(23, 162, 184, 0.1)'},
@@ -65,8 +177,21 @@ class QuadrantVisualizer:
                      annotation_text="Threshold", annotation_position="right")
         fig.add_vline(x=threshold, line_dash="dash", line_color="gray",
                      annotation_text="Threshold", annotation_position="top")
+    
+    def _add_stock_traces(self, fig, stocks_data):
+        """One labelled Scatter trace per stock"""
+        go, _ = _plotly()
+        if isinstance(stocks_data, dict):
+            columns = self._matrix_columns(stocks_data)
+            stocks_data = [
+                {'ticker': ticker, 'cs': cs, 'ss': ss,
+                 'quadrant': QUADRANT_NAMES[code] if code >= 0 else 'UNKNOWN'}
+                for ticker, cs, ss, code in zip(
+                    columns['ticker'].tolist(), columns['cs'].tolist(),
+                    columns['ss'].tolist(), columns['quadrant'].tolist()
+                )
+            ]
         
-        # Add stocks as scatter points
         for stock in stocks_data:
             fig.add_trace(go.Scatter(
                 x=[stock['cs']],
@@ -88,8 +213,67 @@ class QuadrantVisualizer:
                     "<extra></extra>"
                 )
             ))
-        
-        # Update layout
+    
+    def _add_webgl_trace(self, fig, columns):
+        """All stocks in one Scattergl trace; color and hover come from per-point codes"""
+        go, _ = _plotly()
+        
+        # Discrete colorscale over the quadrant codes (-1 = unknown, gray)
+        palette = ['gray'] + [self.colors[name] for name in QUADRANT_NAMES]
+        step = 1 / len(palette)
+        colorscale = []
+        for i, color in enumerate(palette):
+            colorscale += [[i * step, color], [(i + 1) * step, color]]
+        
+        names = np.array(('UNKNOWN',) + QUADRANT_NAMES)
+        fig.add_trace(go.Scattergl(
+            x=columns['cs'],
+            y=columns['ss'],
+            mode='markers',
+            customdata=np.stack([columns['ticker'], names[columns['quadrant'] + 1]], axis=1),
+            marker=dict(
+                size=7,
+                color=columns['quadrant'].astype(np.float64),
+                colorscale=colorscale,
+                cmin=-1.5,
+                cmax=len(QUADRANT_NAMES) - 0.5,
+                opacity=0.8,
+                line=dict(width=0)
+            ),
+            hovertemplate=(
+                "<b>%{customdata[0]}</b><br>"
+                "Company Score: %{x:.2f}<br>"
+                "Stock Score: %{y:.2f}<br>"
+                "Quadrant: %{customdata[1]}<br>"
+                "<extra></extra>"
+            )
+        ))
+    
+    def _add_density_trace(self, fig, columns):
+        """2D histogram of (CS, SS) on a fixed grid over the score range"""
+        go, _ = _plotly()
+        edges = np.linspace(1, 4, self.density_bins + 1)
+        counts, _, _ = np.histogram2d(columns['cs'], columns['ss'], bins=(edges, edges))
+        centers = (edges[:-1] + edges[1:]) / 2
+        
+        # Empty bins stay transparent so the quadrant background shows through
+        z = np.where(counts.T > 0, counts.T, np.nan)
+        fig.add_trace(go.Heatmap(
+            x=centers,
+            y=centers,
+            z=z,
+            colorscale='Blues',
+            colorbar=dict(title='Stocks'),
+            hovertemplate=(
+                "Company Score: %{x:.2f}<br>"
+                "Stock Score: %{y:.2f}<br>"
+                "Stocks: %{z}<br>"
+                "<extra></extra>"
+            )
+        ))
+    
+    def _apply_matrix_layout(self, fig):
+        """Title, axes and size of the quadrant matrix"""
         fig.update_layout(
             title={
                 'text': '<b>Quadrant Matrix Classification</b>',
@@ -114,8 +298,6 @@ class QuadrantVisualizer:
             height=600,
             width=800
         )
-        
-        return fig
     
     def create_score_breakdown(self, cs_result, ss_result):
         """
@@ -128,6 +310,8 @@ class QuadrantVisualizer:
         Returns:
             plotly figure
         """
+        go, make_subplots = _plotly()
+        
         # Prepare data
         categories = ['VCS', 'VC', 'FP', 'Valuation', 'Growth']
         scores = [
@@ -207,6 +391,8 @@ class QuadrantVisualizer:
         Returns:
             plotly figure
         """
+        go, make_subplots = _plotly()
+        
         # VCS components
         vcs_categories = ['Lifecycle', 'Porter', 'Management', 'ESG']
         vcs_values = [
@@ -296,6 +482,8 @@ class QuadrantVisualizer:
         Returns:
             plotly figure
         """
+        go, make_subplots = _plotly()
+        
         tickers = [s['ticker'] for s in stocks_comparison]
         cs_scores = [s['company_score'] for s in stocks_comparison]
         ss_scores = [s['stock_score'] for s in stocks_comparison]
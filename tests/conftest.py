@@ -0,0 +1,42 @@
+import copy
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+
+from .synthetic import synthetic_universe
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+@pytest.fixture
+def sample_universe():
+    """data/sample_data.json as {ticker: record}"""
+    with open(os.path.join(DATA, 'sample_data.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def sample_record(sample_universe):
+    """A fresh copy of the AMRT record"""
+    return copy.deepcopy(sample_universe['AMRT'])
+
+
+@pytest.fixture(scope='session')
+def universe():
+    """Synthetic universe of 400 tickers with many exact breakpoint values"""
+    return synthetic_universe(400, seed=7)
+
+
+@pytest.fixture(scope='session')
+def scored(universe):
+    """(pipeline, score() results) of the synthetic universe, one upside NaN"""
+    pipeline = QuadrantPipeline()
+    results = pipeline.score(FinancialPanel.from_universe(universe))
+    results['upside'] = results['upside'].copy()
+    results['upside'][0] = np.nan
+    return pipeline, results
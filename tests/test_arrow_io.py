@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize('name', ['results.parquet', 'results.arrow'])
+def test_arrow_roundtrip_is_exact(scored, tmp_path, name):
+    pytest.importorskip('pyarrow')
+    from src.arrow_io import export_results, load_results
+    
+    pipeline, results = scored
+    path = str(tmp_path / name)
+    export_results(results, path, pipeline)
+    loaded, metadata = load_results(path)
+    
+    assert list(loaded) == list(results)
+    for key, values in results.items():
+        assert loaded[key].dtype == values.dtype, key
+        np.testing.assert_array_equal(loaded[key], values)
+    assert metadata['threshold'] == pipeline.classifier.threshold
+    assert metadata['cs_weights'] == pipeline.calculator.cs_weights
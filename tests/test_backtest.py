@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from src.backtest import PriceStore, QuadrantBacktester, parse_position_size
+from src.panel import FinancialPanel
+
+from .synthetic import synthetic_universe
+
+DATES = ['2024-01-31', '2024-04-30', '2024-07-31']
+
+
+@pytest.mark.parametrize('size, expected', [
+    ('5-8%', 0.065), ('0%', 0.0), ('2.5%', 0.025), (' 1 - 2 % ', 0.015)
+])
+def test_parse_position_size(size, expected):
+    assert parse_position_size(size) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('size', ['', 'n/a', '5-8', '5-%', '8-5%', '5%-8%', None])
+def test_parse_position_size_rejects_invalid(size):
+    with pytest.raises(ValueError):
+        parse_position_size(size)
+
+
+def _snapshots_and_prices(n=12, seed=4):
+    panel = FinancialPanel.from_universe(synthetic_universe(n, seed))
+    rng = np.random.default_rng(seed)
+    prices = rng.uniform(100, 1000, size=(len(DATES), n)).round()
+    prices[1, 0] = np.nan   # no exit price for the first ticker in period 0
+    store = PriceStore(DATES, panel.tickers, prices)
+    return [(date, panel) for date in DATES], store, prices
+
+
+def test_group_means_match_hand_computation():
+    snapshots, store, prices = _snapshots_and_prices()
+    result = QuadrantBacktester().run(snapshots, store)
+    quadrant = result['results']['quadrant']
+    n = prices.shape[1]
+    
+    for p in range(len(DATES) - 1):
+        groups = {}
+        for t in range(n):
+            forward = prices[p + 1, t] / prices[p, t] - 1
+            if np.isfinite(forward):
+                groups.setdefault(int(quadrant[p * n + t]), []).append(forward)
+        for code in range(4):
+            returns = groups.get(code, [])
+            assert result['quadrant_counts'][p, code] == len(returns)
+            if returns:
+                assert result['quadrant_returns'][p, code] == pytest.approx(np.mean(returns))
+            else:
+                assert np.isnan(result['quadrant_returns'][p, code])
+
+
+@pytest.mark.parametrize('max_gross', [0.05, 0.2, 10.0])
+def test_portfolio_respects_position_cap(max_gross):
+    snapshots, store, _ = _snapshots_and_prices(n=40, seed=9)
+    backtester = QuadrantBacktester(max_gross=max_gross)
+    result = backtester.run(snapshots, store)
+    
+    results = result['results']
+    period = result['period']
+    usable = np.isfinite(result['forward_return'])
+    target = np.where(usable, backtester.position_sizes[results['quadrant'], results['strength']], 0)
+    for p in range(len(DATES) - 1):
+        wanted = target[period == p].sum()
+        assert result['portfolio_gross'][p] <= max_gross + 1e-12
+        assert result['portfolio_gross'][p] == pytest.approx(min(wanted, max_gross))
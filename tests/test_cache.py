@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from src.cache import CachedCalculator, CachedClassifier, ScoreCache, stable_hash
+from src.calculator import QuadrantCalculator
+from src.classifier import QuadrantClassifier
+
+from .synthetic import synthetic_universe
+from .test_calculator import scalar_scores
+
+
+def test_stable_hash_is_order_and_type_insensitive():
+    assert stable_hash({'a': 1, 'b': [2, 3.5]}) == stable_hash({'b': [2.0, 3.5], 'a': 1.0})
+    assert stable_hash([3]) == stable_hash([3.0]) == stable_hash([np.int64(3)])
+    assert stable_hash({'x': np.array([1, 2])}) == stable_hash({'x': (1.0, 2.0)})
+    assert stable_hash([True]) != stable_hash([1.0])
+    assert stable_hash([3]) != stable_hash([3.01])
+    with pytest.raises(TypeError):
+        stable_hash([object()])
+
+
+def test_hit_and_miss():
+    cache = ScoreCache(maxsize=4)
+    key = cache.make_key('classify', 'cfg', [3, 4])
+    assert cache.get(key) is None
+    cache.put(key, {'quadrant': 'STAR'}, 'classify', 'cfg')
+    assert cache.get(key) == {'quadrant': 'STAR'}
+    assert cache.make_key('classify', 'cfg', [3.0, 4.0]) == key
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (1, 1, 1)
+
+
+def test_lru_eviction_order_at_bound():
+    cache = ScoreCache(maxsize=3)
+    for key in 'abc':
+        cache.put(key, key)
+    cache.get('a')             # 'b' is now least recently used
+    cache.put('d', 'd')
+    assert list(cache.entries) == ['c', 'a', 'd']
+    cache.put('e', 'e')
+    assert list(cache.entries) == ['a', 'd', 'e']
+    assert cache.stats()['evictions'] == 2
+
+
+def test_save_load_roundtrip(tmp_path):
+    path = str(tmp_path / 'scores.json')
+    cache = ScoreCache(maxsize=10, path=path)
+    for i in range(5):
+        cache.put(f'k{i}', {'score': np.float64(i / 3), 'n': i}, 'ns', 'cfg')
+    cache.save()
+    
+    loaded = ScoreCache(maxsize=3, path=path)
+    assert list(loaded.entries) == ['k2', 'k3', 'k4']
+    assert loaded.get('k4') == {'score': 4 / 3, 'n': 4}
+    assert loaded.entries['k2'][:2] == ('ns', 'cfg')
+    
+    (tmp_path / 'bad.json').write_text('[1, 2]')
+    with pytest.raises(ValueError):
+        ScoreCache(path=str(tmp_path / 'bad.json'))
+
+
+def test_cached_equals_uncached():
+    calc = QuadrantCalculator()
+    classifier = QuadrantClassifier()
+    cached_calc = CachedCalculator(QuadrantCalculator(), ScoreCache())
+    cached_classifier = CachedClassifier(QuadrantClassifier(), cached_calc.cache)
+    
+    records = list(synthetic_universe(40, seed=3).values())
+    for _ in range(2):   # second pass is served from the cache
+        for record in records:
+            vc, fp, cs, ss = scalar_scores(calc, record)
+            assert cached_calc.calculate_company_score(record['vcs_data'], vc, fp) == cs
+            assert cached_calc.calculate_stock_score(
+                record['valuation_data'], record['growth_data']) == ss
+            assert (cached_classifier.classify(cs['company_score'], ss['stock_score'])
+                    == classifier.classify(cs['company_score'], ss['stock_score']))
+    assert cached_calc.cache.hits >= 3 * len(records)
+    
+    # A weight change is never served a stale result
+    calc.cs_weights = cached_calc.target.cs_weights = {'vcs': 0.5, 'vc': 0.3, 'fp': 0.2}
+    vc, fp, cs, _ = scalar_scores(calc, records[0])
+    assert cached_calc.calculate_company_score(records[0]['vcs_data'], vc, fp) == cs
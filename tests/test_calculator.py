@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from src.calculator import QuadrantCalculator
+from src.classifier import QuadrantClassifier
+from src.kernels import DISCREPANCY_BREAKPOINTS, round_like_python, score_by_breakpoints
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+
+from .synthetic import synthetic_universe
+
+VC_SCORERS = {
+    'roa': lambda calc, h, p, macro: calc.calculate_roa_score(h, p),
+    'ebit_margin': lambda calc, h, p, macro: calc.calculate_ebit_margin_score(h, p),
+    'sales_growth': lambda calc, h, p, macro: calc.calculate_sales_growth_score(
+        h, p, macro['nominal_gdp']),
+    'profit_growth': lambda calc, h, p, macro: calc.calculate_profit_growth_score(
+        h, p, macro['real_gdp'])
+}
+FP_SCORERS = {
+    'ocf_ebit': QuadrantCalculator.calculate_ocf_ebit_score,
+    'equity_asset': QuadrantCalculator.calculate_equity_asset_score,
+    'cash_asset': QuadrantCalculator.calculate_cash_asset_score
+}
+
+
+def scalar_scores(calc, record):
+    """CS and SS of one record through the scalar methods, as app.py does"""
+    h, p = record['historical_data'], record['projected_data']
+    vc = {name: scorer(calc, h, p, record['macro_data']) for name, scorer in VC_SCORERS.items()}
+    fp = {name: scorer(calc, h, p) for name, scorer in FP_SCORERS.items()}
+    cs = calc.calculate_company_score(record['vcs_data'], vc, fp)
+    ss = calc.calculate_stock_score(record['valuation_data'], record['growth_data'])
+    return vc, fp, cs, ss
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_batch_scores_match_scalar(seed):
+    panel = FinancialPanel.from_universe(synthetic_universe(300, seed))
+    calc = QuadrantCalculator()
+    
+    vc_batch = calc.calculate_vc_scores_batch(panel)
+    fp_batch = calc.calculate_fp_scores_batch(panel)
+    cs_batch = calc.calculate_company_score_batch(panel.section('vcs_data'), vc_batch, fp_batch)
+    ss_batch = calc.calculate_stock_score_batch(
+        panel.section('valuation_data'), panel.section('growth_data')
+    )
+    
+    for i in range(len(panel)):
+        vc, fp, cs, ss = scalar_scores(calc, panel.record(i))
+        for name in VC_SCORERS:
+            assert vc_batch[name][i] == vc[name], (i, name)
+        for name in FP_SCORERS:
+            assert fp_batch[name][i] == fp[name], (i, name)
+        for key, value in cs.items():
+            if key != 'breakdown':
+                assert cs_batch[key][i] == value, (i, key)
+        for key, value in ss.items():
+            if key != 'breakdown':
+                assert ss_batch[key][i] == value, (i, key)
+        for key, value in ss['breakdown']['growth'].items():
+            assert ss_batch['breakdown']['growth'][key][i] == value, (i, key)
+
+
+def test_pipeline_matches_scalar_classification(universe):
+    panel = FinancialPanel.from_universe(universe)
+    pipeline = QuadrantPipeline()
+    calc, classifier = pipeline.calculator, pipeline.classifier
+    records = pipeline.to_records(pipeline.score(panel))
+    
+    for i, row in enumerate(records):
+        record = panel.record(i)
+        _, _, cs, ss = scalar_scores(calc, record)
+        quadrant_info = classifier.classify(cs['company_score'], ss['stock_score'])
+        recommendation = classifier.get_investment_recommendation(
+            quadrant_info, ss['blended_tp'], record['company_info']['current_price']
+        )
+        assert row['quadrant'] == quadrant_info['name']
+        assert row['strength'] == quadrant_info['position']['strength']
+        for key in ('rating', 'priority', 'upside', 'position_sizing', 'time_horizon'):
+            expected = recommendation[key]
+            actual = row['recommendation_upside' if key == 'upside' else key]
+            assert actual == expected, (i, key)
+        assert row['risk_factors'] == ('; '.join(recommendation['risk_factors'])
+                                       or 'Minimal risk factors')
+
+
+@pytest.mark.parametrize('kind', ['ratio', 'growth'])
+def test_discrepancy_batch_matches_ladder_on_boundaries(kind):
+    calc = QuadrantCalculator()
+    historical = np.repeat([0.0, 0.05, 0.123], 9)
+    # Futures landing on, just above and just below every breakpoint
+    offsets = np.tile(DISCREPANCY_BREAKPOINTS[kind] / 100, 9)
+    future = historical + offsets
+    future = np.concatenate([future, np.nextafter(future, np.inf),
+                             np.nextafter(future, -np.inf), [np.nan]])
+    historical = np.concatenate([historical] * 3 + [[0.0]])
+    
+    batch = calc.score_discrepancy_batch(future, historical, kind)
+    expected = [calc.score_discrepancy(f, h, kind)
+                for f, h in zip(future.tolist(), historical.tolist())]
+    assert batch.tolist() == expected
+    
+    bps = DISCREPANCY_BREAKPOINTS[kind]
+    assert score_by_breakpoints(bps, bps).tolist() == [1, 2, 3]
+    assert score_by_breakpoints(np.nextafter(bps, np.inf), bps).tolist() == [2, 3, 4]
+
+
+def test_round_like_python_on_ties():
+    rng = np.random.default_rng(5)
+    values = np.concatenate([
+        np.arange(-1000, 1000) / 1000 + 0.005,        # x.xx5 ties
+        rng.normal(0, 100, 2000),
+        [0.125, 2.675, 1.005, 1e300, -0.0, np.inf, np.nan]
+    ])
+    rounded = round_like_python(values)
+    for value, result in zip(values.tolist(), rounded.tolist()):
+        expected = round(value, 2)
+        assert result == expected or (np.isnan(result) and np.isnan(expected)), value
+
+
+def test_classifier_threshold_is_respected(universe):
+    panel = FinancialPanel.from_universe(universe)
+    for threshold in (2.5, 3.0, 3.5):
+        results = QuadrantPipeline(classifier=QuadrantClassifier(threshold)).score(panel)
+        high_cs = results['company_score'] >= threshold
+        high_ss = results['stock_score'] >= threshold
+        np.testing.assert_array_equal(results['quadrant'] == 0, high_cs & high_ss)
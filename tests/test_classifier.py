@@ -0,0 +1,45 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.classifier import QuadrantClassifier
+
+NAN = float('nan')
+
+# Exact threshold and strength boundaries (3.0 +- 0.3 / 0.7) plus NaN
+SCORES = [1.0, 2.29, 2.3, 2.7, 2.71, 2.99, 3.0, 3.01, 3.29, 3.3, 3.7, 3.71, 4.0, NAN]
+
+
+@pytest.mark.parametrize('threshold', [2.8, 3.0])
+def test_classify_batch_matches_classify(threshold):
+    classifier = QuadrantClassifier(threshold=threshold)
+    pairs = list(itertools.product(SCORES, SCORES))
+    batch = classifier.classify_batch([cs for cs, _ in pairs], [ss for _, ss in pairs])
+    
+    for i, (cs, ss) in enumerate(pairs):
+        scalar = classifier.classify(cs, ss)
+        assert classifier.QUADRANT_NAMES[batch['quadrant'][i]] == scalar['name'], (cs, ss)
+        assert classifier.STRENGTH_NAMES[batch['strength'][i]] == scalar['position']['strength']
+        expanded = classifier.expand_classification(batch, i)
+        assert expanded['name'] == scalar['name']
+        assert expanded['position']['strength'] == scalar['position']['strength']
+
+
+@pytest.mark.parametrize('cs, ss', [(NAN, 4.0), (4.0, NAN), (NAN, NAN), (1.0, NAN)])
+def test_nan_scores_classify_as_dog(cs, ss):
+    classifier = QuadrantClassifier()
+    batch = classifier.classify_batch([cs], [ss])
+    assert classifier.QUADRANT_NAMES[batch['quadrant'][0]] == 'DOG'
+
+
+def test_compare_stocks_top_matches_full_sort():
+    rng = np.random.default_rng(3)
+    classifier = QuadrantClassifier()
+    stocks = [
+        {'ticker': f'T{i}', 'cs': float(rng.choice(SCORES[:-1])), 'ss': float(rng.choice(SCORES[:-1])),
+         'target_price': float(rng.integers(80, 130)), 'current_price': 100.0}
+        for i in range(200)
+    ]
+    full = classifier.compare_stocks(stocks)
+    assert classifier.compare_stocks(stocks, top=25) == full[:25]
@@ -0,0 +1,70 @@
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from src.cli import main, write_results
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+
+
+@pytest.fixture
+def universe_file(universe, tmp_path):
+    path = tmp_path / 'universe.json'
+    path.write_text(json.dumps(universe))
+    return path
+
+
+def test_outputs_agree_across_formats(universe, universe_file, tmp_path):
+    pytest.importorskip('pyarrow')
+    from src.arrow_io import load_results
+    
+    for name in ('out.csv', 'out.json', 'out.parquet'):
+        assert main([str(universe_file), '-o', str(tmp_path / name), '-q']) == 0
+    
+    expected = QuadrantPipeline().score(FinancialPanel.from_universe(universe))
+    with open(tmp_path / 'out.csv', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    records = json.loads((tmp_path / 'out.json').read_text())
+    table, _ = load_results(str(tmp_path / 'out.parquet'))
+    
+    assert [row['ticker'] for row in rows] == expected['ticker'].tolist()
+    assert [record['company_score'] for record in records] == expected['company_score'].tolist()
+    np.testing.assert_array_equal(table['quadrant'], expected['quadrant'])
+
+
+def test_chunked_and_cached_runs_match(universe_file, tmp_path):
+    outputs = []
+    for i, extra in enumerate(([], ['--chunk-size', '33'], ['--cache'], ['--cache'])):
+        out = tmp_path / f'out{i}.csv'
+        assert main([str(universe_file), '-o', str(out), '-q'] + extra) == 0
+        outputs.append(out.read_text())
+    assert len(set(outputs)) == 1
+
+
+def test_write_results_rejects_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        write_results([{'ticker': 'A'}], str(tmp_path / 'out.parquet'))
+
+
+@pytest.mark.parametrize('extra', [
+    ['-j', '2', '--sector-relative', 'zscore'],
+    ['-j', '2', '--chunk-size', '10'],
+    ['--chunk-size', '10', '--cache'],
+    ['--chunk-size', '0'],
+    ['-j', '0']
+])
+def test_conflicting_flags_are_rejected(universe_file, extra, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main([str(universe_file), '-q'] + extra)
+    assert exc.value.code == 2
+    assert 'error:' in capsys.readouterr().err
+
+
+def test_chunk_size_needs_json_input(tmp_path, capsys):
+    path = tmp_path / 'universe.csv'
+    path.write_text('ticker\n')
+    with pytest.raises(SystemExit):
+        main([str(path), '--chunk-size', '10'])
+    assert '.json' in capsys.readouterr().err
@@ -0,0 +1,60 @@
+import copy
+
+import numpy as np
+
+from src.diff import DRIVER_NAMES, SnapshotDiff
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+
+from .synthetic import synthetic_universe
+
+
+def _score(universe):
+    return QuadrantPipeline().score(FinancialPanel.from_universe(universe))
+
+
+def test_added_removed_and_migrations():
+    universe = synthetic_universe(120, seed=8)
+    tickers = list(universe)
+    before_universe = {ticker: universe[ticker] for ticker in tickers[:100]}
+    after_universe = copy.deepcopy({ticker: universe[ticker] for ticker in tickers[20:]})
+    # Halve or double the price of a third of the common tickers
+    for i, ticker in enumerate(tickers[20:100:3]):
+        valuation = after_universe[ticker]['valuation_data']
+        valuation['current_price'] *= 0.5 if i % 2 else 2.0
+    
+    before, after = _score(before_universe), _score(after_universe)
+    differ = SnapshotDiff()
+    result = differ.diff(before, after)
+    
+    assert result['added'].tolist() == tickers[100:]
+    assert result['removed'].tolist() == tickers[:20]
+    assert result['ticker'].tolist() == tickers[20:100]
+    
+    names = differ.classifier.QUADRANT_NAMES
+    quadrant_before = dict(zip(before['ticker'].tolist(), before['quadrant'].tolist()))
+    quadrant_after = dict(zip(after['ticker'].tolist(), after['quadrant'].tolist()))
+    expected = np.zeros((4, 4), dtype=np.int64)
+    moved = []
+    for ticker in tickers[20:100]:
+        expected[quadrant_before[ticker], quadrant_after[ticker]] += 1
+        if quadrant_before[ticker] != quadrant_after[ticker]:
+            moved.append(ticker)
+    assert np.array_equal(result['transition'], expected)
+    assert result['transition'].sum() == 80
+    assert result['ticker'][result['moved']].tolist() == moved
+    assert moved   # the perturbation did move tickers
+    
+    # Only prices changed, so every migration is driven by valuation
+    assert set(np.asarray(DRIVER_NAMES)[result['driver'][result['moved']]]) == {'valuation'}
+    
+    table = differ.transition_table(result)
+    assert table[names[0]][names[1]] == expected[0, 1]
+    for source in range(4):
+        for target in range(4):
+            migrated = differ.migrations(result, names[source], names[target])
+            assert len(migrated['ticker']) == expected[source, target]
+    assert [row['ticker'] for row in differ.to_records(result)] == moved
+    
+    assert np.array_equal(differ.history([before, after, after])[1], np.diag(np.bincount(
+        after['quadrant'], minlength=4)))
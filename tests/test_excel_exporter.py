@@ -0,0 +1,33 @@
+import math
+
+import pytest
+
+
+def test_excel_export_matches_records(scored, tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    from src.excel_exporter import ExcelExporter
+    
+    pipeline, results = scored
+    path = str(tmp_path / 'results.xlsx')
+    exporter = ExcelExporter(pipeline.classifier, chunk_size=64)
+    summary = exporter.export(results, path)
+    sheets = exporter.sheet_columns(results)
+    assert summary['rows'] == len(sheets) * len(results['ticker'])
+    
+    records = pipeline.to_records(results)
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    for sheet, columns in sheets.items():
+        rows = list(workbook[sheet].iter_rows(values_only=True))
+        assert list(rows[0]) == columns
+        assert len(rows) == len(records) + 1
+        for i, (record, row) in enumerate(zip(records, rows[1:])):
+            for column, value in zip(columns, row):
+                expected = results['risk_flags'][i] if column == 'risk_flags' else record[column]
+                if isinstance(expected, float) and not math.isfinite(expected):
+                    assert value is None
+                elif isinstance(expected, float):
+                    # openpyxl writes floats with 16 significant digits
+                    assert value == pytest.approx(expected, rel=1e-15, abs=1e-15), (sheet, column)
+                else:
+                    assert value == expected, (sheet, column)
+    workbook.close()
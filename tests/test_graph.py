@@ -0,0 +1,70 @@
+import numpy as np
+
+from src.graph import ScoringGraph
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+
+
+def _assert_results_equal(actual, expected):
+    assert list(actual) == list(expected)
+    for key in expected:
+        np.testing.assert_array_equal(actual[key], expected[key], err_msg=key)
+
+
+def test_graph_matches_pipeline(universe):
+    panel = FinancialPanel.from_universe(universe)
+    graph = ScoringGraph()
+    graph.update_from_panel(panel)
+    _assert_results_equal(graph.results(), QuadrantPipeline().score(panel))
+    assert graph.last_recomputed == list(ScoringGraph.NODES)
+
+
+def test_price_update_recomputes_only_downstream(universe):
+    panel = FinancialPanel.from_universe(universe)
+    graph = ScoringGraph()
+    graph.update_from_panel(panel)
+    graph.compute()
+    
+    valuation = panel.section('valuation_data')
+    new_price = valuation['current_price'] * 0.8
+    assert graph.update(current_price=new_price) == ['current_price']
+    results = graph.results()
+    assert graph.last_recomputed == ['valuation', 'stock_score', 'classification',
+                                     'recommendation']
+    
+    panel.sections['valuation_data']['current_price'] = new_price
+    _assert_results_equal(results, QuadrantPipeline().score(panel))
+
+
+def test_unchanged_update_recomputes_nothing(universe):
+    panel = FinancialPanel.from_universe(universe)
+    graph = ScoringGraph()
+    graph.update_from_panel(panel)
+    graph.compute()
+    
+    assert graph.update_from_panel(FinancialPanel.from_universe(universe)) == []
+    assert graph.compute() == []
+
+
+def test_financials_and_threshold_changes(universe):
+    panel = FinancialPanel.from_universe(universe)
+    graph = ScoringGraph()
+    graph.update_from_panel(panel)
+    graph.compute()
+    
+    changed = panel.take(np.arange(len(panel)))
+    changed.projected[:, :, 0] *= 1.2
+    graph.update(financials=changed)
+    graph.compute()
+    assert graph.last_recomputed == ['vc', 'fp', 'company_score', 'classification',
+                                     'recommendation']
+    
+    graph.classifier.threshold = 2.5
+    graph.invalidate('classification')
+    results = graph.results()
+    assert graph.last_recomputed == ['classification', 'recommendation']
+    
+    pipeline = QuadrantPipeline()
+    pipeline.classifier.threshold = 2.5
+    changed.sections = panel.sections
+    _assert_results_equal(results, pipeline.score(changed))
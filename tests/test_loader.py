@@ -0,0 +1,125 @@
+import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src import loader
+from src.loader import (_swap_cache, iter_universe_chunks, iter_universe_json,
+                        load_universe, load_universe_cached)
+
+
+def _write(tmp_path, universe):
+    path = tmp_path / 'universe.json'
+    path.write_text(json.dumps(universe, indent=1))
+    return str(path)
+
+
+def test_iter_universe_json_matches_json_load(universe, tmp_path):
+    path = _write(tmp_path, universe)
+    assert dict(iter_universe_json(path, buffer_size=257)) == universe
+    
+    chunks = list(iter_universe_chunks(path, chunk_size=64))
+    assert [len(chunk) for chunk in chunks] == [64] * 6 + [16]
+    assert np.concatenate([chunk.tickers for chunk in chunks]).tolist() == list(universe)
+
+
+def test_large_record_is_read_geometrically(sample_record, tmp_path, monkeypatch):
+    record = dict(sample_record, notes='x' * 1_000_000)
+    universe = {'SMALL': sample_record, 'LARGE': record, 'AFTER': sample_record}
+    path = _write(tmp_path, universe)
+    
+    reads = []
+    
+    class CountingFile:
+        def __init__(self, f):
+            self.f = f
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc_info):
+            self.f.close()
+        
+        def read(self, size):
+            reads.append(size)
+            return self.f.read(size)
+    
+    monkeypatch.setattr(loader, 'open', lambda *args, **kwargs: CountingFile(open(*args, **kwargs)),
+                        raising=False)
+    assert dict(iter_universe_json(path, buffer_size=1024)) == universe
+    assert len(reads) < 30
+    assert max(reads) >= 500_000
+
+
+def test_cached_panel_equals_source(universe, tmp_path):
+    path = _write(tmp_path, universe)
+    source = load_universe(path)
+    
+    for _ in range(2):
+        cached = load_universe_cached(path)
+        np.testing.assert_array_equal(cached.historical, source.historical)
+        np.testing.assert_array_equal(cached.tickers, source.tickers)
+        assert cached.info['sector'].tolist() == source.info['sector'].tolist()
+
+
+def test_cache_dir_uses_umask_permissions(universe, tmp_path):
+    path = _write(tmp_path, universe)
+    umask = os.umask(0o022)
+    try:
+        load_universe_cached(path)
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(path + '.panel').st_mode) == 0o755
+
+
+def test_lost_swap_never_fails_the_load(universe, tmp_path, monkeypatch):
+    path = _write(tmp_path, universe)
+    
+    def lost(staging, cache_dir):
+        # Another rebuild won, and a third one already retired its cache
+        return False
+    monkeypatch.setattr(loader, '_swap_cache', lost)
+    
+    panel = load_universe_cached(path)
+    assert panel.tickers.tolist() == list(universe)
+    assert os.listdir(tmp_path) == ['universe.json']
+
+
+def test_swap_reports_lost_race(tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    staging = tmp_path / 'staging'
+    for directory in (cache_dir, staging):
+        directory.mkdir()
+        (directory / 'meta.json').write_text('{}')
+    
+    real_replace = os.replace
+    calls = []
+    
+    def replace(src, dst):
+        calls.append(src)
+        real_replace(src, dst)
+        if len(calls) == 1:
+            # A concurrent rebuild swaps its cache in right after we retired ours
+            winner = tmp_path / 'winner'
+            winner.mkdir()
+            (winner / 'meta.json').write_text('{"winner": true}')
+            real_replace(winner, cache_dir)
+    
+    monkeypatch.setattr(os, 'replace', replace)
+    assert _swap_cache(str(staging), str(cache_dir)) is False
+    monkeypatch.undo()
+    assert (cache_dir / 'meta.json').read_text() == '{"winner": true}'
+
+
+def test_concurrent_rebuilds(universe, tmp_path):
+    path = _write(tmp_path, universe)
+    
+    for rebuild in range(5):
+        if rebuild:
+            os.utime(path, ns=(rebuild, rebuild))   # stale fingerprint: everyone rebuilds
+        with ThreadPoolExecutor(8) as pool:
+            panels = list(pool.map(lambda _: load_universe_cached(path), range(16)))
+        assert all(len(panel) == len(universe) for panel in panels)
+        assert sorted(os.listdir(tmp_path)) == ['universe.json', 'universe.json.panel']
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.panel import FinancialPanel
+from src.parallel import ParallelScorer, build_pipeline
+
+SCENARIOS = [
+    {},
+    {'threshold': 2.7},
+    {'cs_weights': {'vcs': 0.4, 'vc': 0.4, 'fp': 0.2}, 'ss_weights': {'valuation': 0.5, 'growth': 0.5}}
+]
+
+
+@pytest.fixture(scope='module')
+def panel(universe):
+    return FinancialPanel.from_universe(universe)
+
+
+@pytest.mark.parametrize('chunk_size', [None, 37])
+def test_parallel_matches_serial(panel, chunk_size):
+    scorer = ParallelScorer(workers=2, chunk_size=chunk_size)
+    parallel = scorer.score_scenarios(panel, SCENARIOS)
+    
+    for scenario, result in zip(SCENARIOS, parallel):
+        serial = build_pipeline(scenario).score(panel)
+        assert list(result) == list(serial)
+        for key in serial:
+            assert result[key].dtype == serial[key].dtype, key
+            np.testing.assert_array_equal(result[key], serial[key], err_msg=key)
+
+
+def test_scenarios_change_results(panel):
+    base, low, reweighted = ParallelScorer(workers=2).score_scenarios(panel, SCENARIOS)
+    np.testing.assert_array_equal(low['company_score'], base['company_score'])
+    assert (low['quadrant'] != base['quadrant']).any()
+    assert (reweighted['company_score'] != base['company_score']).any()
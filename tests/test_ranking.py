@@ -0,0 +1,75 @@
+import random
+from bisect import bisect_left, insort
+
+import pytest
+
+from src.classifier import QuadrantClassifier
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+from src.ranking import SkipList, StockRanking
+
+
+def _stocks_data(results):
+    return [
+        {'ticker': ticker, 'cs': cs, 'ss': ss, 'target_price': tp, 'current_price': price}
+        for ticker, cs, ss, tp, price in zip(
+            results['ticker'].tolist(), results['company_score'].tolist(),
+            results['stock_score'].tolist(), results['target_price'].tolist(),
+            results['current_price'].tolist()
+        )
+    ]
+
+
+def test_ranking_matches_compare_stocks_after_updates(universe):
+    results = QuadrantPipeline().score(FinancialPanel.from_universe(universe))
+    stocks = _stocks_data(results)
+    classifier = QuadrantClassifier()
+    
+    ranking = StockRanking(classifier)
+    ranking.load_results(results)
+    assert ranking.top(len(stocks)) == classifier.compare_stocks(stocks)
+    
+    # Re-rank a few stocks, drop one and add one
+    for stock in stocks[:30:3]:
+        stock['ss'] = round(6.0 - stock['ss'], 2)
+        stock['current_price'] *= 0.9
+        ranking.update(stock['ticker'], stock['cs'], stock['ss'],
+                       stock['target_price'], stock['current_price'])
+    removed = stocks.pop(5)
+    ranking.remove(removed['ticker'])
+    new = {'ticker': 'NEW', 'cs': 3.5, 'ss': 3.5, 'target_price': 150.0, 'current_price': 100.0}
+    stocks.append(new)
+    ranking.update(**{'ticker': 'NEW', 'company_score': 3.5, 'stock_score': 3.5,
+                      'target_price': 150.0, 'current_price': 100.0})
+    
+    expected = classifier.compare_stocks(stocks)
+    assert ranking.top(len(stocks)) == expected
+    assert ranking.rank('NEW') == [row['ticker'] for row in expected].index('NEW')
+
+
+@pytest.mark.parametrize('initial', [0, 1, 500])
+def test_skip_list_matches_sorted_list(initial):
+    rng = random.Random(initial)
+    reference = sorted(rng.sample(range(10**6), initial))
+    skip_list = SkipList(reference)
+    
+    for _ in range(3000):
+        if reference and rng.random() < 0.45:
+            key = rng.choice(reference)
+            reference.remove(key)
+            skip_list.remove(key)
+        else:
+            key = rng.randrange(10**6)
+            if key in reference:
+                continue
+            insort(reference, key)
+            skip_list.insert(key)
+        probe = rng.randrange(10**6)
+        assert skip_list.rank(probe) == bisect_left(reference, probe)
+    
+    assert len(skip_list) == len(reference)
+    assert list(skip_list) == reference
+    assert skip_list.head(10) == reference[:10]
+    assert [skip_list.rank(key) for key in reference] == list(range(len(reference)))
+    with pytest.raises(KeyError):
+        skip_list.remove(-1)
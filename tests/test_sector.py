@@ -0,0 +1,72 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.cli import main
+from src.loader import iter_universe_chunks
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+from src.sector import SectorNormalizer
+
+
+@pytest.mark.parametrize('method', ['percentile', 'zscore'])
+def test_fit_chunks_matches_fit(universe, tmp_path, method):
+    path = tmp_path / 'universe.json'
+    path.write_text(json.dumps(universe))
+    
+    whole = SectorNormalizer(method).fit(FinancialPanel.from_universe(universe))
+    streamed = SectorNormalizer(method).fit_chunks(iter_universe_chunks(str(path), 70))
+    
+    panel = FinancialPanel.from_universe(universe)
+    np.testing.assert_array_equal(whole.transform(panel), streamed.transform(panel))
+
+
+@pytest.mark.parametrize('method', ['percentile', 'zscore'])
+def test_streamed_cli_matches_full_load(universe, tmp_path, method):
+    path = tmp_path / 'universe.json'
+    path.write_text(json.dumps(universe))
+    
+    main([str(path), '-o', str(tmp_path / 'full.csv'), '--sector-relative', method, '-q'])
+    main([str(path), '-o', str(tmp_path / 'chunked.csv'), '--sector-relative', method,
+          '--chunk-size', '70', '-q'])
+    
+    assert (tmp_path / 'full.csv').read_text() == (tmp_path / 'chunked.csv').read_text()
+
+
+def test_relative_positions_are_centred_per_sector(universe):
+    panel = FinancialPanel.from_universe(universe)
+    sectors = panel.info['sector']
+    
+    percentile = SectorNormalizer('percentile').fit(panel).transform(panel)
+    zscore = SectorNormalizer('zscore').fit(panel).transform(panel)
+    for sector in np.unique(sectors):
+        rows = sectors == sector
+        assert np.nanmean(percentile[rows], axis=0) == pytest.approx(0.5, abs=0.02)
+        assert np.nanmean(zscore[rows], axis=0) == pytest.approx(0.0, abs=1e-9)
+
+
+def test_stats_are_reused_and_default_path_unchanged(universe):
+    panel = FinancialPanel.from_universe(universe)
+    normalizer = SectorNormalizer()
+    pipeline = QuadrantPipeline(sector_normalizer=normalizer)
+    
+    pipeline.score(panel)
+    stats = normalizer.stats
+    pipeline.score(panel.take(np.arange(10)))
+    assert normalizer.stats is stats
+    
+    default = QuadrantPipeline().score(panel)
+    relative = pipeline.score(panel)
+    np.testing.assert_array_equal(default['valuation_score'], relative['valuation_score'])
+    np.testing.assert_array_equal(default['vcs_score'], relative['vcs_score'])
+
+
+def test_unknown_sector_uses_universe_stats(universe):
+    panel = FinancialPanel.from_universe(universe)
+    normalizer = SectorNormalizer().fit(panel)
+    
+    record = dict(universe['T00000'])
+    record['company_info'] = dict(record['company_info'], sector='Unknown')
+    relative = normalizer.transform(FinancialPanel.from_records(['X'], [record]))
+    assert np.isfinite(relative).all()
@@ -0,0 +1,48 @@
+import itertools
+
+import numpy as np
+
+from src.calculator import QuadrantCalculator
+from src.classifier import QuadrantClassifier
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+from src.sensitivity import SensitivitySweep
+
+THRESHOLDS = [2.5, 2.75, 3.0, 3.25, 3.5]
+CS_GRID = [
+    {'vcs': 0.50, 'vc': 0.35, 'fp': 0.15},
+    {'vcs': 0.40, 'vc': 0.40, 'fp': 0.20},
+    {'vcs': 0.30, 'vc': 0.50, 'fp': 0.20}
+]
+SS_GRID = [
+    {'valuation': 0.65, 'growth': 0.35},
+    {'valuation': 0.50, 'growth': 0.50},
+    {'valuation': 0.35, 'growth': 0.65}
+]
+
+
+def test_sweep_matches_rerunning_pipeline(universe, scored):
+    pipeline, results = scored
+    panel = FinancialPanel.from_universe(universe)
+    sweep = SensitivitySweep(pipeline.calculator, pipeline.classifier).run(
+        results, THRESHOLDS, CS_GRID, SS_GRID
+    )
+    
+    mismatches = 0
+    grid = itertools.product(CS_GRID, SS_GRID, THRESHOLDS)
+    for g, (cs_weights, ss_weights, threshold) in enumerate(grid):
+        calculator = QuadrantCalculator()
+        calculator.cs_weights = dict(cs_weights)
+        calculator.ss_weights = dict(ss_weights)
+        rerun = QuadrantPipeline(calculator, QuadrantClassifier(threshold)).score(panel)
+        mismatches += int((sweep['quadrant'][:, g] != rerun['quadrant']).sum())
+        assert np.array_equal(
+            sweep['counts'][g],
+            np.bincount(rerun['quadrant'], minlength=4)
+        )
+    assert mismatches == 0
+    
+    baseline = pipeline.score(panel)['quadrant']
+    assert np.array_equal(sweep['baseline'], baseline)
+    default = THRESHOLDS.index(3.0)   # default weights come first in both grids
+    assert sweep['changed'][default] == []
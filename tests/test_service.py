@@ -0,0 +1,153 @@
+import asyncio
+import copy
+import json
+
+from src.service import ScoringService
+
+
+async def _request(host, port, raw):
+    """Send raw request bytes and return (status, decoded JSON body)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(raw)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+        return status, json.loads(await reader.readexactly(length))
+    finally:
+        writer.close()
+
+
+def _post(payload):
+    body = json.dumps(payload).encode('utf-8')
+    return (f"POST /score HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n").encode('latin-1') + body
+
+
+def _with_service(scenario, **kwargs):
+    async def main():
+        service = ScoringService(**kwargs)
+        host, port = await service.start('127.0.0.1', 0)
+        try:
+            return await asyncio.wait_for(scenario(service, host, port), 10)
+        finally:
+            await service.stop()
+    return asyncio.run(main())
+
+
+def test_score_returns_row_per_ticker(sample_record):
+    async def scenario(service, host, port):
+        return await _request(host, port, _post({'AMRT': sample_record}))
+    
+    status, body = _with_service(scenario)
+    assert status == 200
+    assert body['AMRT']['company_name'] == 'PT Sumber Alfaria Trijaya Tbk'
+    assert body['AMRT']['quadrant'] in ('STAR', 'GROWTH', 'VALUE', 'DOG')
+
+
+def test_malformed_sections_return_400_and_service_keeps_serving(sample_record):
+    bad = copy.deepcopy(sample_record)
+    bad['historical_data'] = 5
+    
+    async def scenario(service, host, port):
+        first = await _request(host, port, _post({'BAD': bad}))
+        second = await _request(host, port, _post({'AMRT': sample_record}))
+        return first, second
+    
+    (status, body), (next_status, _) = _with_service(scenario)
+    assert status == 400
+    assert 'historical_data' in body['error']
+    assert next_status == 200
+
+
+def test_worker_survives_scoring_failure(sample_record):
+    async def scenario(service, host, port):
+        score = service.batcher._score
+        
+        def failing(batch):
+            service.batcher._score = score
+            raise RuntimeError('boom')
+        service.batcher._score = failing
+        
+        first = await _request(host, port, _post({'AMRT': sample_record}))
+        second = await _request(host, port, _post({'AMRT': sample_record}))
+        return first[0], second[0]
+    
+    assert _with_service(scenario) == (500, 200)
+
+
+def test_result_does_not_depend_on_batch_neighbours(sample_record):
+    bare = copy.deepcopy(sample_record)
+    del bare['company_info']
+    
+    async def scenario(service, host, port):
+        alone = await service.score({'AMRT': sample_record})
+        together = await asyncio.gather(
+            service.score({'AMRT': sample_record}), service.score({'BARE': bare})
+        )
+        return alone['AMRT'], together[0]['AMRT'], together[1]['BARE']
+    
+    alone, batched, bare_row = _with_service(scenario, max_wait=0.05)
+    assert batched == alone
+    assert batched['company_name'] == 'PT Sumber Alfaria Trijaya Tbk'
+    assert 'company_name' not in bare_row
+
+
+def test_malformed_http_gets_error_response():
+    async def scenario(service, host, port):
+        service.MAX_BODY = 100
+        return [
+            (await _request(host, port, b'GARBAGE\r\n\r\n'))[0],
+            (await _request(host, port, b'POST /score HTTP/1.1\r\n'
+                                        b'Content-Length: abc\r\n\r\n'))[0],
+            (await _request(host, port, b'POST /score HTTP/1.1\r\n'
+                                        b'Content-Length: 1000\r\n\r\n'))[0],
+            (await _request(host, port, b'GET /health HTTP/1.1\r\n'
+                                        b'Connection: close\r\n\r\n'))[0]
+        ]
+    
+    assert _with_service(scenario) == [400, 400, 413, 200]
+
+
+def test_oversized_headers_get_431():
+    async def scenario(service, host, port):
+        service.MAX_HEADERS = 5
+        long_header = b'X-Long: ' + b'a' * 100_000 + b'\r\n'
+        many_headers = b''.join(b'X-%d: 1\r\n' % i for i in range(6))
+        return [
+            (await _request(host, port, b'GET /health HTTP/1.1\r\n' + long_header + b'\r\n'))[0],
+            (await _request(host, port, b'GET /health HTTP/1.1\r\n' + many_headers + b'\r\n'))[0],
+            (await _request(host, port, b'GET /' + b'a' * 100_000 + b' HTTP/1.1\r\n\r\n'))[0],
+            (await _request(host, port, b'GET /health HTTP/1.1\r\n' + many_headers[:-16]
+                            + b'Connection: close\r\n\r\n'))[0]
+        ]
+    
+    assert _with_service(scenario) == [431, 431, 400, 200]
+
+
+def test_non_finite_values_are_sent_as_null(sample_record):
+    record = copy.deepcopy(sample_record)
+    record['valuation_data']['current_price'] = float('nan')
+    
+    def strict(constant):
+        raise ValueError(f'Non-standard JSON constant {constant}')
+    
+    async def scenario(service, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(_post({'AMRT': record}))
+            await writer.drain()
+            response = await reader.read()
+        finally:
+            writer.close()
+        return response.partition(b'\r\n\r\n')[2]
+    
+    body = json.loads(_with_service(scenario), parse_constant=strict)
+    assert body['AMRT']['upside'] is None
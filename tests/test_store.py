@@ -0,0 +1,58 @@
+import copy
+import datetime
+import json
+
+import numpy as np
+
+from src.panel import FinancialPanel
+from src.pipeline import QuadrantPipeline
+from src.sector import SectorNormalizer
+from src.store import ResultStore, inputs_hashes
+
+
+def test_inputs_hash_covers_company_info(sample_record):
+    changed = copy.deepcopy(sample_record)
+    changed['company_info']['current_price'] += 100
+    renamed = copy.deepcopy(sample_record)
+    renamed['company_info']['sector'] = 'Other'
+    
+    hashes = [inputs_hashes(FinancialPanel.from_records(['AMRT'], [record]))[0]
+              for record in (sample_record, changed, renamed, copy.deepcopy(sample_record))]
+    assert len(set(hashes[:3])) == 3
+    assert hashes[3] == hashes[0]
+
+
+def test_save_and_query_roundtrip(universe):
+    panel = FinancialPanel.from_universe(universe)
+    pipeline = QuadrantPipeline()
+    results = pipeline.score(panel)
+    run_at = datetime.datetime(2025, 5, 2, 14, 30)
+    
+    with ResultStore(':memory:') as store:
+        store.save_run(results, pipeline, panel=panel, run_at=run_at)
+        
+        for run_date in (run_at, run_at.date(), '2025-05-02'):
+            stored = store.query(run_date=run_date)
+            assert len(stored['ticker']) == len(panel)
+        np.testing.assert_array_equal(stored['ticker'], np.sort(results['ticker']))
+        
+        order = np.argsort(results['ticker'])
+        np.testing.assert_array_equal(stored['quadrant'], results['quadrant'][order])
+        np.testing.assert_array_equal(stored['company_score'], results['company_score'][order])
+        assert stored['inputs_hash'].tolist() == np.array(inputs_hashes(panel))[order].tolist()
+        
+        stars = store.query(run_date=run_at, quadrant='STAR')
+        assert len(stars['ticker']) == int((results['quadrant'] == 0).sum())
+
+
+def test_config_records_sector_relative_mode(universe):
+    panel = FinancialPanel.from_universe(universe)
+    with ResultStore(':memory:') as store:
+        for normalizer in (None, SectorNormalizer('percentile'), SectorNormalizer('zscore')):
+            pipeline = QuadrantPipeline(sector_normalizer=normalizer)
+            store.save_run(pipeline.score(panel), pipeline)
+        runs = store.runs()
+    
+    modes = [json.loads(run['config'])['sector_relative'] for run in runs]
+    assert modes == [None, 'percentile', 'zscore']
+    assert len({run['weights_version'] for run in runs}) == 3
@@ -0,0 +1,71 @@
+import numpy as np
+
+from src.calculator import QuadrantCalculator
+from src.panel import FinancialPanel
+from src.streaming import TickRevaluator, parse_ticks
+
+
+def test_valuation_score_at_matches_scalar(universe):
+    panel = FinancialPanel.from_universe(universe)
+    revaluator = TickRevaluator(panel)
+    calculator = QuadrantCalculator()
+    valuation = panel.section('valuation_data')
+    
+    for i in range(0, len(panel), 7):
+        model_tp = valuation['model_tp'][i].item()
+        relative_val = valuation['relative_val'][i].item()
+        blended = revaluator._blended[i]
+        # Exact breakpoint prices plus ordinary ones around them
+        prices = [blended / (1 + bound) for bound in (0.3, 0.15, 0.0)]
+        prices += [price * factor for price in prices for factor in (0.999, 1.001)]
+        for price in prices:
+            expected = calculator.calculate_valuation_score(model_tp, relative_val, price)['score']
+            assert revaluator.valuation_score_at(i, price) == expected
+
+
+def test_ticks_update_state_and_latency_window_is_bounded(universe):
+    panel = FinancialPanel.from_universe(universe)
+    revaluator = TickRevaluator(panel, latency_window=50)
+    rng = np.random.default_rng(1)
+    
+    tickers = panel.tickers.tolist()
+    prices = panel.section('valuation_data')['current_price']
+    lines = ['timestamp,ticker,price'] + [
+        f'{t},{tickers[i]},{prices[i] * rng.uniform(0.5, 1.5):.2f}'
+        for t, i in enumerate(rng.integers(0, len(tickers), 500))
+    ] + ['9999,UNKNOWN,100']
+    revaluator.run(lines)
+    
+    stats = revaluator.latency_stats()
+    assert stats['ticks'] == 501 and stats['rejected'] == 1
+    assert len(revaluator.latencies) == 50
+    
+    # Final per-ticker state equals a fresh revaluator at the last prices
+    last = {}
+    for _, ticker, price in parse_ticks(lines[1:-1]):
+        last[ticker] = price
+    fresh = TickRevaluator(panel)
+    for ticker, price in last.items():
+        fresh.on_tick(0, ticker, price)
+    assert fresh.valuation_score == revaluator.valuation_score
+
+
+def test_malformed_lines_are_rejected_not_fatal(universe):
+    panel = FinancialPanel.from_universe(universe)
+    tickers = panel.tickers.tolist()
+    prices = panel.section('valuation_data')['current_price'].tolist()
+    good = [f'{t},{tickers[t]},{prices[t] * 0.5:.2f}' for t in range(20)]
+    garbage = ['1,T00001', '2,T00002,abc', '3,T00003,1,2', '4,T00004,inf', '5,T000']
+    
+    revaluator = TickRevaluator(panel)
+    events = revaluator.run(good[:10] + garbage + good[10:])
+    stats = revaluator.latency_stats()
+    assert stats['ticks'] == 25 and stats['rejected'] == len(garbage)
+    
+    clean = TickRevaluator(panel)
+    assert clean.run(good) == events
+    assert clean.valuation_score == revaluator.valuation_score
+    
+    bad = []
+    assert len(list(parse_ticks(good + garbage, bad.append))) == len(good)
+    assert bad == garbage
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('plotly')
+
+from src.cache import CachedVisualizer, ScoreCache  # noqa: E402
+from src.visualizer import QUADRANT_NAMES, QuadrantVisualizer  # noqa: E402
+
+
+def _stocks(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        'ticker': [f'T{i:05d}' for i in range(n)],
+        'cs': rng.uniform(1, 4, n),
+        'ss': rng.uniform(1, 4, n),
+        'quadrant': rng.integers(0, 4, n).astype(np.int8)
+    }
+
+
+@pytest.mark.parametrize('n, traces, kind', [
+    (10, 10, 'scatter'),     # one trace per stock up to webgl_threshold
+    (11, 1, 'scattergl'),
+    (50, 1, 'scattergl'),    # up to density_threshold
+    (51, 1, 'heatmap')
+])
+def test_auto_render_mode(n, traces, kind):
+    visualizer = QuadrantVisualizer(webgl_threshold=10, density_threshold=50)
+    fig = visualizer.create_quadrant_matrix(_stocks(n))
+    assert len(fig.data) == traces
+    assert {trace.type for trace in fig.data} == {kind}
+
+
+@pytest.mark.parametrize('mode, kind', [
+    ('scatter', 'scatter'), ('webgl', 'scattergl'), ('density', 'heatmap')
+])
+def test_explicit_render_mode(mode, kind):
+    stocks = _stocks(30, seed=1)
+    fig = QuadrantVisualizer().create_quadrant_matrix(stocks, render_mode=mode)
+    assert {trace.type for trace in fig.data} == {kind}
+    if mode == 'webgl':
+        np.testing.assert_array_equal(fig.data[0].x, stocks['cs'])
+    if mode == 'density':
+        assert np.nansum(np.asarray(fig.data[0].z, dtype=float)) == 30
+    
+    with pytest.raises(ValueError):
+        QuadrantVisualizer().create_quadrant_matrix(stocks, render_mode='svg')
+
+
+def test_scatter_accepts_records_and_columns():
+    stocks = _stocks(5, seed=2)
+    records = [
+        {'ticker': ticker, 'cs': cs, 'ss': ss, 'quadrant': QUADRANT_NAMES[code]}
+        for ticker, cs, ss, code in zip(stocks['ticker'], stocks['cs'].tolist(),
+                                        stocks['ss'].tolist(), stocks['quadrant'].tolist())
+    ]
+    visualizer = QuadrantVisualizer()
+    from_columns = visualizer.create_quadrant_matrix(stocks, render_mode='scatter')
+    from_records = visualizer.create_quadrant_matrix(records, render_mode='scatter')
+    assert from_columns.to_json() == from_records.to_json()
+
+
+def test_matrix_template_cached_per_threshold():
+    visualizer = QuadrantVisualizer()
+    template = visualizer.matrix_template(3.0)
+    assert visualizer.matrix_template(3.0) is template
+    assert visualizer.matrix_template(2.5) != template
+    assert set(visualizer._templates) == {3.0, 2.5}
+    
+    # Figures cloned from the template never leak back into it
+    fig = visualizer.create_quadrant_matrix(_stocks(3), threshold=3.0)
+    fig.add_annotation(x=2, y=2, text='extra')
+    assert visualizer.matrix_template(3.0) == template
+    assert len(visualizer.figure_from_json(template).data) == 0
+
+
+def test_cached_visualizer_roundtrip():
+    visualizer = QuadrantVisualizer()
+    cached = CachedVisualizer(QuadrantVisualizer(), ScoreCache(maxsize=8))
+    stocks = [
+        {'ticker': 'AAA', 'cs': 3.5, 'ss': 3.2, 'quadrant': 'STAR'},
+        {'ticker': 'BBB', 'cs': 2.1, 'ss': 3.4, 'quadrant': 'GROWTH'}
+    ]
+    
+    expected = visualizer.create_quadrant_matrix(stocks).to_json()
+    first = cached.create_quadrant_matrix(stocks)
+    second = cached.create_quadrant_matrix(stocks)
+    assert first.to_json() == second.to_json() == expected
+    assert first is not second
+    assert cached.cache.stats()['hits'] == 1
+    
+    # Figures handed out are independent of the cached JSON
+    first.data[0].name = 'changed'
+    assert cached.create_quadrant_matrix(stocks).to_json() == expected
+    
+    # Render settings are part of the key
+    cached.target.colors = dict(cached.target.colors, STAR='#000000')
+    assert cached.create_quadrant_matrix(stocks).data[0].marker.color == '#000000'